@@ -1,8 +1,9 @@
 """Submodule for NeuroKit."""
 
-from .benchmark_ecg import benchmark_ecg_preprocessing
+from .benchmark_ecg import benchmark_ecg_findpeaks, benchmark_ecg_preprocessing
 
 
 __all__ = [
     "benchmark_ecg_preprocessing",
+    "benchmark_ecg_findpeaks",
 ]
@@ -4,6 +4,7 @@ import datetime
 import numpy as np
 import pandas as pd
 
+from ..ecg.ecg_findpeaks import ecg_findpeaks
 from ..signal import signal_period
 
 
@@ -68,6 +69,81 @@ def benchmark_ecg_preprocessing(function, ecg, rpeaks=None, sampling_rate=1000):
     return results
 
 
+def benchmark_ecg_findpeaks(ecg, sampling_rate=1000, methods=None, n_runs=3):
+    """Benchmark the speed of the R-peak detection methods.
+
+    Runs ``ecg_findpeaks()`` with each method on the same signal and reports its throughput, which
+    can be used to choose a detector based on its speed.
+
+    Parameters
+    ----------
+    ecg : Union[list, np.array, pd.Series]
+        The cleaned ECG channel as returned by `ecg_clean()`.
+    sampling_rate : int
+        The sampling frequency of `ecg` (in Hz, i.e., samples/second).
+    methods : list
+        The methods to benchmark (see ``ecg_findpeaks()``). If None, all the methods that do not
+        require additional dependencies are benchmarked.
+    n_runs : int
+        The number of runs over which the duration is averaged.
+
+    Returns
+    --------
+    pd.DataFrame
+        A DataFrame containing, for each method, the average duration of a run (in seconds), the
+        length of the recording (in minutes), the throughput (in samples per second), i.e., the
+        number of samples processed per second, and the number of detected R-peaks.
+
+    See Also
+    --------
+    ecg_findpeaks, benchmark_ecg_preprocessing
+
+    Examples
+    --------
+    >>> import neurokit2 as nk
+    >>>
+    >>> ecg = nk.ecg_clean(nk.ecg_simulate(duration=20, sampling_rate=250), sampling_rate=250)
+    >>> results = nk.benchmark_ecg_findpeaks(ecg, sampling_rate=250, methods=["neurokit", "hamilton2002"])
+    >>> results["Method"].tolist()
+    ['neurokit', 'hamilton2002']
+
+    """
+    if methods is None:
+        methods = [
+            "neurokit",
+            "pantompkins1985",
+            "nabian2018",
+            "hamilton2002",
+            "christov2004",
+            "gamboa2008",
+            "elgendi2010",
+            "engzeemod2012",
+            "rodrigues2021",
+        ]
+
+    ecg = np.asarray(ecg)
+    results = []
+    for method in methods:
+        t0 = datetime.datetime.now()
+        for _ in range(n_runs):
+            rpeaks = ecg_findpeaks(ecg, sampling_rate=sampling_rate, method=method)["ECG_R_Peaks"]
+        duration = (datetime.datetime.now() - t0).total_seconds() / n_runs
+
+        results.append(
+            pd.DataFrame(
+                {
+                    "Method": [method],
+                    "Duration": [duration],
+                    "Recording_Length": [len(ecg) / sampling_rate / 60],
+                    "Throughput": [len(ecg) / duration if duration > 0 else np.nan],
+                    "N_Peaks": [len(rpeaks)],
+                }
+            )
+        )
+
+    return pd.concat(results).reset_index(drop=True)
+
+
 # =============================================================================
 # Utils
 # =============================================================================
@@ -2,6 +2,7 @@
 
 from .bio_analyze import bio_analyze
 from .bio_process import bio_process
+from .bio_process_batch import bio_process_batch
 
 
-__all__ = ["bio_process", "bio_analyze"]
+__all__ = ["bio_process", "bio_process_batch", "bio_analyze"]
@@ -96,76 +96,59 @@ def bio_process(ecg=None, rsp=None, eda=None, emg=None, eog=None, keep=None, sam
     >>> fig2 #doctest: +SKIP
 
     """
+    # Error check if first argument is a Dataframe.
+    if isinstance(ecg, pd.DataFrame):
+        channels, keep = _bio_process_channels(ecg)
+    else:
+        channels = {"ECG": ecg, "RSP": rsp, "EDA": eda, "EMG": emg, "EOG": eog}
+
+    processed = {}
+    for modality, signal in channels.items():
+        if signal is not None:
+            signal = as_vector(signal)
+            processed[modality] = _bio_process_functions[modality](signal, sampling_rate=sampling_rate)
+
+    return _bio_process_assemble(processed, keep=keep, sampling_rate=sampling_rate)
+
+
+# =============================================================================
+# Internals
+# =============================================================================
+_bio_process_functions = {
+    "ECG": ecg_process,
+    "RSP": rsp_process,
+    "EDA": eda_process,
+    "EMG": emg_process,
+    "EOG": eog_process,
+}
+
+
+def _bio_process_channels(data):
+    """Split a DataFrame (or a dict) of channels into the bio signals and the channels to keep."""
+    channels = {modality: None for modality in _bio_process_functions}
+    for key in data.keys():
+        if key in channels:
+            channels[key] = data[key]
+    if channels["ECG"] is None and "EKG" in data.keys():
+        channels["ECG"] = data["EKG"]
+
+    keep_keys = [key for key in data.keys() if key not in ["ECG", "EKG", "RSP", "EDA", "EMG", "EOG"]]
+    if len(keep_keys) != 0:
+        keep = pd.DataFrame({key: as_vector(data[key]) for key in keep_keys})
+    else:
+        keep = None
+    return channels, keep
+
+
+def _bio_process_assemble(processed, keep=None, sampling_rate=1000):
+    """Concatenate the outputs of the ``*_process()`` functions (a dict of (signals, info) tuples)."""
     bio_info = {}
     bio_df = pd.DataFrame({})
-
-    # Error check if first argument is a Dataframe.
-    if ecg is not None:
-        if isinstance(ecg, pd.DataFrame):
-            data = ecg.copy()
-            if "RSP" in data.keys():
-                rsp = data["RSP"]
-            else:
-                rsp = None
-            if "EDA" in data.keys():
-                eda = data["EDA"]
-            else:
-                eda = None
-            if "EMG" in data.keys():
-                emg = data["EMG"]
-            else:
-                emg = None
-            if "ECG" in data.keys():
-                ecg = data["ECG"]
-            elif "EKG" in data.keys():
-                ecg = data["EKG"]
-            else:
-                ecg = None
-            if "EOG" in data.keys():
-                eog = data["EOG"]
-            else:
-                eog = None
-            cols = ["ECG", "EKG", "RSP", "EDA", "EMG", "EOG"]
-            keep_keys = [key for key in data.keys() if key not in cols]
-            if len(keep_keys) != 0:
-                keep = data[keep_keys]
-            else:
-                keep = None
-
-    # ECG
-    if ecg is not None:
-        ecg = as_vector(ecg)
-        ecg_signals, ecg_info = ecg_process(ecg, sampling_rate=sampling_rate)
-        bio_info.update(ecg_info)
-        bio_df = pd.concat([bio_df, ecg_signals], axis=1)
-
-    # RSP
-    if rsp is not None:
-        rsp = as_vector(rsp)
-        rsp_signals, rsp_info = rsp_process(rsp, sampling_rate=sampling_rate)
-        bio_info.update(rsp_info)
-        bio_df = pd.concat([bio_df, rsp_signals], axis=1)
-
-    # EDA
-    if eda is not None:
-        eda = as_vector(eda)
-        eda_signals, eda_info = eda_process(eda, sampling_rate=sampling_rate)
-        bio_info.update(eda_info)
-        bio_df = pd.concat([bio_df, eda_signals], axis=1)
-
-    # EMG
-    if emg is not None:
-        emg = as_vector(emg)
-        emg_signals, emg_info = emg_process(emg, sampling_rate=sampling_rate)
-        bio_info.update(emg_info)
-        bio_df = pd.concat([bio_df, emg_signals], axis=1)
-
-    # EOG
-    if eog is not None:
-        eog = as_vector(eog)
-        eog_signals, eog_info = eog_process(eog, sampling_rate=sampling_rate)
-        bio_info.update(eog_info)
-        bio_df = pd.concat([bio_df, eog_signals], axis=1)
+    for modality in _bio_process_functions:
+        if modality in processed:
+            signals, info = processed[modality]
+            bio_info.update(info)
+            bio_df = pd.concat([bio_df, signals], axis=1)
 
     # Additional channels to keep
     if keep is not None:
@@ -173,8 +156,10 @@ def bio_process(ecg=None, rsp=None, eda=None, emg=None, eog=None, keep=None, sam
         bio_df = pd.concat([bio_df, keep], axis=1)
 
     # RSA
-    if ecg is not None and rsp is not None:
-        rsa = hrv_rsa(ecg_signals, rsp_signals, rpeaks=None, sampling_rate=sampling_rate, continuous=True)
+    if "ECG" in processed and "RSP" in processed:
+        rsa = hrv_rsa(
+            processed["ECG"][0], processed["RSP"][0], rpeaks=None, sampling_rate=sampling_rate, continuous=True
+        )
         bio_df = pd.concat([bio_df, rsa], axis=1)
 
     return bio_df, bio_info
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+import os
+from warnings import warn
+
+import pandas as pd
+
+from ..data import read_acqknowledge, read_bitalino
+from ..misc import NeuroKitWarning, as_vector
+from ..misc.parallel import _parallel_imap
+from .bio_process import _bio_process_assemble, _bio_process_channels, _bio_process_functions
+
+
+def bio_process_batch(records, sampling_rate=1000, n_jobs=1):
+    """Automated processing of many recordings of bio signals.
+
+    Batch equivalent of ``bio_process()``, in which the processing of each modality of each recording
+    (i.e., the calls to ``ecg_process()``, ``rsp_process()``, ``eda_process()``, ``emg_process()`` and
+    ``eog_process()``) is scheduled over a pool of processes. The recordings are consumed
+    progressively (so that they can come from an iterator, e.g., over files), and a failure in one of
+    them does not abort the batch but is reported in the returned errors.
+
+    Parameters
+    ----------
+    records : Union[list, iterator]
+        The recordings, each being either a DataFrame (or a dict of arrays) whose columns are the
+        channels (named "ECG" (or "EKG"), "RSP", "EDA", "EMG" and "EOG", the other channels being kept,
+        as when a DataFrame is passed to ``bio_process()``), or a path to a file. Files with a ".acq"
+        extension are read with ``read_acqknowledge()``, files with a ".txt" extension with
+        ``read_bitalino()`` (the sampling rate being then retrieved from the file), and other files
+        with ``pd.read_csv()``.
+    sampling_rate : int
+        The sampling frequency of the signals (in Hz, i.e., samples/second). Defaults to 1000.
+    n_jobs : int
+        The number of processes. If 1 (default), the recordings are processed sequentially in the
+        current process. If -1, all CPUs are used.
+
+    Returns
+    ----------
+    results : list
+        For each recording, the ``(bio_df, bio_info)`` tuple returned by ``bio_process()``, or None if
+        the processing of the recording failed.
+    errors : dict
+        The exceptions raised during the processing of the failed recordings, indexed by the position
+        of the recordings.
+
+    See Also
+    ----------
+    bio_process
+
+    Example
+    ----------
+    >>> import neurokit2 as nk
+    >>>
+    >>> records = []
+    >>> for i in range(3):
+    ...     records.append({"ECG": nk.ecg_simulate(duration=30, sampling_rate=250, random_state=i),
+    ...                     "RSP": nk.rsp_simulate(duration=30, sampling_rate=250, random_state=i)})
+    >>> records.append({"ECG": [0, 0, 0]})  # Invalid recording
+    >>>
+    >>> results, errors = nk.bio_process_batch(records, sampling_rate=250, n_jobs=2)
+    >>> bio_df, bio_info = results[0]
+    >>> list(errors.keys())
+    [3]
+
+    """
+    states = []
+    tasks = _bio_process_batch_tasks(records, states, sampling_rate=sampling_rate)
+
+    results = []
+    errors = {}
+    for index, modality, output in _parallel_imap(_bio_process_batch_worker, tasks, n_jobs=n_jobs):
+        state = states[index]
+        if modality is not None:
+            if isinstance(output, Exception):
+                state["error"] = output
+            else:
+                state["processed"][modality] = output
+        state["remaining"] -= 1
+        if state["remaining"] > 0:
+            continue
+
+        # The tasks being processed in order, the recordings are completed in order
+        if state["error"] is None:
+            try:
+                results.append(
+                    _bio_process_assemble(
+                        state["processed"], keep=state["keep"], sampling_rate=state["sampling_rate"]
+                    )
+                )
+            except Exception as error:  # pylint: disable=W0703
+                state["error"] = error
+        if state["error"] is not None:
+            results.append(None)
+            errors[index] = state["error"]
+        states[index] = None  # Release the recording
+
+    if len(errors) > 0:
+        warn(
+            f"The processing of {len(errors)} out of {len(results)} recordings failed"
+            f" (see the returned errors for details).",
+            category=NeuroKitWarning,
+        )
+
+    return results, errors
+
+
+# =============================================================================
+# Internals
+# =============================================================================
+def _bio_process_batch_read(record, sampling_rate=1000):
+    """Read a recording (a DataFrame, a dict of arrays, or a path to a file)."""
+    if isinstance(record, (str, os.PathLike)):
+        extension = os.path.splitext(record)[1].lower()
+        if extension == ".acq":
+            record, sampling_rate = read_acqknowledge(record)
+        elif extension == ".txt":
+            record, sampling_rate = read_bitalino(record)
+        else:
+            record = pd.read_csv(record)
+    elif not isinstance(record, (pd.DataFrame, dict)):
+        raise ValueError(
+            "NeuroKit error: bio_process_batch(): each recording must be a DataFrame, a dict of arrays,"
+            " or a path to a file."
+        )
+    channels, keep = _bio_process_channels(record)
+    return channels, keep, sampling_rate
+
+
+def _bio_process_batch_tasks(records, states, sampling_rate=1000):
+    """Generate the tasks (one per modality) of each recording, while storing the state of the latter."""
+    for index, record in enumerate(records):
+        state = {"processed": {}, "keep": None, "sampling_rate": sampling_rate, "error": None}
+        states.append(state)
+
+        try:
+            channels, state["keep"], state["sampling_rate"] = _bio_process_batch_read(record, sampling_rate)
+            channels = {key: as_vector(val) for key, val in channels.items() if val is not None}
+        except Exception as error:  # pylint: disable=W0703
+            state["error"] = error
+            channels = {}
+
+        state["remaining"] = len(channels)
+        if len(channels) == 0:
+            # Empty task, so that the recording gets completed
+            state["remaining"] = 1
+            yield index, None, None, state["sampling_rate"]
+        for modality, signal in channels.items():
+            yield index, modality, signal, state["sampling_rate"]
+
+
+def _bio_process_batch_worker(task):
+    """Process one modality of one recording (in a separate process)."""
+    index, modality, signal, sampling_rate = task
+    if modality is None:
+        return index, None, None
+
+    try:
+        signals, info = _bio_process_functions[modality](signal, sampling_rate=sampling_rate)
+    except Exception as error:  # pylint: disable=W0703
+        return index, modality, error
+    return index, modality, (signals, info)
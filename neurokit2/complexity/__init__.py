@@ -9,7 +9,7 @@ from .complexity_embedding import complexity_embedding
 from .complexity_optimize import complexity_optimize
 from .complexity_r import complexity_r
 from .complexity_simulate import complexity_simulate
-from .transition_matrix import transition_matrix, transition_matrix_simulate
+from .transition_matrix import transition_matrix, transition_matrix_batch, transition_matrix_simulate
 
 # Entropy
 from .entropy_shannon import entropy_shannon
@@ -81,5 +81,6 @@ __all__ = [
     "complexity_d2",
     "complexity_plot",
     "transition_matrix",
+    "transition_matrix_batch",
     "transition_matrix_simulate"
 ]
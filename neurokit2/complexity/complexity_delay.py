@@ -3,13 +3,9 @@ import matplotlib
 import matplotlib.collections
 import matplotlib.pyplot as plt
 import numpy as np
-import scipy.signal
-import scipy.spatial
-import scipy.stats
 
 from ..misc import find_closest
 from ..signal import signal_autocor, signal_findpeaks, signal_zerocrossings
-from ..stats import mutual_information
 from .complexity_embedding import complexity_embedding
 
 
@@ -149,25 +145,71 @@ def _embedding_delay_metric(signal, tau_sequence, metric="Mutual Information"):
         values = signal_autocor(signal)
         values = values[: len(tau_sequence)]  # upper limit
 
+    elif metric == "Mutual Information":
+        values = _embedding_delay_mutual_information(signal, tau_sequence)
+
+    elif metric == "Displacement":
+        # Distance between the points (x[i], x[i + tau]) and their reconstruction with zero time delay
+        # (x[i], x[i]), i.e., |x[i + tau] - x[i]|
+        signal = np.asarray(signal, dtype=float)
+        values = np.array([np.mean(np.abs(signal[tau:] - signal[: len(signal) - tau])) for tau in tau_sequence])
+
     else:
         values = np.zeros(len(tau_sequence))
 
-        # Loop through taus and compute all scores values
-        for i, current_tau in enumerate(tau_sequence):
-            embedded = complexity_embedding(signal, delay=current_tau, dimension=2)
-            if metric == "Mutual Information":
-                values[i] = mutual_information(embedded[:, 0], embedded[:, 1], normalized=True, method="shannon")
-            if metric == "Displacement":
-                dimension = 2
+    return values
+
+
+def _embedding_delay_mutual_information(signal, tau_sequence, bins=256):
+    """Mutual information between the signal and its delayed version, for all delays.
 
-                # Reconstruct with zero time delay.
-                tau0 = embedded[:, 0].repeat(dimension).reshape(len(embedded), dimension)
-                dist = np.asarray([scipy.spatial.distance.euclidean(i, j) for i, j in zip(embedded, tau0)])
-                values[i] = np.mean(dist)
+    Same as ``mutual_information(signal[:-tau], signal[tau:], method="shannon")``, but the signal is binned only
+    once per distinct range of its non-delayed and delayed parts (which only change when the extrema are among
+    the first or last samples), and the joint histogram of each delay is a single count of the pairs of bins.
+
+    """
+    signal = np.asarray(signal, dtype=float)
+    n = len(signal)
+
+    # Range of the non-delayed (signal[:n - tau]) and delayed (signal[tau:]) parts for all delays
+    head_min, head_max = np.minimum.accumulate(signal), np.maximum.accumulate(signal)
+    tail_min = np.minimum.accumulate(signal[::-1])[::-1]
+    tail_max = np.maximum.accumulate(signal[::-1])[::-1]
+
+    digitized = {}
+    values = np.zeros(len(tau_sequence))
+    for i, tau in enumerate(tau_sequence):
+        ranges = [(head_min[n - tau - 1], head_max[n - tau - 1]), (tail_min[tau], tail_max[tau])]
+        for key in ranges:
+            if key not in digitized:
+                digitized[key] = _embedding_delay_digitize(signal, key[0], key[1], bins=bins)
+        x = digitized[ranges[0]][: n - tau]
+        y = digitized[ranges[1]][tau:]
+
+        p_xy = np.bincount(x * bins + y, minlength=bins * bins).reshape(bins, bins)
+        h_xy, h_x, h_y = [_embedding_delay_entropy(p) for p in [p_xy, p_xy.sum(axis=1), p_xy.sum(axis=0)]]
+        values[i] = h_xy - h_x - h_y
 
     return values
 
 
+def _embedding_delay_digitize(signal, lower, upper, bins=256):
+    """Index of the histogram bin (of equal width between lower and upper) of each sample, as in np.histogram()."""
+    if lower == upper:
+        lower, upper = lower - 0.5, upper + 0.5
+    edges = np.linspace(lower, upper, bins + 1)
+    digitized = np.searchsorted(edges, signal, side="right") - 1
+    # The last bin includes its right edge
+    digitized[signal == edges[-1]] = bins - 1
+    return np.clip(digitized, 0, bins - 1)
+
+
+def _embedding_delay_entropy(counts):
+    """Shannon entropy (in bits, with a negative sign) from the counts of a histogram."""
+    p = counts[counts > 0] / np.sum(counts)
+    return np.sum(p * np.log2(p))
+
+
 # =============================================================================
 # Internals
 # =============================================================================
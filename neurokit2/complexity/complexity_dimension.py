@@ -111,31 +111,34 @@ def _embedding_dimension_afn(signal, dimension_seq, delay=1, **kwargs):
     cannot be a constant for all d; there must exist somed's such that E2(d) is not 1.
 
     """
+    # The embeddings of all dimensions are views of the same matrix of delayed signals
+    embedded = _embedding_dimension_lags(signal, np.max(dimension_seq) + 1, delay=delay)
     values = np.asarray(
-        [_embedding_dimension_afn_d(signal, dimension, delay, **kwargs) for dimension in dimension_seq]
+        [
+            _embedding_dimension_afn_d(signal, dimension, delay, embedded=embedded, **kwargs)
+            for dimension in dimension_seq
+        ]
     ).T
     E, Es = values[0, :], values[1, :]
 
     return E, Es
 
 
-def _embedding_dimension_afn_d(signal, dimension, delay=1, metric="chebyshev", window=10, maxnum=None, **kwargs):
+def _embedding_dimension_afn_d(
+    signal, dimension, delay=1, metric="chebyshev", window=10, maxnum=None, embedded=None, **kwargs
+):
     """Return E(d) and E^*(d) for a single d.
 
     Returns E(d) and E^*(d) for the AFN method for a single d.
 
     """
-    # We need to reduce the number of points in dimension d by tau
-    # so that after reconstruction, there'll be equal number of points
-    # at both dimension d as well as dimension d + 1.
-    y1 = complexity_embedding(signal[:-delay], delay=delay, dimension=dimension)
-    y2 = complexity_embedding(signal, delay=delay, dimension=dimension + 1)
+    y1, y2 = _embedding_dimension_pair(signal, dimension, delay=delay, embedded=embedded)
 
     # Find near neighbors in dimension d.
     index, dist = _embedding_dimension_neighbors(y1, metric=metric, window=window, maxnum=maxnum)
 
     # Compute the near-neighbor distances in d + 1 dimension
-    d = np.asarray([scipy.spatial.distance.chebyshev(i, j) for i, j in zip(y2, y2[index])])
+    d = np.max(np.abs(y2 - y2[index]), axis=1)
     # Compute the ratio of near-neighbor distances in d + 1 over d dimension
     # Its average is E(d)
     E = np.mean(d / dist)
@@ -173,26 +176,29 @@ def _embedding_dimension_ffn(signal, dimension_seq, delay=1, **kwargs):
         or Test II.
 
     """
+    # The embeddings of all dimensions are views of the same matrix of delayed signals
+    embedded = _embedding_dimension_lags(signal, np.max(dimension_seq) + 1, delay=delay)
     values = np.asarray(
-        [_embedding_dimension_ffn_d(signal, dimension, delay, **kwargs) for dimension in dimension_seq]
+        [
+            _embedding_dimension_ffn_d(signal, dimension, delay, embedded=embedded, **kwargs)
+            for dimension in dimension_seq
+        ]
     ).T
     f1, f2, f3 = values[0, :], values[1, :], values[2, :]
 
     return f1, f2, f3
 
 
-def _embedding_dimension_ffn_d(signal, dimension, delay=1, R=10.0, A=2.0, metric="euclidean", window=10, maxnum=None):
+def _embedding_dimension_ffn_d(
+    signal, dimension, delay=1, R=10.0, A=2.0, metric="euclidean", window=10, maxnum=None, embedded=None
+):
     """Return fraction of false nearest neighbors for a single d."""
-    # We need to reduce the number of points in dimension d by tau
-    # so that after reconstruction, there'll be equal number of points
-    # at both dimension d as well as dimension d + 1.
-    y1 = complexity_embedding(signal[:-delay], delay=delay, dimension=dimension)
-    y2 = complexity_embedding(signal, delay=delay, dimension=dimension + 1)
+    y1, y2 = _embedding_dimension_pair(signal, dimension, delay=delay, embedded=embedded)
 
     # Find near neighbors in dimension d.
     index, dist = _embedding_dimension_neighbors(y1, metric=metric, window=window, maxnum=maxnum)
     # Compute the near-neighbor distances in d + 1 dimension
-    d = np.asarray([scipy.spatial.distance.chebyshev(i, j) for i, j in zip(y2, y2[index])])
+    d = np.max(np.abs(y2 - y2[index]), axis=1)
 
     # Find all potential false neighbors using Kennel et al.'s tests.
     f1 = np.abs(y2[:, -1] - y2[index, -1]) / dist > R
@@ -231,6 +237,33 @@ def _embedding_dimension_plot(
     return fig
 
 
+def _embedding_dimension_lags(signal, dimension, delay=1):
+    """Matrix of the delayed signals, with signal[i + j * delay] in row i and column j (NaN beyond the end of the
+    signal), of which the embeddings in all lower dimensions are views."""
+    signal = np.asarray(signal, dtype=float)
+    lags = np.full((len(signal), dimension), np.nan)
+    for j in range(dimension):
+        lags[: max(len(signal) - j * delay, 0), j] = signal[j * delay :]
+    return lags
+
+
+def _embedding_dimension_pair(signal, dimension, delay=1, embedded=None):
+    """Embeddings in dimension d and d + 1 with the same number of points."""
+    # We need to reduce the number of points in dimension d by tau
+    # so that after reconstruction, there'll be equal number of points
+    # at both dimension d as well as dimension d + 1.
+    if embedded is None:
+        embedded = _embedding_dimension_lags(signal, dimension + 1, delay=delay)
+    n = len(signal) - dimension * delay
+    if n <= 0:
+        raise ValueError(
+            "NeuroKit error: complexity_dimension(): dimension * delay should be lower than",
+            " the length of the signal.",
+        )
+    y2 = embedded[:n, : dimension + 1]
+    return y2[:, :-1], y2
+
+
 def _embedding_dimension_neighbors(
     signal, dimension_max=20, delay=1, metric="chebyshev", window=0, maxnum=None, show=False
 ):
@@ -298,26 +331,20 @@ def _embedding_dimension_neighbors(
     if maxnum >= n:
         raise ValueError("maxnum is bigger than array length.")
 
-    dists = np.empty(n)
-    indices = np.empty(n, dtype=int)
-
-    for i, x in enumerate(y):
-        for k in range(2, maxnum + 2):
-            # querry for k number of nearest neighbours
-            dist, index = tree.query(x, k=k, p=p)
-            # remove points that are closer than min temporal separation
-            # remove self reference (d > 0)
-            valid = (np.abs(index - i) > window) & (dist > 0)
-
-            if np.count_nonzero(valid):
-                dists[i] = dist[valid][0]
-                indices[i] = index[valid][0]
-                break
-
-            if k == (maxnum + 1):
-                raise Exception(
-                    "Could not find any near neighbor with a nonzero distance." "Try increasing the value of maxnum."
-                )
+    # query for the maxnum + 1 nearest neighbours of all points at once
+    dists, indices = tree.query(y, k=maxnum + 1, p=p)
+    # remove points that are closer than min temporal separation
+    # remove self reference (d > 0)
+    valid = (np.abs(indices - np.arange(n)[:, np.newaxis]) > window) & (dists > 0)
+    if not np.all(np.any(valid, axis=1)):
+        raise Exception(
+            "Could not find any near neighbor with a nonzero distance." "Try increasing the value of maxnum."
+        )
+
+    # Keep the nearest valid neighbour
+    nearest = np.argmax(valid, axis=1)
+    dists = dists[np.arange(n), nearest]
+    indices = indices[np.arange(n), nearest]
 
     indices, values = np.squeeze(indices), np.squeeze(dists)
 
@@ -1,10 +1,12 @@
+import functools
+
 import matplotlib
 import matplotlib.collections
 import matplotlib.pyplot as plt
 import numpy as np
-import pandas as pd
 import scipy.spatial
 
+from ..misc.parallel import _parallel_map
 from .complexity_delay import _embedding_delay_metric, _embedding_delay_plot, _embedding_delay_select
 from .complexity_dimension import _embedding_dimension_afn, _embedding_dimension_ffn, _embedding_dimension_plot
 from .complexity_embedding import complexity_embedding
@@ -280,7 +282,7 @@ def _complexity_r(signal, delay=None, dimension=None):
 # =============================================================================
 
 
-def _complexity_optimize_differential(signal, delay_max=100, dimension_max=20, surrogate_iter=5):
+def _complexity_optimize_differential(signal, delay_max=100, dimension_max=20, surrogate_iter=5, n_jobs=1):
     """Estimate optimal Dimension (m) and optimal Time Delay (tau) using Differential Entropy b method.
 
     Parameters
@@ -292,7 +294,12 @@ def _complexity_optimize_differential(signal, delay_max=100, dimension_max=20, s
     dimension_max : int
         The maximum embedding dimension (often denoted 'm' or 'd', sometimes referred to as 'order') to test.
     surrogate_iter : int
-        The maximum surrogates generated using the iAAFT method.
+        The maximum surrogates generated using the iAAFT method. The same surrogates are used for all the
+        combinations of dimension and delay.
+    n_jobs : int
+        The number of processes over which the combinations of dimension and delay are evaluated. If 1
+        (default), they are evaluated sequentially. If negative, uses the number of CPUs plus one plus this
+        value (i.e., -1 uses all CPUs).
 
     Returns
     -------
@@ -322,33 +329,25 @@ def _complexity_optimize_differential(signal, delay_max=100, dimension_max=20, s
 
     N = len(signal)
 
-    surrogate_list = []
-    optimal = {}
-
-    for dimension in dimension_seq:
-        optimal[dimension] = []
-        # Calculate differential entropy for each embedded
-        for tau in tau_sequence:
-            signal_embedded = complexity_embedding(signal, delay=tau, dimension=dimension)
-            signal_entropy = _complexity_optimize_get_differential(signal_embedded, k=1)
+    # Generate the surrogates only once
+    surrogates = [_complexity_optimize_iaaft(signal)[0] for i in range(surrogate_iter)]
 
-            # calculate average of surrogates entropy
-            for i in range(surrogate_iter):  # pylint: disable=W0612
-                surrogate, _, __ = _complexity_optimize_iaaft(signal)
-                surrogate_embedded = complexity_embedding(surrogate, delay=tau, dimension=dimension)
-                surrogate_entropy = _complexity_optimize_get_differential(surrogate_embedded, k=1)
-                surrogate_list.append(surrogate_entropy)
-                surrogate_entropy_average = sum(surrogate_list) / len(surrogate_list)
+    # Calculate differential entropy for each embedded signal and its surrogates
+    grid = [(dimension, tau) for dimension in dimension_seq for tau in tau_sequence]
+    entropies = _parallel_map(
+        functools.partial(_complexity_optimize_differential_entropies, signal=signal, surrogates=surrogates),
+        grid,
+        n_jobs=n_jobs,
+    )
+    signal_entropy, surrogate_entropy_average = np.array(entropies).T.reshape(2, len(dimension_seq), -1)
 
-            # entropy ratio for each set of d and tau
-            entropy_ratio = signal_entropy / surrogate_entropy_average + (dimension * np.log(N)) / N
-            optimal[dimension].append(entropy_ratio)
+    # entropy ratio for each set of d and tau
+    entropy_ratio = signal_entropy / surrogate_entropy_average + (dimension_seq[:, np.newaxis] * np.log(N)) / N
 
     # optimal dimension and tau is where entropy_ratio is minimum
-    optimal_df = pd.DataFrame.from_dict(optimal)
-    optimal_delay, optimal_dimension = np.unravel_index(np.nanargmin(optimal_df.values), optimal_df.shape)
-
-    optimal_delay = optimal_delay + 1  # accounts for zero indexing
+    optimal_dimension, optimal_delay = np.unravel_index(np.nanargmin(entropy_ratio), entropy_ratio.shape)
+    optimal_dimension = dimension_seq[optimal_dimension]
+    optimal_delay = tau_sequence[optimal_delay]
 
     return optimal_dimension, optimal_delay
 
@@ -358,6 +357,21 @@ def _complexity_optimize_differential(signal, delay_max=100, dimension_max=20, s
 # =============================================================================
 
 
+def _complexity_optimize_differential_entropies(params, signal=None, surrogates=None):
+    """Differential entropy of the signal and average differential entropy of its surrogates for one
+    (dimension, delay) combination."""
+    dimension, tau = params
+    signal_embedded = complexity_embedding(signal, delay=tau, dimension=dimension)
+    signal_entropy = _complexity_optimize_get_differential(signal_embedded, k=1)
+
+    # calculate average of surrogates entropy
+    surrogate_entropy = [
+        _complexity_optimize_get_differential(complexity_embedding(surrogate, delay=tau, dimension=dimension), k=1)
+        for surrogate in surrogates
+    ]
+    return signal_entropy, np.mean(surrogate_entropy)
+
+
 def _complexity_optimize_iaaft(signal, max_iter=1000, atol=1e-8, rtol=1e-10):
     """Iterative amplitude adjusted Fourier transform (IAAFT) surrogates.
 
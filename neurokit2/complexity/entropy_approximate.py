@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 import numpy as np
 
-from .utils import _get_embedded, _get_r, _phi
+from .utils import _get_count, _get_r, _phi
 
 
 def entropy_approximate(signal, delay=1, dimension=2, r="default", corrected=False, **kwargs):
@@ -82,27 +82,22 @@ def entropy_approximate(signal, delay=1, dimension=2, r="default", corrected=Fal
 
     if corrected is True:
 
-        __, count1 = _get_embedded(
+        count1, count2 = _get_count(
             signal, delay=delay, dimension=dimension, r=r, distance="chebyshev", approximate=True, **kwargs
         )
-        __, count2 = _get_embedded(
-            signal, delay=delay, dimension=dimension + 1, r=r, distance="chebyshev", approximate=True, **kwargs
-        )
 
         # Limit the number of vectors to N - (dimension + 1) * delay
         upper_limit = len(signal) - (dimension + 1) * delay
+        count1 = count1[:upper_limit]
+        count2 = count2[:upper_limit]
 
         # Correction to replace the ratio of count1 and count2 when either is equal to 1
         # As when count = 1, only the vector itself is within r distance
         correction = 1 / upper_limit
 
-        vector_similarity = np.full(upper_limit, np.nan)
-
-        for i in np.arange(upper_limit):
-            if count1.astype(int)[i] != 1 and count2.astype(int)[i] != 1:
-                vector_similarity[i] = np.log(count2[i] / count1[i])
-            else:
-                vector_similarity[i] = np.log(correction)
+        vector_similarity = np.full(upper_limit, np.log(correction))
+        similar = (count1.astype(int) != 1) & (count2.astype(int) != 1)
+        vector_similarity[similar] = np.log(count2[similar] / count1[similar])
 
         apen = -np.mean(vector_similarity)
 
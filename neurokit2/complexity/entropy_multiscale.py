@@ -1,13 +1,32 @@
 # -*- coding: utf-8 -*-
+import functools
+
 import matplotlib.pyplot as plt
 import numpy as np
 
-from .entropy_sample import entropy_sample
-from .utils import _get_coarsegrained, _get_coarsegrained_rolling, _get_r, _get_scale, _phi, _phi_divide
+from ..misc.parallel import _parallel_map
+from .utils import (
+    _get_coarsegrained_cumsum,
+    _get_coarsegrained_from_cumsum,
+    _get_r,
+    _get_scale,
+    _phi,
+    _phi_batch,
+    _phi_divide,
+)
 
 
 def entropy_multiscale(
-    signal, scale="default", dimension=2, r="default", composite=False, refined=False, fuzzy=False, show=False, **kwargs
+    signal,
+    scale="default",
+    dimension=2,
+    r="default",
+    composite=False,
+    refined=False,
+    fuzzy=False,
+    show=False,
+    n_jobs=1,
+    **kwargs
 ):
     """Multiscale entropy (MSE) and its Composite (CMSE), Refined (RCMSE) or fuzzy version.
 
@@ -44,6 +63,9 @@ def entropy_multiscale(
         Returns the fuzzy (composite) multiscale entropy (FuzzyMSE, FuzzyCMSE or FuzzyRCMSE).
     show : bool
         Show the entropy values for each scale factor.
+    n_jobs : int
+        Number of processes over which the scale factors are distributed. If 1 (default), they are
+        computed sequentially. If -1, all CPUs are used.
     **kwargs
         Optional arguments.
 
@@ -105,6 +127,7 @@ def entropy_multiscale(
         fuzzy=fuzzy,
         refined=refined,
         show=show,
+        n_jobs=n_jobs,
         **kwargs
     )
 
@@ -113,27 +136,45 @@ def entropy_multiscale(
 # Internal
 # =============================================================================
 def _entropy_multiscale(
-    signal, scale="default", dimension=2, r="default", composite=False, fuzzy=False, refined=False, show=False, **kwargs
+    signal,
+    scale="default",
+    dimension=2,
+    r="default",
+    composite=False,
+    fuzzy=False,
+    refined=False,
+    show=False,
+    n_jobs=1,
+    **kwargs
 ):
 
     r = _get_r(signal, r=r, dimension=dimension)
     scale_factors = _get_scale(signal, scale=scale, dimension=dimension)
 
-    # Initalize mse vector
-    mse = np.full(len(scale_factors), np.nan)
-    for i, tau in enumerate(scale_factors):
+    # The coarse-grained time series of all scale factors are obtained from a single cumulative sum
+    cumsum = _get_coarsegrained_cumsum(signal, scale_max=np.max(scale_factors, initial=1))
 
-        # Regular MSE
-        if refined is False and composite is False:
-            mse[i] = _entropy_multiscale_mse(signal, tau, dimension, r, fuzzy, **kwargs)
+    # Regular MSE
+    if refined is False and composite is False:
+        method = _entropy_multiscale_mse
 
-        # Composite MSE
-        elif refined is False and composite is True:
-            mse[i] = _entropy_multiscale_cmse(signal, tau, dimension, r, fuzzy, **kwargs)
+    # Composite MSE
+    elif refined is False and composite is True:
+        method = _entropy_multiscale_cmse
 
-        # Refined Composite MSE
-        else:
-            mse[i] = _entropy_multiscale_rcmse(signal, tau, dimension, r, fuzzy, **kwargs)
+    # Refined Composite MSE
+    else:
+        method = _entropy_multiscale_rcmse
+
+    # Initalize mse vector
+    mse = _parallel_map(
+        functools.partial(
+            method, cumsum=cumsum, n=len(signal), dimension=dimension, r=r, fuzzy=fuzzy, **kwargs
+        ),
+        scale_factors,
+        n_jobs=n_jobs,
+    )
+    mse = np.array(mse, dtype=float)
 
     if show is True:
         plt.plot(scale_factors, mse)
@@ -151,35 +192,32 @@ def _entropy_multiscale(
 # =============================================================================
 # Methods
 # =============================================================================
-def _entropy_multiscale_mse(signal, tau, dimension, r, fuzzy, **kwargs):
-    y = _get_coarsegrained(signal, tau)
+def _entropy_multiscale_mse(tau, cumsum, n, dimension, r, fuzzy, **kwargs):
+    y = _get_coarsegrained_from_cumsum(cumsum, n, tau)[0]
     if len(y) < 10 ** dimension:  # Compute only if enough values (Liu et al., 2012)
         return np.nan
 
-    return entropy_sample(y, delay=1, dimension=dimension, r=r, fuzzy=fuzzy, **kwargs)
+    return _phi_divide(_phi(y, delay=1, dimension=dimension, r=r, fuzzy=fuzzy, approximate=False, **kwargs))
 
 
-def _entropy_multiscale_cmse(signal, tau, dimension, r, fuzzy, **kwargs):
-    y = _get_coarsegrained_rolling(signal, tau)
+def _entropy_multiscale_cmse(tau, cumsum, n, dimension, r, fuzzy, **kwargs):
+    y = _get_coarsegrained_from_cumsum(cumsum, n, tau, composite=True)
     if y.size < 10 ** dimension:  # Compute only if enough values (Liu et al., 2012)
         return np.nan
 
-    mse_y = np.full(len(y), np.nan)
-    for i in np.arange(len(y)):
-        mse_y[i] = entropy_sample(y[i, :], delay=1, dimension=dimension, r=r, fuzzy=fuzzy, **kwargs)
+    # Get phi for all kth coarse-grained time series at once
+    phi_ = _phi_batch(y, delay=1, dimension=dimension, r=r, fuzzy=fuzzy, approximate=False, **kwargs)
 
-    return np.mean(mse_y)
+    return np.mean([_phi_divide(phi) for phi in phi_])
 
 
-def _entropy_multiscale_rcmse(signal, tau, dimension, r, fuzzy, **kwargs):
-    y = _get_coarsegrained_rolling(signal, tau)
+def _entropy_multiscale_rcmse(tau, cumsum, n, dimension, r, fuzzy, **kwargs):
+    y = _get_coarsegrained_from_cumsum(cumsum, n, tau, composite=True)
     if y.size < 10 ** dimension:  # Compute only if enough values (Liu et al., 2012)
         return np.nan
 
-    # Get phi for all kth coarse-grained time series
-    phi_ = np.full([len(y), 2], np.nan)
-    for i in np.arange(len(y)):
-        phi_[i] = _phi(y[i, :], delay=1, dimension=dimension, r=r, fuzzy=fuzzy, approximate=False, **kwargs)
+    # Get phi for all kth coarse-grained time series at once
+    phi_ = _phi_batch(y, delay=1, dimension=dimension, r=r, fuzzy=fuzzy, approximate=False, **kwargs)
 
     # Average all phi of the same dimension, then divide, then log
     return _phi_divide([np.mean(phi_[:, 0]), np.mean(phi_[:, 1])])
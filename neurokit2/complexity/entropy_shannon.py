@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-import numpy as np
+from .utils_symbolic import _symbolic_counts, _symbolic_entropy
 
 
 def entropy_shannon(signal):
@@ -45,26 +45,8 @@ def entropy_shannon(signal):
     - `nolds` <https://github.com/CSchoel/nolds>`_
 
     """
-    # Check if string
-    if not isinstance(signal, str):
-        signal = list(signal)
-
-    signal = np.array(signal)
-
-    # Create a frequency data
-    data_set = list(set(signal))
-    freq_list = []
-    for entry in data_set:
-        counter = 0.0
-        for i in signal:
-            if i == entry:
-                counter += 1
-        freq_list.append(float(counter) / len(signal))
+    # Frequency of each unique value (a string is split into its characters)
+    counts = _symbolic_counts(signal)
 
     # Shannon entropy
-    shannon_entropy = 0.0
-    for freq in freq_list:
-        shannon_entropy += freq * np.log2(freq)
-    shannon_entropy = -shannon_entropy
-
-    return shannon_entropy
+    return _symbolic_entropy(counts, base=2)
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 import matplotlib.pyplot as plt
 import numpy as np
-import sklearn.metrics.pairwise
+import scipy.spatial
 
 from .complexity_embedding import complexity_embedding
 
@@ -71,14 +71,13 @@ def fractal_correlation(signal, delay=1, dimension=2, r=64, show=False):
 
     """
     embedded = complexity_embedding(signal, delay=delay, dimension=dimension)
-    dist = sklearn.metrics.pairwise.euclidean_distances(embedded)
 
-    r_vals = _fractal_correlation_get_r(r, signal, dist)
+    r_vals = _fractal_correlation_get_r(r, signal, embedded)
 
-    r_vals, corr = _fractal_correlation(signal, r_vals, dist)
+    r_vals, corr = _fractal_correlation(signal, r_vals, embedded)
 
     # Corr_Dim method: https://github.com/jcvasquezc/Corr_Dim
-    # r_vals, corr = _fractal_correlation_Corr_Dim(embedded, r_vals, dist)
+    # r_vals, corr = _fractal_correlation_Corr_Dim(embedded, r_vals)
 
     # Compute trend
     if len(corr) == 0:
@@ -95,16 +94,16 @@ def fractal_correlation(signal, delay=1, dimension=2, r=64, show=False):
 # =============================================================================
 # Methods
 # =============================================================================
-def _fractal_correlation(signal, r_vals, dist):
+def _fractal_correlation(signal, r_vals, embedded):
     """References
     -----------
     - `nolds <https://github.com/CSchoel/nolds/blob/master/nolds/measures.py>`_
     """
     n = len(signal)
 
-    corr = np.zeros(len(r_vals))
-    for i, r in enumerate(r_vals):
-        corr[i] = 1 / (n * (n - 1)) * np.sum(dist < r)
+    # Number of ordered pairs (including each vector with itself) closer than r
+    counts = 2 * _fractal_correlation_count(embedded, r_vals) + len(embedded) * (r_vals > 0)
+    corr = 1 / (n * (n - 1)) * counts
 
     # filter zeros from csums
     nonzero = np.nonzero(corr)[0]
@@ -114,19 +113,13 @@ def _fractal_correlation(signal, r_vals, dist):
     return r_vals, corr
 
 
-def _fractal_correlation_Corr_Dim(embedded, r_vals, dist):
+def _fractal_correlation_Corr_Dim(embedded, r_vals):
     """References
     -----------
     - `Corr_Dim <https://github.com/jcvasquezc/Corr_Dim>`_
     """
-    ED = dist[np.triu_indices_from(dist, k=1)]
-
     Npairs = (len(embedded[1, :])) * ((len(embedded[1, :]) - 1))
-    corr = np.zeros(len(r_vals))
-
-    for i, r in enumerate(r_vals):
-        N = np.where(((ED < r) & (ED > 0)))
-        corr[i] = len(N[0]) / Npairs
+    corr = _fractal_correlation_count(embedded, r_vals, nonzero=True) / Npairs
 
     omit_pts = 1
     k1 = omit_pts
@@ -140,7 +133,70 @@ def _fractal_correlation_Corr_Dim(embedded, r_vals, dist):
 # =============================================================================
 # Utilities
 # =============================================================================
-def _fractal_correlation_get_r(r, signal, dist):
+def _fractal_correlation_distances(embedded, max_size=2 ** 22):
+    """Generate the distances between all pairs of distinct vectors (i < j), by blocks.
+
+    The full distance matrix is never built: at most `max_size` distances are held in memory at once.
+
+    """
+    n = len(embedded)
+    block = max(1, max_size // max(n, 1))
+    for start in range(0, n - 1, block):
+        end = min(start + block, n - 1)
+        dist = scipy.spatial.distance.cdist(embedded[start:end], embedded[start + 1 :])
+        # Only keep the upper triangle (the distance of row i to the vectors j > i)
+        upper = np.arange(dist.shape[1])[np.newaxis, :] >= np.arange(end - start)[:, np.newaxis]
+        yield dist[upper]
+
+
+def _fractal_correlation_count(embedded, r_vals, nonzero=False):
+    """Number of pairs of distinct vectors closer than each r.
+
+    The distances are accumulated in a histogram whose bins are delimited by the (sorted) radiuses,
+    from which all counts are obtained via its cumulative sum.
+
+    """
+    order = np.argsort(r_vals)
+    hist = np.zeros(len(r_vals) + 1, dtype=np.int64)
+    for dist in _fractal_correlation_distances(embedded):
+        if nonzero is True:
+            dist = dist[dist > 0]
+        hist += np.bincount(np.searchsorted(r_vals[order], dist, side="right"), minlength=len(r_vals) + 1)
+
+    counts = np.zeros(len(r_vals))
+    counts[order] = np.cumsum(hist)[:-1]
+    return counts
+
+
+def _fractal_correlation_range(embedded, max_hull_dimension=5):
+    """Smallest non-zero and largest distances between vectors.
+
+    These are obtained without going through all the pairs of vectors: the smallest non-zero distance
+    is the smallest distance between the distinct vectors and their nearest neighbour, and the largest
+    distance is reached between two vertices of the convex hull of the vectors. As the cost of the
+    convex hull grows quickly with the dimension, all the pairs are used beyond `max_hull_dimension`.
+
+    """
+    unique = np.unique(embedded.reshape(len(embedded), -1), axis=0)
+    if len(unique) < 2:
+        return np.inf, 0
+
+    dist_min = np.min(scipy.spatial.cKDTree(unique).query(unique, k=2)[0][:, 1])
+
+    if unique.shape[1] == 1:
+        return dist_min, unique[-1, 0] - unique[0, 0]
+    if unique.shape[1] <= max_hull_dimension:
+        try:
+            unique = unique[scipy.spatial.ConvexHull(unique).vertices]
+        except RuntimeError:  # Degenerate (e.g., flat) vectors: use all of them
+            pass
+    dist_max = 0
+    for dist in _fractal_correlation_distances(unique):
+        dist_max = max(dist_max, np.max(dist, initial=0))
+    return dist_min, dist_max
+
+
+def _fractal_correlation_get_r(r, signal, embedded):
     if isinstance(r, str):
         if r == "nolds":
             sd = np.std(signal, ddof=1)
@@ -150,7 +206,8 @@ def _fractal_correlation_get_r(r, signal, dist):
             r_vals = np.array([min_r * (factor ** i) for i in range(r_n + 1)])
 
         elif r == "Corr_Dim":
-            r_min, r_max = np.min(dist[np.where(dist > 0)]), np.exp(np.floor(np.log(np.max(dist))))
+            r_min, r_max = _fractal_correlation_range(embedded)
+            r_max = np.exp(np.floor(np.log(r_max)))
 
             n_r = int(np.floor(np.log(r_max / r_min))) + 1
 
@@ -158,12 +215,13 @@ def _fractal_correlation_get_r(r, signal, dist):
             r_vals = r_max * np.exp(ones * np.arange(n_r) - ones)
 
         elif r == "boon2008":
-            r_min, r_max = np.min(dist[np.where(dist > 0)]), np.max(dist)
+            r_min, r_max = _fractal_correlation_range(embedded)
             r_vals = r_min + np.arange(1, 65) * ((r_max - r_min) / 64)
 
     if isinstance(r, int):
-        dist_range = np.max(dist) - np.min(dist)
-        r_min, r_max = (np.min(dist) + 0.025 * dist_range), (np.min(dist) + 0.5 * dist_range)
+        # The minimum distance is 0 (the distance of each vector to itself)
+        dist_range = _fractal_correlation_range(embedded)[1]
+        r_min, r_max = 0.025 * dist_range, 0.5 * dist_range
         r_vals = np.exp2(np.linspace(np.log2(r_min), np.log2(r_max), r, endpoint=True))
 
     return r_vals
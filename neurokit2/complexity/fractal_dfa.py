@@ -88,18 +88,8 @@ def fractal_dfa(signal, windows="default", overlap=True, integrate=True, order=1
     if multifractal is True:
         q = _fractal_mfdfa_q(q)
 
-    fluctuations = np.zeros(len(windows))
-    # Start looping over windows
-    for i, window in enumerate(windows):
-
-        # Get window
-        segments = _fractal_dfa_getwindow(signal, n, window, overlap=overlap)
-
-        # Get polynomial trends
-        trends = _fractal_dfa_trends(segments, window, order=1)
-
-        # Get local fluctuation
-        fluctuations[i] = _fractal_dfa_fluctuation(segments, trends, multifractal, q)
+    # Get local fluctuations (for all windows at once)
+    fluctuations = _fractal_dfa_fluctuations(signal, windows, overlap=overlap, multifractal=multifractal, q=q)
 
     # Filter zeros
     nonzero = np.nonzero(fluctuations)[0]
@@ -151,41 +141,97 @@ def _fractal_dfa_findwindows(n, windows="default"):
     return windows
 
 
-def _fractal_dfa_getwindow(signal, n, window, overlap=True):
-    if overlap:
-        segments = np.array([signal[i : i + window] for i in np.arange(0, n - window, window // 2)])
-    else:
-        segments = signal[: n - (n % window)]
-        segments = segments.reshape((signal.shape[0] // window, window))
-    return segments
-
-
-def _fractal_dfa_trends(segments, window, order=1):
-    x = np.arange(window)
+def _fractal_dfa_getwindow(n, windows, overlap=True):
+    """Start and length of the segments of all windows (concatenated), and number of segments per window."""
+    starts = []
+    for window in windows:
+        if overlap:
+            starts.append(np.arange(0, n - window, window // 2))
+        else:
+            starts.append(np.arange(0, n - window + 1, window))
+    counts = np.array([len(i) for i in starts])
+    return np.concatenate(starts), np.repeat(windows, counts), counts
 
-    coefs = np.polyfit(x[:window], segments.T, order).T
 
-    # TODO: Could this be optimized? Something like np.polyval(x[:window], coefs)
-    trends = np.array([np.polyval(coefs[j], x) for j in np.arange(len(segments))])
+def _fractal_dfa_fluctuations(signal, windows, overlap=True, multifractal=False, q=2):
+    """Fluctuation of each window, obtained from cumulative sums of the signal.
 
-    return trends
+    The residual variance of the linear trend of a segment only depends on the sums of y, x*y and y**2
+    over the segment, which are obtained for all the segments from cumulative sums.
 
+    """
+    signal = np.asarray(signal, dtype=float)
+    starts, lengths, counts = _fractal_dfa_getwindow(len(signal), windows, overlap=overlap)
+
+    # The cumulative sums are computed by blocks (of a size depending on the windows) to prevent the
+    # accumulation of rounding errors, with one pass for each octave of windows
+    var = np.zeros(len(starts))
+    octaves = np.floor(np.log2(lengths)).astype(int)
+    for octave in np.unique(octaves):
+        segments = octaves == octave
+        var[segments] = _fractal_dfa_variance(signal, starts[segments], lengths[segments], 2 ** (octave + 2))
+
+    # Average over the segments of each window (which are contiguous)
+    boundaries = np.cumsum(counts) - counts
+    if multifractal is True:
+        fluctuations = np.add.reduceat(np.float_power(var, q / 2), boundaries, axis=1) / counts
+        fluctuations = np.float_power(fluctuations / 2, 1 / q)
+        fluctuations = np.mean(fluctuations, axis=0)  # Average over qs (not sure of that!)
+    else:
+        # Compute Root Mean Square (RMS)
+        fluctuations = np.sqrt(np.add.reduceat(var, boundaries) / counts)
 
-def _fractal_dfa_fluctuation(segments, trends, multifractal=False, q=2):
+    return fluctuations
 
-    detrended = segments - trends
 
-    if multifractal is True:
-        var = np.var(detrended, axis=1)
-        fluctuation = np.float_power(np.mean(np.float_power(var, q / 2), axis=1) / 2, 1 / q.T)
-        fluctuation = np.mean(fluctuation)  # Average over qs (not sure of that!)
+def _fractal_dfa_variance(signal, starts, lengths, block):
+    """Residual variance of the linear trend of segments that are shorter than half the block size.
 
-    else:
-        # Compute Root Mean Square (RMS)
-        fluctuation = np.sum(detrended ** 2, axis=1) / detrended.shape[1]
-        fluctuation = np.sqrt(np.sum(fluctuation) / len(fluctuation))
+    The signal is cut into blocks, in which the cumulative sums are computed relative to the first value
+    (and first index) of the block, so that their magnitude only depends on the local variations of the
+    signal. Each segment spans at most two consecutive blocks, whose sums are combined in the frame of
+    the first one.
 
-    return fluctuation
+    """
+    n = len(signal)
+    n_blocks = int(np.ceil(n / block))
+    y = np.full(n_blocks * block, signal[-1])
+    y[:n] = signal
+    y = y.reshape(n_blocks, block)
+    offsets = y[:, 0].copy()
+    y = y - offsets[:, np.newaxis]
+
+    # Cumulative sums of y, x * y and y ** 2 within each block (starting at 0)
+    x = np.arange(block)
+    cumsums = np.zeros((3, n_blocks, block + 1))
+    np.cumsum(y, axis=1, out=cumsums[0, :, 1:])
+    np.cumsum(x * y, axis=1, out=cumsums[1, :, 1:])
+    np.cumsum(y ** 2, axis=1, out=cumsums[2, :, 1:])
+
+    ends = starts + lengths
+    first, start = np.divmod(starts, block)
+    last = (ends - 1) // block
+    end = ends - last * block
+    same = first == last
+
+    # Part of the segment in the first block
+    sums = cumsums[:, first, np.where(same, end, block)] - cumsums[:, first, start]
+
+    # Part of the segment in the second block (if any), shifted to the frame of the first one
+    m = np.where(same, 0, end)
+    shift = offsets[last] - offsets[first]
+    sum_y, sum_xy, sum_yy = np.where(same, 0, cumsums[:, last, end])
+    sums[0] += sum_y + m * shift
+    sums[1] += sum_xy + shift * m * (m - 1) / 2 + block * (sum_y + m * shift)
+    sums[2] += sum_yy + 2 * shift * sum_y + m * shift ** 2
+
+    # Sums over the segment, with x centered on the middle of the segment
+    sum_y, sum_xy, sum_yy = sums
+    sum_xy = sum_xy - (start + (lengths - 1) / 2) * sum_y
+    sum_xx = lengths * (lengths ** 2 - 1) / 12
+
+    var = (sum_yy - sum_y ** 2 / lengths - sum_xy ** 2 / sum_xx) / lengths
+    return np.maximum(var, 0)
 
 
 def _fractal_dfa_plot(windows, fluctuations, dfa):
@@ -1,5 +1,4 @@
 # -*- coding: utf-8 -*-
-import itertools
 import numpy as np
 import pandas as pd
 import scipy.stats
@@ -56,6 +55,60 @@ def transition_matrix(sequence):
     return out
 
 
+def transition_matrix_batch(sequences, states=None):
+    """Empirical transition matrices of several sequences
+
+    Computes the observed transition matrix of each sequence (see ``transition_matrix()``) at once,
+    over a common set of states.
+
+    Parameters
+    ----------
+    sequences : Union[list, np.ndarray]
+        A list of 1D arrays (possibly of different lengths), or a 2D array with one sequence per row.
+    states : Union[list, np.ndarray]
+        The states (rows and columns of the matrices). If None (default), the unique values of all the
+        sequences are used. Values that are not in ``states`` are ignored.
+
+    Returns
+    -------
+    states : np.ndarray
+        The states.
+    matrices : np.ndarray
+        The transition matrices, of shape (n_sequences, n_states, n_states).
+
+    See Also
+    --------
+    transition_matrix
+
+    Examples
+    --------
+    >>> import neurokit2 as nk
+    >>>
+    >>> sequences = [[0, 0, 0, 1, 1, 2, 2, 2, 2, 1, 0, 0], [0, 1, 2, 0, 1, 2]]
+    >>> states, matrices = nk.transition_matrix_batch(sequences)
+    >>> matrices.shape
+    (2, 3, 3)
+
+    """
+    sequences = [np.asarray(sequence).ravel() for sequence in sequences]
+    lengths = np.array([len(sequence) for sequence in sequences], dtype=int)
+    concatenated = np.concatenate(sequences) if len(sequences) > 0 else np.array([])
+
+    # Encode states
+    if states is None:
+        states, codes = np.unique(concatenated, return_inverse=True)
+    else:
+        states = np.asarray(states)
+        codes = _transition_matrix_codes(concatenated, states)
+    n_states = len(states)
+
+    # Transitions within each sequence (i.e., except from the last value of a sequence)
+    labels = np.repeat(np.arange(len(sequences)), lengths)
+    valid = labels[:-1] == labels[1:]
+    counts = _transition_matrix_counts(codes.ravel(), n_states, labels=labels, valid=valid, n_labels=len(sequences))
+    return states, _transition_matrix_normalize(counts)
+
+
 def transition_matrix_simulate(matrix, n=10):
     """Markov chain simulation
 
@@ -152,30 +205,53 @@ def _transition_matrix_observed(sequence):
 
     Based on https://github.com/Frederic-vW/eeg_microstates and https://github.com/maximtrp/mchmm
     """
-    states = np.unique(sequence)
-    n_states = len(states)
-
-    # Get observed transition matrix
-    matrix = np.zeros((n_states, n_states))
-    for x, y in itertools.product(range(n_states), repeat=2):
-        xi = np.argwhere(sequence == states[x]).flatten()
-        yi = xi + 1
-        yi = yi[yi < len(sequence)]
-        matrix[x, y] = np.count_nonzero(sequence[yi] == states[y])
+    states, codes = np.unique(sequence, return_inverse=True)
 
-    # Convert to probabilities
-    matrix = matrix / np.sum(matrix, axis=0)[:, None]
-
-    # filling in a row containing zeros with uniform p values
-    uniform_p = 1 / n_states
-    zero_row = np.argwhere(matrix.sum(axis=1) == 0).ravel()
-    matrix[zero_row, :] = uniform_p
+    # Get observed transition matrix (number of transitions from the state of each row to the state of
+    # each column), as probabilities
+    matrix = _transition_matrix_normalize(_transition_matrix_counts(codes.ravel(), len(states)))
 
     # Convert to DataFrame
     out = pd.DataFrame(matrix, index=states, columns=states)
     return out
 
 
+def _transition_matrix_codes(sequence, states):
+    """Index of each value in (sorted or not) states, -1 for values that are not in states."""
+    order = np.argsort(states)
+    idx = np.clip(np.searchsorted(states, sequence, sorter=order), 0, len(states) - 1)
+    codes = order[idx]
+    codes[states[codes] != sequence] = -1
+    return codes
+
+
+def _transition_matrix_counts(codes, n_states, labels=None, valid=None, n_labels=1):
+    """Number of transitions between consecutive codes (optionally for each label, e.g., block or sequence).
+
+    Each transition is encoded as a single index (label, from, to), so that all the counts are obtained
+    with one ``np.bincount()``. Returns an array of shape (n_labels, n_states, n_states), or
+    (n_states, n_states) if ``labels`` is None.
+    """
+    if valid is None:
+        valid = np.ones(max(len(codes) - 1, 0), dtype=bool)
+    valid = valid & (codes[:-1] >= 0) & (codes[1:] >= 0)
+    index = codes[:-1] * n_states + codes[1:]
+    if labels is not None:
+        index = index + labels[:-1] * n_states ** 2
+    counts = np.bincount(index[valid], minlength=n_labels * n_states ** 2).astype(float)
+    if labels is None:
+        return counts.reshape(n_states, n_states)
+    return counts.reshape(n_labels, n_states, n_states)
+
+
+def _transition_matrix_normalize(counts):
+    """Convert counts to probabilities (rows summing to 1), filling rows of zeros with uniform p values."""
+    n_states = counts.shape[-1]
+    total = np.sum(counts, axis=-1, keepdims=True)
+    matrix = np.divide(counts, total, out=np.full(counts.shape, 1 / max(n_states, 1)), where=total > 0)
+    return matrix
+
+
 def _transition_matrix_expected(observed_matrix):
 
     expected_matrix = scipy.stats.contingency.expected_freq(observed_matrix.values)
@@ -190,22 +266,14 @@ def _transition_matrix_symmetry(sequence):
 
     Based on https://github.com/Frederic-vW/eeg_microstates
     """
-    states = np.unique(sequence)
+    states, codes = np.unique(sequence, return_inverse=True)
     n_states = len(states)
-    n = len(sequence)
-    f_ij = np.zeros((n_states, n_states))
-
-    for t in range(n-1):
-        i = sequence[t]
-        j = sequence[t+1]
-        f_ij[states == i, states == j] += 1.0
+    f_ij = _transition_matrix_counts(codes.ravel(), n_states)
 
-    T = 0.0
-    for i, j in np.ndindex(f_ij.shape):
-        if (i != j):
-            f = f_ij[i, j] * f_ij[j, i]
-            if (f > 0):
-                T += (f_ij[i, j] * np.log((2. * f_ij[i, j]) / (f_ij[i, j] + f_ij[j, i])))
+    # Sum over the pairs of different states that both have transitions
+    f_ji = f_ij.T
+    mask = (f_ij * f_ji > 0) & ~np.eye(n_states, dtype=bool)
+    T = np.sum(f_ij[mask] * np.log((2.0 * f_ij[mask]) / (f_ij[mask] + f_ji[mask])))
 
     out = {}
     out["Symmetry_t"] = T * 2.0
@@ -222,7 +290,7 @@ def _transition_matrix_stationarity(sequence, size=100):
 
     ased on https://github.com/Frederic-vW/eeg_microstates
     """
-    states = np.unique(sequence)
+    states, codes = np.unique(sequence, return_inverse=True)
     n_states = len(states)
     n = len(sequence)
     r = int(np.floor(n / size))  # number of blocks
@@ -231,32 +299,19 @@ def _transition_matrix_stationarity(sequence, size=100):
             "NeuroKit error: _transition_matrix_stationarity(): the size of the blocks is too high.",
             " Decrease the 'size' argument.")
 
-#    nl =  r* size
-
-    f_ijk = np.zeros((r, n_states, n_states))
-    f_ij = np.zeros((r, n_states))
-    f_jk = np.zeros((n_states, n_states))
-    f_i = np.zeros(r)
-    f_j = np.zeros(n_states)
-
-    # calculate f_ijk (time / block dep. transition matrix)
-    for i in range(r):  # block index
-        for ii in range(size-1):  # pos. inside the current block
-            j = sequence[i*size + ii]
-            k = sequence[i*size + ii + 1]
-            f_ijk[i, j, k] += 1.0
-            f_ij[i, j] += 1.0
-            f_jk[j, k] += 1.0
-            f_i[i] += 1.0
-            f_j[j] += 1.0
+    # calculate f_ijk (time / block dep. transition matrix), for the transitions within each block
+    codes = codes.ravel()[0:r * size]
+    labels = np.repeat(np.arange(r), size)
+    f_ijk = _transition_matrix_counts(codes, n_states, labels=labels, valid=labels[:-1] == labels[1:], n_labels=r)
+    f_ij = np.sum(f_ijk, axis=2)
+    f_jk = np.sum(f_ijk, axis=0)
+    f_j = np.sum(f_jk, axis=1)
 
     # conditional homogeneity (Markovianity stationarity)
-    T = 0.0
-    for i, j, k in np.ndindex(f_ijk.shape):
-        # conditional homogeneity
-        f = f_ijk[i, j, k] * f_j[j] * f_ij[i, j] * f_jk[j, k]
-        if (f > 0):
-            T += (f_ijk[i, j, k] * np.log((f_ijk[i, j, k] * f_j[j]) / (f_ij[i, j] * f_jk[j, k])))
+    numerator = f_ijk * f_j[np.newaxis, :, np.newaxis]
+    denominator = f_ij[:, :, np.newaxis] * f_jk[np.newaxis, :, :]
+    mask = (numerator > 0) & (denominator > 0)
+    T = np.sum(f_ijk[mask] * np.log(numerator[mask] / denominator[mask]))
 
     out = {}
     out["Stationarity_t"] = T * 2.0
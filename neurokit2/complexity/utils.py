@@ -16,21 +16,32 @@ def _phi(signal, delay=1, dimension=2, r="default", distance="chebyshev", approx
     Adapted from `EntroPy <https://github.com/raphaelvallat/entropy>`_, check it out!
 
     """
+    return _phi_batch(
+        np.atleast_2d(np.asarray(signal, dtype=float)),
+        delay,
+        dimension,
+        r,
+        distance=distance,
+        approximate=approximate,
+        fuzzy=fuzzy,
+    )[0]
+
+
+def _phi_batch(signals, delay=1, dimension=2, r="default", distance="chebyshev", approximate=True, fuzzy=False):
+    """Phi of each row of `signals` (e.g., the coarse-grained time series of composite MSE)."""
     # Initialize phi
-    phi = np.zeros(2)
+    phi = np.zeros((len(signals), 2))
 
-    embedded1, count1 = _get_embedded(
-        signal, delay, dimension, r, distance=distance, approximate=approximate, fuzzy=fuzzy
+    count1, count2 = _get_count_batch(
+        signals, delay, dimension, r, distance=distance, approximate=approximate, fuzzy=fuzzy
     )
 
-    embedded2, count2 = _get_embedded(signal, delay, dimension + 1, r, distance=distance, approximate=True, fuzzy=fuzzy)
-
     if approximate is True:
-        phi[0] = np.mean(np.log(count1 / embedded1.shape[0]))
-        phi[1] = np.mean(np.log(count2 / embedded2.shape[0]))
+        phi[:, 0] = np.mean(np.log(count1 / count1.shape[1]), axis=1)
+        phi[:, 1] = np.mean(np.log(count2 / count2.shape[1]), axis=1)
     else:
-        phi[0] = np.mean((count1 - 1) / (embedded1.shape[0] - 1))
-        phi[1] = np.mean((count2 - 1) / (embedded2.shape[0] - 1))
+        phi[:, 0] = np.mean((count1 - 1) / (count1.shape[1] - 1), axis=1)
+        phi[:, 1] = np.mean((count2 - 1) / (count2.shape[1] - 1), axis=1)
     return phi
 
 
@@ -44,63 +55,94 @@ def _phi_divide(phi):
 
 
 # =============================================================================
-# Get Embedded
+# Get Count
 # =============================================================================
+def _get_count(signal, delay=1, dimension=2, r="default", distance="chebyshev", approximate=True, fuzzy=False):
+    """Count the neighbours (including itself) of each template of length `dimension` and `dimension + 1`.
 
+    If `approximate` is False, the last template of length `dimension` is dropped (so that both sets of
+    templates have the same size when delay=1).
 
-def _get_embedded(signal, delay=1, dimension=2, r="default", distance="chebyshev", approximate=True, fuzzy=False):
-    """Examples
+    Examples
     ----------
     >>> import neurokit2 as nk
     >>>
     >>> signal = nk.signal_simulate(duration=2, frequency=5)
-    >>> delay = nk.complexity_delay(signal)
-    >>>
-    >>> embbeded, count = _get_embedded(signal, delay, r=0.2 * np.std(signal, ddof=1), dimension=2,
-    ...                                 distance='chebyshev', approximate=False)
+    >>> count1, count2 = _get_count(signal, delay=1, dimension=2, r=0.2 * np.std(signal, ddof=1),
+    ...                             distance='chebyshev', approximate=False)
     """
+    count1, count2 = _get_count_batch(
+        np.atleast_2d(np.asarray(signal, dtype=float)),
+        delay,
+        dimension,
+        r,
+        distance=distance,
+        approximate=approximate,
+        fuzzy=fuzzy,
+    )
+    return count1[0], count2[0]
+
+
+def _get_count_batch(signals, delay=1, dimension=2, r="default", distance="chebyshev", approximate=True, fuzzy=False):
+    """Same as `_get_count()` but for each row of `signals` (templates are only compared within a row)."""
     # Sanity checks
     if distance not in sklearn.neighbors.KDTree.valid_metrics:
         raise ValueError(
-            "NeuroKit error: _get_embedded(): The given metric (%s) is not valid."
+            "NeuroKit error: _get_count(): The given metric (%s) is not valid."
             "The valid metric names are: %s" % (distance, sklearn.neighbors.KDTree.valid_metrics)
         )
 
-    # Get embedded
-    embedded = complexity_embedding(signal, delay=delay, dimension=dimension)
+    embedded1 = np.array([complexity_embedding(signal, delay=delay, dimension=dimension) for signal in signals])
     if approximate is False:
-        embedded = embedded[:-1]  # Removes the last line
+        embedded1 = embedded1[:, :-1]  # Removes the last line
+    embedded2 = np.array([complexity_embedding(signal, delay=delay, dimension=dimension + 1) for signal in signals])
 
     if fuzzy is False:
-        # Get neighbors count
-        count = _get_count(embedded, r=r, distance=distance)
+        count1 = _get_count_tree(embedded1, r=r, distance=distance)
+        count2 = _get_count_tree(embedded2, r=r, distance=distance)
     else:
         # FuzzyEn: Remove the local baselines of vectors
-        embedded -= np.mean(embedded, axis=1, keepdims=True)
-        count = _get_count_fuzzy(embedded, r=r, distance=distance, n=1)
-
-    return embedded, count
-
+        embedded1 -= np.mean(embedded1, axis=2, keepdims=True)
+        embedded2 -= np.mean(embedded2, axis=2, keepdims=True)
+        count1 = np.array([_get_count_fuzzy(embedded, r=r, distance=distance, n=1) for embedded in embedded1])
+        count2 = np.array([_get_count_fuzzy(embedded, r=r, distance=distance, n=1) for embedded in embedded2])
+
+    return count1, count2
+
+
+def _get_count_tree(embedded, r, distance="chebyshev"):
+    # Counting the neighbours does not require to list (nor to compute the distance of) every pair of
+    # matching templates, which makes the tree faster than any pairwise approach for large signals
+    n_signals, n_templates, _ = embedded.shape
+    if n_signals > 1:
+        # Add a coordinate identifying the signal, spaced by more than r, so that a single tree can be
+        # used for all signals without templates of different signals being counted as neighbours
+        label = np.repeat(np.arange(n_signals) * (2 * r + 1), n_templates)
+        embedded = np.column_stack([embedded.reshape(n_signals * n_templates, -1), label])
+    else:
+        embedded = embedded[0]
 
-# =============================================================================
-# Get Count
-# =============================================================================
-def _get_count(embedded, r, distance="chebyshev"):
     kdtree = sklearn.neighbors.KDTree(embedded, metric=distance)
     # Return the count
-    return kdtree.query_radius(embedded, r, count_only=True).astype(np.float64)
+    return kdtree.query_radius(embedded, r, count_only=True).astype(np.float64).reshape(n_signals, n_templates)
 
 
-def _get_count_fuzzy(embedded, r, distance="chebyshev", n=1):
+def _get_count_fuzzy(embedded, r, distance="chebyshev", n=1, max_size=2 ** 22):
+    # The similarity matrix is computed by blocks of rows and summed on the fly, so that at most
+    # `max_size` distances are held in memory (instead of the full N x N matrix)
     dist = sklearn.neighbors.DistanceMetric.get_metric(distance)
-    dist = dist.pairwise(embedded)
+    block = max(1, max_size // len(embedded))
 
-    if n > 1:
-        sim = np.exp(-(dist ** n) / r)
-    else:
-        sim = np.exp(-dist / r)
-    # Return the count
-    return np.sum(sim, axis=0)
+    count = np.zeros(len(embedded))
+    for start in range(0, len(embedded), block):
+        sim = dist.pairwise(embedded[start : start + block], embedded)
+
+        if n > 1:
+            sim = np.exp(-(sim ** n) / r)
+        else:
+            sim = np.exp(-sim / r, out=sim)
+        count[start : start + block] = np.sum(sim, axis=1)
+    return count
 
 
 # =============================================================================
@@ -143,6 +185,40 @@ def _get_scale(signal, scale="default", dimension=2):
 # =============================================================================
 # Get Coarsegrained
 # =============================================================================
+def _get_coarsegrained_cumsum(signal, scale_max=1):
+    """Cumulative sum from which the coarse-grained time series of any scale can be obtained.
+
+    The signal is centered (which does not change the entropy but reduces the rounding errors) and
+    extended by repeating its last element, similarly to ``_get_coarsegrained(force=True)``.
+
+    """
+    signal = np.asarray(signal, dtype=float)
+    signal = signal - np.mean(signal)
+    signal = np.concatenate([signal, np.repeat(signal[-1], scale_max)])
+    return np.concatenate([[0], np.cumsum(signal)])
+
+
+def _get_coarsegrained_from_cumsum(cumsum, n, scale=2, composite=False):
+    """Extract the coarse-grained time series from the cumulative sum of a signal of length n.
+
+    If composite is True, returns all the `scale` rolling coarse-grained time series (as rows, see
+    ``_get_coarsegrained_rolling()``), otherwise only the first one (see ``_get_coarsegrained()``).
+
+    >>> import neurokit2 as nk
+    >>> signal = [0, 2, 4, 6, 8, 10]
+    >>> cs = _get_coarsegrained_from_cumsum(_get_coarsegrained_cumsum(signal, 3), len(signal), 3, True)
+
+    """
+    j_max = n // scale
+    if composite is True:
+        offsets = np.arange(scale)
+    else:
+        offsets = np.array([0])
+
+    starts = offsets[:, np.newaxis] + scale * np.arange(j_max)[np.newaxis, :]
+    return (cumsum[starts + scale] - cumsum[starts]) / scale
+
+
 def _get_coarsegrained_rolling(signal, scale=2):
     """Used in composite multiscale entropy."""
     if scale in [0, 1]:
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""Statistics of symbolic sequences (e.g., microstates), computed from the counts of the symbols."""
+import numpy as np
+import pandas as pd
+
+
+# =============================================================================
+# Symbols
+# =============================================================================
+def _symbolic_sequence(sequence):
+    """Sequence as an array (a string is split into its characters)."""
+    if isinstance(sequence, str):
+        sequence = list(sequence)
+    if isinstance(sequence, (pd.Series, pd.DataFrame)):
+        sequence = sequence.values
+    return np.ravel(np.asarray(sequence))
+
+
+def _symbolic_codes(sequence):
+    """Unique symbols of a sequence and the (integer) code of each element."""
+    symbols, codes = np.unique(_symbolic_sequence(sequence), return_inverse=True)
+    return symbols, codes.ravel()
+
+
+def _symbolic_runs(sequence):
+    """Symbol and length of each run of identical (consecutive) elements."""
+    sequence = _symbolic_sequence(sequence)
+    if len(sequence) == 0:
+        return sequence, np.array([], dtype=int)
+    starts = np.concatenate([[0], np.flatnonzero(sequence[1:] != sequence[:-1]) + 1])
+    lengths = np.diff(np.concatenate([starts, [len(sequence)]]))
+    return sequence[starts], lengths
+
+
+# =============================================================================
+# Blocks
+# =============================================================================
+def _symbolic_blocks(codes, order=1, n_symbols=None):
+    """Code of each block of ``order`` consecutive elements, given the codes of the elements.
+
+    Blocks are encoded as numbers in base ``n_symbols``, or (if these could overflow) numbered after
+    sorting them.
+    """
+    codes = np.asarray(codes)
+    if order == 1:
+        return codes
+    n_blocks = len(codes) - order + 1
+    if n_blocks <= 0:
+        return np.array([], dtype=np.int64)
+    if n_symbols is None:
+        n_symbols = np.max(codes) + 1
+
+    if order * np.log2(max(n_symbols, 2)) < 63:
+        blocks = np.zeros(n_blocks, dtype=np.int64)
+        for i in range(order):
+            blocks = blocks * n_symbols + codes[i:i + n_blocks]
+        return blocks
+
+    windows = np.lib.stride_tricks.sliding_window_view(codes, order)
+    return np.unique(windows, axis=0, return_inverse=True)[1].ravel()
+
+
+def _symbolic_counts(sequence, order=1):
+    """Number of occurrences of each (observed) block of ``order`` consecutive symbols."""
+    symbols, codes = _symbolic_codes(sequence)
+    blocks = _symbolic_blocks(codes, order=order, n_symbols=len(symbols))
+    return np.unique(blocks, return_counts=True)[1]
+
+
+# =============================================================================
+# Entropy
+# =============================================================================
+def _symbolic_entropy(counts, base=2):
+    """Shannon entropy of a distribution given by counts."""
+    counts = np.asarray(counts, dtype=float)
+    counts = counts[counts > 0]
+    if len(counts) == 0:
+        return 0.0
+    freq = counts / np.sum(counts)
+    return -np.sum(freq * np.log(freq)) / np.log(base)
+
+
+def _symbolic_entropy_block(sequence, order=1, base=2):
+    """Block entropy H(order), i.e., the Shannon entropy of the blocks of ``order`` consecutive symbols."""
+    return _symbolic_entropy(_symbolic_counts(sequence, order=order), base=base)
+
+
+def _symbolic_entropy_rate(sequence, order=2, base=2):
+    """Entropy rate estimated as H(order) - H(order - 1), i.e., the entropy of a symbol given the
+    ``order - 1`` previous ones."""
+    if order == 1:
+        return _symbolic_entropy_block(sequence, order=1, base=base)
+    return _symbolic_entropy_block(sequence, order=order, base=base) - _symbolic_entropy_block(
+        sequence, order=order - 1, base=base
+    )
+
+
+class _SymbolicCounter:
+    """Streaming counts of the blocks (up to ``order`` consecutive symbols) of a sequence given in chunks.
+
+    The blocks spanning two chunks are counted, so that the counts (and entropies) are the same as for
+    the whole sequence.
+
+    >>> counter = _SymbolicCounter(order=2)
+    >>> for chunk in [[0, 0, 1], [1, 2], [0]]:
+    ...     counter.update(chunk)
+    >>> np.isclose(counter.entropy_block(2), _symbolic_entropy_block([0, 0, 1, 1, 2, 0], order=2))
+    True
+    """
+
+    def __init__(self, order=1):
+        self.order = order
+        self.counts = [{} for _ in range(order)]
+        self._tail = []
+
+    def update(self, chunk):
+        chunk = _symbolic_sequence(chunk)
+        if len(self._tail) > 0:
+            chunk = np.concatenate([self._tail, chunk])
+        n_tail = len(self._tail)
+
+        symbols, codes = np.unique(chunk, return_inverse=True)
+        codes = codes.ravel()
+        for k in range(1, self.order + 1):
+            # Blocks (of k symbols) ending in the new part of the chunk
+            start = max(n_tail - k + 1, 0)
+            if len(codes) - start < k:
+                continue
+            windows = np.lib.stride_tricks.sliding_window_view(codes[start:], k)
+            blocks, counts = np.unique(windows, axis=0, return_counts=True)
+            counter = self.counts[k - 1]
+            for block, count in zip(map(tuple, symbols[blocks]), counts):
+                counter[block] = counter.get(block, 0) + count
+
+        self._tail = chunk[max(len(chunk) - self.order + 1, 0):] if self.order > 1 else chunk[:0]
+
+    def entropy_block(self, order=1, base=2):
+        return _symbolic_entropy(list(self.counts[order - 1].values()), base=base)
+
+    def entropy_rate(self, order=2, base=2):
+        if order == 1:
+            return self.entropy_block(1, base=base)
+        return self.entropy_block(order, base=base) - self.entropy_block(order - 1, base=base)
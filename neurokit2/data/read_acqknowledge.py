@@ -2,13 +2,17 @@
 import os
 
 import numpy as np
-import pandas as pd
 
-from ..signal import signal_resample
+from .recording import Recording, _recording_cache_path, _RecordingWriter
 
 
 def read_acqknowledge(
-    filename, sampling_rate="max", resample_method="interpolation", impute_missing=True
+    filename,
+    sampling_rate="max",
+    resample_method="interpolation",
+    impute_missing=True,
+    lazy=False,
+    cache=None,
 ):
     """Read and format a BIOPAC's AcqKnowledge file into a pandas' dataframe.
 
@@ -33,6 +37,17 @@ def read_acqknowledge(
         Sometimes, due to connections issues, the signal has some holes (short periods without
         signal). If 'impute_missing' is True, will automatically fill the signal interruptions
         using padding.
+    lazy : bool
+        If True, will return a ``Recording`` object instead of a DataFrame, whose channels are
+        memory-mapped from the sidecar ``cache`` (created if necessary). Channels and time ranges
+        can then be selected and converted to a DataFrame (or iterated over by chunks) without
+        loading the whole file in memory. ``sampling_rate``, ``resample_method`` and
+        ``impute_missing`` are then ignored (see ``Recording.to_dataframe()``).
+    cache : bool or str
+        If True (or if ``lazy`` is True), the decoded channels are stored in a sidecar directory
+        next to the file (``<filename>.cache``), as one ``.npy`` file per channel, that is reused
+        (memory-mapped) by the subsequent reads as long as the file is not modified. Can also be
+        the path of the directory in which to store them.
 
     Returns
     ----------
@@ -43,13 +58,17 @@ def read_acqknowledge(
 
     See Also
     --------
-    signal_resample
+    signal_resample, Recording
 
     Example
     ----------
     >>> import neurokit2 as nk
     >>>
     >>> data, sampling_rate = nk.read_acqknowledge('file.acq') #doctest: +SKIP
+    >>>
+    >>> # Lazy reading (of the first minute of the ECG channel)
+    >>> recording = nk.read_acqknowledge('file.acq', lazy=True) #doctest: +SKIP
+    >>> data, sampling_rate = recording.select("ECG", start=0, end=60).to_dataframe() #doctest: +SKIP
 
     """
     # Try loading bioread
@@ -73,51 +92,45 @@ def read_acqknowledge(
         )
 
     # Read file
-    file = bioread.read(filename)
-
-    # Get desired frequency
-    if sampling_rate == "max":
-        freq_list = []
-        for channel in file.named_channels:
-            freq_list.append(file.named_channels[channel].samples_per_second)
-        sampling_rate = np.max(freq_list)
-
-    # Loop through channels
-    data = {}
+    if lazy is True and cache is None:
+        cache = True
+    path = _recording_cache_path(filename, cache)
+    if path is None:
+        recording = _read_acqknowledge_recording(bioread.read(filename))
+    else:
+        recording = Recording.load(path, source=filename)
+        if recording is None:
+            recording = _read_acqknowledge_cache(bioread, filename, path)
+
+    if lazy is True:
+        return recording
+
+    return recording.to_dataframe(
+        sampling_rate=sampling_rate, resample_method=resample_method, impute_missing=impute_missing
+    )
+
+
+def _read_acqknowledge_recording(file):
+    """Recording of an AcqKnowledge file loaded in memory."""
+    data, sampling_rates, units = {}, {}, {}
     for channel in file.named_channels:
-        signal = np.array(file.named_channels[channel].data)
-
-        # Fill signal interruptions
-        if impute_missing is True and np.isnan(np.sum(signal)):
-            signal = pd.Series(signal).fillna(method="pad").values
-
-        # Resample if necessary
-        if file.named_channels[channel].samples_per_second != sampling_rate:
-            signal = signal_resample(
-                signal,
-                sampling_rate=file.named_channels[channel].samples_per_second,
-                desired_sampling_rate=sampling_rate,
-                method=resample_method,
-            )
-        data[channel] = signal
-
-    # Sanitize lengths
-    lengths = []
-    for channel in data:
-        lengths += [len(data[channel])]
-    if len(set(lengths)) > 1:  # If different lengths
-        length = pd.Series(lengths).mode()[0]  # Find most common (target length)
-        for channel in data:
-            if len(data[channel]) > length:
-                data[channel] = data[channel][0:length]
-            if len(data[channel]) < length:
-                data[channel] = np.concatenate(
-                    [
-                        data[channel],
-                        np.full((length - len(data[channel])), data[channel][-1]),
-                    ]
-                )
-
-    # Final dataframe
-    df = pd.DataFrame(data)
-    return df, sampling_rate
+        data[channel] = np.array(file.named_channels[channel].data)
+        sampling_rates[channel] = file.named_channels[channel].samples_per_second
+        units[channel] = file.named_channels[channel].units
+    return Recording(data, sampling_rates, units=units)
+
+
+def _read_acqknowledge_cache(bioread, filename, path):
+    """Decode the channels one at a time into a sidecar cache (bounding memory usage)."""
+    headers = bioread.read_headers(filename)
+    writer = _RecordingWriter(path, source=filename)
+    for channel in headers.named_channels:
+        index = headers.channels.index(headers.named_channels[channel])
+        file = bioread.read(filename, channel_indexes=[index])
+        writer.add(
+            channel,
+            np.asarray(file.channels[index].data),
+            file.channels[index].samples_per_second,
+            file.channels[index].units,
+        )
+    return writer.close()
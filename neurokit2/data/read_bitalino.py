@@ -4,8 +4,10 @@ import json
 import numpy as np
 import pandas as pd
 
+from .recording import Recording, _recording_cache_path, _RecordingWriter
 
-def read_bitalino(filename):
+
+def read_bitalino(filename, lazy=False, cache=None):
     """Read and format a  OpenSignals file (e.g., from BITalino) into a pandas' dataframe.
 
     The function outputs both the dataframe and the sampling rate (retrieved from the
@@ -15,6 +17,14 @@ def read_bitalino(filename):
     ----------
     filename :  str
         Filename (with or without the extension) of an OpenSignals file (e.g., 'data.txt').
+    lazy : bool
+        If True, will return a ``Recording`` object instead of a DataFrame, whose channels are
+        memory-mapped from the sidecar ``cache`` (created if necessary). See ``read_acqknowledge()``.
+    cache : bool or str
+        If True (or if ``lazy`` is True), the parsed channels are stored in a sidecar directory next
+        to the file (``<filename>.cache``), as one ``.npy`` file per channel, that is reused
+        (memory-mapped) by the subsequent reads as long as the file is not modified. Can also be
+        the path of the directory in which to store them. The text file is then parsed by chunks.
 
     Returns
     ----------
@@ -25,7 +35,7 @@ def read_bitalino(filename):
 
     See Also
     --------
-    read_acqknowledge
+    read_acqknowledge, Recording
 
     Examples
     --------
@@ -50,7 +60,39 @@ def read_bitalino(filename):
     channels = np.arange(len(metadata["channels"])) + 5  # analog channels start from column 5
 
     # Read data
-    data = pd.read_csv(filename, sep="\t", usecols=channels, header=None, comment="#")
-    data.columns = metadata["sensor"]
+    if lazy is True and cache is None:
+        cache = True
+    path = _recording_cache_path(filename, cache)
+    if path is None:
+        data = pd.read_csv(filename, sep="\t", usecols=channels, header=None, comment="#")
+        data.columns = metadata["sensor"]
+        return data, sampling_rate
+
+    recording = Recording.load(path, source=filename)
+    if recording is None:
+        recording = _read_bitalino_cache(filename, path, channels, metadata["sensor"], sampling_rate)
+
+    if lazy is True:
+        return recording
+    return pd.DataFrame({channel: np.array(recording[channel]) for channel in recording}), sampling_rate
+
+
+def _read_bitalino_cache(filename, path, channels, sensors, sampling_rate, chunksize=100000):
+    """Parse the text file by chunks into a sidecar cache."""
+    # Count the samples
+    with open(filename, "r") as f:
+        length = sum(1 for line in f if line.strip() != "" and not line.startswith("#"))
 
-    return data, sampling_rate
+    writer = _RecordingWriter(path, source=filename)
+    signals = [writer.add_memmap(sensor, length, sampling_rate) for sensor in sensors]
+    reader = pd.read_csv(filename, sep="\t", usecols=channels, header=None, comment="#", chunksize=chunksize)
+    start = 0
+    for chunk in reader:
+        values = chunk.to_numpy(dtype=float)
+        for i, signal in enumerate(signals):
+            signal[start : start + len(values)] = values[:, i]
+        start += len(values)
+    for signal in signals:
+        signal.flush()
+    del signals
+    return writer.close()
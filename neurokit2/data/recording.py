@@ -0,0 +1,356 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from ..signal import signal_resample
+
+
+class Recording:
+    """Lazy recording.
+
+    Container returned by ``read_acqknowledge()`` and ``read_bitalino()`` when ``lazy=True``. It
+    holds one array per channel, at its native sampling rate, which are usually memory-mapped from
+    a sidecar cache (see ``Recording.save()``): nothing is loaded in memory until the data is
+    accessed. Channels and time ranges can be selected (as views of the arrays) before converting
+    the data to a DataFrame (see ``to_dataframe()``), which harmonizes the sampling rates on demand,
+    or before iterating over chunks of a fixed duration (see ``iter_chunks()``).
+
+    Attributes
+    ----------
+    channels : list
+        The name of the channels.
+    sampling_rates : dict
+        The sampling rate of each channel.
+    units : dict
+        The units of each channel (None if unknown).
+
+    See Also
+    ----------
+    read_acqknowledge, read_bitalino
+
+    Examples
+    ----------
+    >>> import neurokit2 as nk
+    >>>
+    >>> recording = nk.read_acqknowledge('file.acq', lazy=True)  #doctest: +SKIP
+    >>> recording = recording.select(channels=["ECG", "EDA"], start=60, end=120)  #doctest: +SKIP
+    >>> data, sampling_rate = recording.to_dataframe(sampling_rate=1000)  #doctest: +SKIP
+    >>>
+    >>> # Iterate over chunks of 10 minutes
+    >>> for chunk in recording.iter_chunks(duration=600, sampling_rate=1000):  #doctest: +SKIP
+    ...     signals, info = nk.bio_process(ecg=chunk["ECG"], sampling_rate=1000)  #doctest: +SKIP
+
+    """
+
+    def __init__(self, data, sampling_rates, units=None):
+        self._data = dict(data)
+        self.channels = list(self._data.keys())
+        if not isinstance(sampling_rates, dict):
+            sampling_rates = {channel: sampling_rates for channel in self.channels}
+        self.sampling_rates = {channel: sampling_rates[channel] for channel in self.channels}
+        if units is None:
+            units = {}
+        self.units = {channel: units.get(channel) for channel in self.channels}
+
+    def __getitem__(self, channel):
+        return self._data[channel]
+
+    def __iter__(self):
+        return iter(self.channels)
+
+    def __len__(self):
+        return len(self.channels)
+
+    def __contains__(self, channel):
+        return channel in self._data
+
+    def __repr__(self):
+        return f"<Recording: {len(self)} channel(s), {self.duration:.2f} s>"
+
+    @property
+    def duration(self):
+        """Duration of the longest channel (in seconds)."""
+        durations = [len(self._data[channel]) / self.sampling_rates[channel] for channel in self.channels]
+        return max(durations, default=0.0)
+
+    def select(self, channels=None, start=None, end=None):
+        """Select channels and a time range.
+
+        Parameters
+        ----------
+        channels : str or list
+            The name of the channel(s) to keep. If ``None``, all the channels are kept.
+        start : float
+            Start of the time range (in seconds). If ``None``, starts at the beginning.
+        end : float
+            End of the time range (in seconds). If ``None``, ends at the end of the recording.
+
+        Returns
+        ----------
+        Recording
+            A recording of the selection, whose channels are views of the current ones.
+
+        """
+        if channels is None:
+            channels = self.channels
+        elif isinstance(channels, str):
+            channels = [channels]
+        missing = [channel for channel in channels if channel not in self._data]
+        if len(missing) > 0:
+            raise ValueError("NeuroKit error: Recording.select(): unknown channel(s): " + ", ".join(missing))
+
+        data = {}
+        for channel in channels:
+            data[channel] = self._data[channel][_recording_slice(self.sampling_rates[channel], start, end)]
+        return Recording(data, self.sampling_rates, units=self.units)
+
+    def get_signal(self, channel, sampling_rate=None, resample_method="interpolation", impute_missing=True):
+        """Load one channel (resampled if a ``sampling_rate`` is specified).
+
+        See ``to_dataframe()`` for the arguments.
+
+        """
+        signal = np.array(self._data[channel])
+
+        # Fill signal interruptions
+        if impute_missing is True and np.isnan(np.sum(signal)):
+            signal = pd.Series(signal).fillna(method="pad").values
+
+        # Resample if necessary
+        if sampling_rate is not None and self.sampling_rates[channel] != sampling_rate:
+            signal = signal_resample(
+                signal,
+                sampling_rate=self.sampling_rates[channel],
+                desired_sampling_rate=sampling_rate,
+                method=resample_method,
+            )
+        return signal
+
+    def to_dataframe(self, sampling_rate="max", resample_method="interpolation", impute_missing=True):
+        """Load the data into a DataFrame.
+
+        Parameters
+        ----------
+        sampling_rate : int
+            The sampling rate of the DataFrame. If 'max' (default), will keep the maximum sampling
+            rate of the channels and upsample the channels with lower rate if necessary (using the
+            ``signal_resample()`` function).
+        resample_method : str
+            Method of resampling (see ``signal_resample()``).
+        impute_missing : bool
+            If True, will fill the signal interruptions (NaNs) using padding.
+
+        Returns
+        ----------
+        df : DataFrame
+            The data as a pandas dataframe.
+        sampling rate: int
+            The sampling rate of the data.
+
+        """
+        sampling_rate = self._get_sampling_rate(sampling_rate)
+
+        data = {}
+        for channel in self.channels:
+            data[channel] = self.get_signal(
+                channel,
+                sampling_rate=sampling_rate,
+                resample_method=resample_method,
+                impute_missing=impute_missing,
+            )
+
+        # Sanitize lengths
+        lengths = [len(data[channel]) for channel in data]
+        if len(set(lengths)) > 1:  # If different lengths
+            length = pd.Series(lengths).mode()[0]  # Find most common (target length)
+            for channel in data:
+                data[channel] = _recording_fit_length(data[channel], length)
+
+        return pd.DataFrame(data), sampling_rate
+
+    def iter_chunks(self, duration, sampling_rate="max", resample_method="interpolation", impute_missing=True):
+        """Iterate over consecutive chunks of the data.
+
+        Only one chunk is loaded in memory at a time. Each channel is resampled chunk by chunk, so
+        that the samples near the edges of the chunks can slightly differ from the resampling of the
+        whole signal. When imputing missing values, the interruptions at the start of a chunk are
+        filled with the last value of the previous chunk.
+
+        Parameters
+        ----------
+        duration : float
+            The duration of the chunks (in seconds). The last chunk can be shorter.
+        sampling_rate : int
+            See ``to_dataframe()``.
+        resample_method : str
+            See ``to_dataframe()``.
+        impute_missing : bool
+            See ``to_dataframe()``.
+
+        Yields
+        ----------
+        DataFrame
+            The chunks as dataframes, indexed by their sample number (at ``sampling_rate``) from the
+            start of the recording.
+
+        """
+        if duration <= 0:
+            raise ValueError("NeuroKit error: Recording.iter_chunks(): 'duration' should be positive.")
+        sampling_rate = self._get_sampling_rate(sampling_rate)
+
+        length = int(np.round(self.duration * sampling_rate))
+        size = int(np.round(duration * sampling_rate))
+        last = {}  # Last valid value of each channel, to fill interruptions at the start of chunks
+        for start in range(0, length, size):
+            end = min(start + size, length)
+            data = {}
+            for channel in self.channels:
+                rate = self.sampling_rates[channel]
+                signal = np.array(
+                    self._data[channel][_recording_slice(rate, start / sampling_rate, end / sampling_rate)],
+                    dtype=float,
+                )
+
+                if impute_missing is True and np.isnan(np.sum(signal)):
+                    if np.isnan(signal[0]) and channel in last:
+                        signal[0] = last[channel]
+                    signal = pd.Series(signal).fillna(method="pad").values
+                valid = signal[~np.isnan(signal)]
+                if len(valid) > 0:
+                    last[channel] = valid[-1]
+
+                if rate != sampling_rate and len(signal) > 0:
+                    signal = signal_resample(
+                        signal,
+                        desired_length=end - start,
+                        sampling_rate=rate,
+                        desired_sampling_rate=sampling_rate,
+                        method=resample_method,
+                    )
+                data[channel] = _recording_fit_length(signal, end - start)
+            yield pd.DataFrame(data, index=pd.RangeIndex(start, end))
+
+    def save(self, path):
+        """Store the channels in a sidecar directory, as one ``.npy`` file per channel.
+
+        Returns
+        ----------
+        Recording
+            The recording, memory-mapped from the saved files.
+
+        """
+        writer = _RecordingWriter(path)
+        for channel in self.channels:
+            writer.add(channel, np.asarray(self._data[channel]), self.sampling_rates[channel], self.units[channel])
+        return writer.close()
+
+    @classmethod
+    def load(cls, path, source=None):
+        """Memory-map a sidecar directory created by ``Recording.save()``.
+
+        Returns None if it does not exist or if it is outdated, i.e., if it was created from another
+        version of the ``source`` file.
+
+        """
+        filename = os.path.join(path, "metadata.json")
+        if os.path.exists(filename) is False:
+            return None
+        with open(filename, "r") as f:
+            metadata = json.load(f)
+        if source is not None and metadata.get("source") != _recording_source_stamp(source):
+            return None
+
+        data, sampling_rates, units = {}, {}, {}
+        for i, channel in enumerate(metadata["channels"]):
+            data[channel] = np.load(os.path.join(path, f"{i}.npy"), mmap_mode="r")
+            sampling_rates[channel] = metadata["sampling_rates"][i]
+            units[channel] = metadata["units"][i]
+        return cls(data, sampling_rates, units=units)
+
+    def _get_sampling_rate(self, sampling_rate="max"):
+        if sampling_rate == "max":
+            sampling_rate = np.max([self.sampling_rates[channel] for channel in self.channels])
+        return sampling_rate
+
+
+# =============================================================================
+# Sidecar cache
+# =============================================================================
+class _RecordingWriter:
+    """Write the channels of a recording one at a time (to bound memory usage)."""
+
+    def __init__(self, path, source=None):
+        self.path = path
+        self.source = source
+        self.metadata = {"channels": [], "sampling_rates": [], "units": []}
+        os.makedirs(path, exist_ok=True)
+        # Invalidate a previous cache until the new one is complete
+        if os.path.exists(os.path.join(path, "metadata.json")):
+            os.remove(os.path.join(path, "metadata.json"))
+
+    def add(self, channel, signal, sampling_rate, units=None):
+        np.save(self._filename(len(self.metadata["channels"])), signal)
+        self._register(channel, sampling_rate, units)
+
+    def add_memmap(self, channel, length, sampling_rate, units=None, dtype=float):
+        """Create an empty (memory-mapped) channel, to be filled by the caller."""
+        signal = np.lib.format.open_memmap(
+            self._filename(len(self.metadata["channels"])), mode="w+", dtype=dtype, shape=(length,)
+        )
+        self._register(channel, sampling_rate, units)
+        return signal
+
+    def close(self):
+        if self.source is not None:
+            self.metadata["source"] = _recording_source_stamp(self.source)
+        with open(os.path.join(self.path, "metadata.json"), "w") as f:
+            json.dump(self.metadata, f)
+        return Recording.load(self.path)
+
+    def _filename(self, i):
+        return os.path.join(self.path, f"{i}.npy")
+
+    def _register(self, channel, sampling_rate, units):
+        self.metadata["channels"].append(channel)
+        self.metadata["sampling_rates"].append(np.asarray(sampling_rate).item())
+        self.metadata["units"].append(units)
+
+
+def _recording_cache_path(filename, cache=None):
+    """Location of the sidecar cache of a file (None if no cache is used)."""
+    if cache is None or cache is False:
+        return None
+    if cache is True:
+        return filename + ".cache"
+    return cache
+
+
+def _recording_source_stamp(filename):
+    """Size and modification time of a file, to detect outdated caches."""
+    stat = os.stat(filename)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+# =============================================================================
+# Utilities
+# =============================================================================
+def _recording_slice(sampling_rate, start=None, end=None):
+    """Slice of samples corresponding to a time range (in seconds)."""
+    if start is not None:
+        start = max(int(np.round(start * sampling_rate)), 0)
+    if end is not None:
+        end = max(int(np.round(end * sampling_rate)), 0)
+    return slice(start, end)
+
+
+def _recording_fit_length(signal, length):
+    """Trim or pad (with the last value) a signal to a given length."""
+    if len(signal) > length:
+        return signal[0:length]
+    if len(signal) < length:
+        fill = signal[-1] if len(signal) > 0 else np.nan
+        return np.concatenate([signal, np.full((length - len(signal)), fill)])
+    return signal
@@ -16,6 +16,7 @@ from .ecg_quality import ecg_quality
 from .ecg_rsp import ecg_rsp
 from .ecg_segment import ecg_segment
 from .ecg_simulate import ecg_simulate
+from .ecg_stream import ECGStream
 
 
 __all__ = [
@@ -34,4 +35,5 @@ __all__ = [
     "ecg_intervalrelated",
     "ecg_analyze",
     "ecg_rate",
+    "ECGStream",
 ]
@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
+import functools
+
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+import scipy.fft
 import scipy.signal
 
 from ..epochs import epochs_create, epochs_to_df
@@ -235,90 +238,66 @@ def _dwt_delineate_tp_peaks(
     srch_bndry = int(0.5 * qrs_width * sampling_rate)
     degree_add = _dwt_compensate_degree(sampling_rate)
 
-    tpeaks = []
-    for rpeak_ in rpeaks:
-        if np.isnan(rpeak_):
-            tpeaks.append(np.nan)
-            continue
-        # search for T peaks from R peaks
-        srch_idx_start = rpeak_ + srch_bndry
-        srch_idx_end = rpeak_ + 2 * int(rt_duration * sampling_rate)
-        dwt_local = dwtmatr[degree_tpeak + degree_add, srch_idx_start:srch_idx_end]
-        height = epsilon_T_weight * np.sqrt(np.mean(np.square(dwt_local)))
-
-        if len(dwt_local) == 0:
-            tpeaks.append(np.nan)
-            continue
-
-        ecg_local = ecg[srch_idx_start:srch_idx_end]
-        peaks, __ = scipy.signal.find_peaks(np.abs(dwt_local), height=height)
-        peaks = list(filter(lambda p: np.abs(dwt_local[p]) > 0.025 * max(dwt_local), peaks))  # pylint: disable=W0640
-        if dwt_local[0] > 0:  # just append
-            peaks = [0] + peaks
-
-        # detect morphology
-        candidate_peaks = []
-        candidate_peaks_scores = []
-        for idx_peak, idx_peak_nxt in zip(peaks[:-1], peaks[1:]):
-            correct_sign = dwt_local[idx_peak] > 0 and dwt_local[idx_peak_nxt] < 0  # pylint: disable=R1716
-            if correct_sign:
-                idx_zero = signal_zerocrossings(dwt_local[idx_peak:idx_peak_nxt+1])[0] + idx_peak
-                # This is the score assigned to each peak. The peak with the highest score will be
-                # selected.
-                score = ecg_local[idx_zero] - (float(idx_zero) / sampling_rate - (rt_duration - 0.5 * qrs_width))
-                candidate_peaks.append(idx_zero)
-                candidate_peaks_scores.append(score)
-
-        if not candidate_peaks:
-            tpeaks.append(np.nan)
-            continue
-
-        tpeaks.append(candidate_peaks[np.argmax(candidate_peaks_scores)] + srch_idx_start)
-
-    ppeaks = []
-    for rpeak in rpeaks:
-        if np.isnan(rpeak):
-            ppeaks.append(np.nan)
-            continue
-
-        # search for P peaks from Rpeaks
-        srch_idx_start = rpeak - 2 * int(p2r_duration * sampling_rate)
-        srch_idx_end = rpeak - srch_bndry
-        dwt_local = dwtmatr[degree_ppeak + degree_add, srch_idx_start:srch_idx_end]
-        height = epsilon_P_weight * np.sqrt(np.mean(np.square(dwt_local)))
-
-        if len(dwt_local) == 0:
-            ppeaks.append(np.nan)
+    rpeaks = np.array(rpeaks, dtype=float)
+    valid = np.flatnonzero(~np.isnan(rpeaks))
+    index_rpeaks = rpeaks[valid].astype(int)
+
+    # search for T peaks from R peaks
+    tpeaks = np.full(len(rpeaks), np.nan)
+    srch_idx_start = index_rpeaks + srch_bndry
+    srch_width = 2 * int(rt_duration * sampling_rate) - srch_bndry
+    dwt_windows = _ecg_delineate_windows(dwtmatr[degree_tpeak + degree_add], srch_idx_start, srch_width)
+    ecg_windows = _ecg_delineate_windows(ecg, srch_idx_start, srch_width)
+    for i, (dwt_local, ecg_local) in enumerate(zip(dwt_windows, ecg_windows)):
+        candidate_peaks, candidate_peaks_times = _dwt_delineate_tp_candidates(
+            dwt_local, epsilon_T_weight, sampling_rate=sampling_rate
+        )
+        if len(candidate_peaks) == 0:
             continue
-
-        ecg_local = ecg[srch_idx_start:srch_idx_end]
-        peaks, __ = scipy.signal.find_peaks(np.abs(dwt_local), height=height)
-        peaks = list(filter(lambda p: np.abs(dwt_local[p]) > 0.025 * max(dwt_local), peaks))
-        if dwt_local[0] > 0:  # just append
-            peaks = [0] + peaks
-
-        # detect morphology
-        candidate_peaks = []
-        candidate_peaks_scores = []
-        for idx_peak, idx_peak_nxt in zip(peaks[:-1], peaks[1:]):
-            correct_sign = dwt_local[idx_peak] > 0 and dwt_local[idx_peak_nxt] < 0  # pylint: disable=R1716
-            if correct_sign:
-                idx_zero = signal_zerocrossings(dwt_local[idx_peak:idx_peak_nxt+1])[0] + idx_peak
-                # This is the score assigned to each peak. The peak with the highest score will be
-                # selected.
-                score = ecg_local[idx_zero] - abs(
-                    float(idx_zero) / sampling_rate - p2r_duration
-                )  # Minus p2r because of the srch_idx_start
-                candidate_peaks.append(idx_zero)
-                candidate_peaks_scores.append(score)
-
-        if not candidate_peaks:
-            ppeaks.append(np.nan)
+        # This is the score assigned to each peak. The peak with the highest score will be selected.
+        scores = ecg_local[candidate_peaks] - (candidate_peaks_times - (rt_duration - 0.5 * qrs_width))
+        tpeaks[valid[i]] = candidate_peaks[np.argmax(scores)] + srch_idx_start[i]
+
+    # search for P peaks from Rpeaks
+    ppeaks = np.full(len(rpeaks), np.nan)
+    srch_idx_start = index_rpeaks - 2 * int(p2r_duration * sampling_rate)
+    srch_width = 2 * int(p2r_duration * sampling_rate) - srch_bndry
+    dwt_windows = _ecg_delineate_windows(dwtmatr[degree_ppeak + degree_add], srch_idx_start, srch_width)
+    ecg_windows = _ecg_delineate_windows(ecg, srch_idx_start, srch_width)
+    for i, (dwt_local, ecg_local) in enumerate(zip(dwt_windows, ecg_windows)):
+        candidate_peaks, candidate_peaks_times = _dwt_delineate_tp_candidates(
+            dwt_local, epsilon_P_weight, sampling_rate=sampling_rate
+        )
+        if len(candidate_peaks) == 0:
             continue
-
-        ppeaks.append(candidate_peaks[np.argmax(candidate_peaks_scores)] + srch_idx_start)
-
-    return tpeaks, ppeaks
+        # Minus p2r because of the srch_idx_start
+        scores = ecg_local[candidate_peaks] - np.abs(candidate_peaks_times - p2r_duration)
+        ppeaks[valid[i]] = candidate_peaks[np.argmax(scores)] + srch_idx_start[i]
+
+    return _dwt_format_points(tpeaks), _dwt_format_points(ppeaks)
+
+
+def _dwt_delineate_tp_candidates(dwt_local, epsilon_weight, sampling_rate=250):
+    """Zero-crossings of the wavelet transform between a positive and a negative modulus maximum (detect
+    morphology) in a search window, and their time (in seconds) from the start of the window."""
+    if np.all(np.isnan(dwt_local)):
+        return np.array([], dtype=int), np.array([])
+
+    height = epsilon_weight * np.sqrt(np.nanmean(np.square(dwt_local)))
+    peaks, __ = scipy.signal.find_peaks(np.abs(dwt_local), height=height)
+    peaks = peaks[np.abs(dwt_local[peaks]) > 0.025 * np.nanmax(dwt_local)]
+    if dwt_local[0] > 0:  # just append
+        peaks = np.r_[0, peaks]
+
+    correct_sign = (dwt_local[peaks[:-1]] > 0) & (dwt_local[peaks[1:]] < 0)
+    candidate_peaks = np.array(
+        [
+            signal_zerocrossings(dwt_local[idx_peak : idx_peak_nxt + 1])[0] + idx_peak
+            for idx_peak, idx_peak_nxt in zip(peaks[:-1][correct_sign], peaks[1:][correct_sign])
+        ],
+        dtype=int,
+    )
+    return candidate_peaks, candidate_peaks / sampling_rate
 
 
 def _dwt_delineate_tp_onsets_offsets(
@@ -333,58 +312,54 @@ def _dwt_delineate_tp_onsets_offsets(
     degree_offset=2,
 ):
     degree = _dwt_compensate_degree(sampling_rate)
-    onsets = []
-    offsets = []
-    for i in range(len(peaks)):  # pylint: disable=C0200
-        # look for onsets
-        srch_idx_start = peaks[i] - int(duration * sampling_rate)
-        srch_idx_end = peaks[i]
-        if srch_idx_start is np.nan or srch_idx_end is np.nan:
-            onsets.append(np.nan)
-            continue
-        dwt_local = dwtmatr[degree_onset + degree, srch_idx_start:srch_idx_end]
-        onset_slope_peaks, __ = scipy.signal.find_peaks(dwt_local)
-        if len(onset_slope_peaks) == 0:
-            onsets.append(np.nan)
-            continue
-        epsilon_onset = onset_weight * dwt_local[onset_slope_peaks[-1]]
-        if not (dwt_local[: onset_slope_peaks[-1]] < epsilon_onset).any():
-            onsets.append(np.nan)
-            continue
-        candidate_onsets = np.where(dwt_local[: onset_slope_peaks[-1]] < epsilon_onset)[0]
-        onsets.append(candidate_onsets[-1] + srch_idx_start)
+    peaks = np.array(peaks, dtype=float)
+    valid = np.flatnonzero(~np.isnan(peaks))
+    index_peaks = peaks[valid].astype(int)
+
+    # look for onsets
+    onsets = np.full(len(peaks), np.nan)
+    srch_idx_start = index_peaks - int(duration * sampling_rate)
+    dwt_windows = _ecg_delineate_windows(dwtmatr[degree_onset + degree], srch_idx_start, int(duration * sampling_rate))
+    onset_slope_peaks = np.array([_dwt_find_slope_peak(dwt_local, side="last") for dwt_local in dwt_windows], dtype=int)
+    epsilon_onset = onset_weight * dwt_windows[np.arange(len(valid)), onset_slope_peaks]
+    below = (dwt_windows < epsilon_onset[:, np.newaxis]) & (
+        np.arange(dwt_windows.shape[1]) < onset_slope_peaks[:, np.newaxis]
+    )
+    found = (onset_slope_peaks >= 0) & below.any(axis=1)
+    candidate_onsets = dwt_windows.shape[1] - 1 - np.argmax(below[:, ::-1], axis=1)
+    onsets[valid[found]] = (candidate_onsets + srch_idx_start)[found]
+
+    # look for offset
+    offsets = np.full(len(peaks), np.nan)
+    srch_idx_start = index_peaks
+    dwt_windows = _ecg_delineate_windows(
+        dwtmatr[degree_offset + degree], srch_idx_start, int(duration_offset * sampling_rate)
+    )
+    offset_slope_peaks = np.array(
+        [_dwt_find_slope_peak(-dwt_local, side="first") for dwt_local in dwt_windows], dtype=int
+    )
+    epsilon_offset = -offset_weight * dwt_windows[np.arange(len(valid)), offset_slope_peaks]
+    below = (-dwt_windows < epsilon_offset[:, np.newaxis]) & (
+        np.arange(dwt_windows.shape[1]) >= offset_slope_peaks[:, np.newaxis]
+    )
+    found = (offset_slope_peaks >= 0) & below.any(axis=1)
+    candidate_offsets = np.argmax(below, axis=1)
+    offsets[valid[found]] = (candidate_offsets + srch_idx_start)[found]
 
-        # # only for debugging
-        # events_plot([candidate_onsets, onset_slope_peaks], dwt_local)
-        # plt.plot(ecg[srch_idx_start: srch_idx_end], '--', label='ecg')
-        # plt.show()
+    return _dwt_format_points(onsets), _dwt_format_points(offsets)
 
-    for i in range(len(peaks)):  # pylint: disable=C0200
-        # look for offset
-        srch_idx_start = peaks[i]
-        srch_idx_end = peaks[i] + int(duration_offset * sampling_rate)
-        if srch_idx_start is np.nan or srch_idx_end is np.nan:
-            offsets.append(np.nan)
-            continue
-        dwt_local = dwtmatr[degree_offset + degree, srch_idx_start:srch_idx_end]
-        offset_slope_peaks, __ = scipy.signal.find_peaks(-dwt_local)
-        if len(offset_slope_peaks) == 0:
-            offsets.append(np.nan)
-            continue
-        epsilon_offset = -offset_weight * dwt_local[offset_slope_peaks[0]]
-        if not (-dwt_local[offset_slope_peaks[0] :] < epsilon_offset).any():
-            offsets.append(np.nan)
-            continue
-        candidate_offsets = np.where(-dwt_local[offset_slope_peaks[0] :] < epsilon_offset)[0] + offset_slope_peaks[0]
-        offsets.append(candidate_offsets[0] + srch_idx_start)
 
+def _dwt_find_slope_peak(dwt_local, side="last"):
+    """Index of the last (or first) peak in a search window (-1 if there is none)."""
+    slope_peaks, __ = scipy.signal.find_peaks(dwt_local)
+    if len(slope_peaks) == 0:
+        return -1
+    return slope_peaks[-1] if side == "last" else slope_peaks[0]
 
-        # # only for debugging
-        # events_plot([candidate_offsets, offset_slope_peaks], dwt_local)
-        # plt.plot(ecg[srch_idx_start: srch_idx_end], '--', label='ecg')
-        # plt.show()
 
-    return onsets, offsets
+def _dwt_format_points(points):
+    """Points as a list of integers, with NaN where they could not be found."""
+    return [np.nan if np.isnan(x) else int(x) for x in points]
 
 
 def _dwt_delineate_qrs_bounds(rpeaks, dwtmatr, ppeaks, tpeaks, sampling_rate=250):
@@ -445,53 +420,66 @@ def _dwt_delineate_qrs_bounds(rpeaks, dwtmatr, ppeaks, tpeaks, sampling_rate=250
 
 
 def _dwt_compute_multiscales(ecg: np.ndarray, max_degree):
-    """Return multiscales wavelet transforms."""
-
-    def _apply_H_filter(signal_i, power=0):
-        zeros = np.zeros(2 ** power - 1)
-        timedelay = 2 ** power
-        banks = np.r_[
-            1.0 / 8, zeros, 3.0 / 8, zeros, 3.0 / 8, zeros, 1.0 / 8,
-        ]
-        signal_f = scipy.signal.convolve(signal_i, banks, mode="full")
-        signal_f[:-timedelay] = signal_f[timedelay:]  # timeshift: 2 steps
-        return signal_f
-
-    def _apply_G_filter(signal_i, power=0):
-        zeros = np.zeros(2 ** power - 1)
-        timedelay = 2 ** power
-        banks = np.r_[2, zeros, -2]
-        signal_f = scipy.signal.convolve(signal_i, banks, mode="full")
-        signal_f[:-timedelay] = signal_f[timedelay:]  # timeshift: 1 step
-        return signal_f
-
-    dwtmatr = []
-    intermediate_ret = np.array(ecg)
-    for deg in range(max_degree):
-        S_deg = _apply_G_filter(intermediate_ret, power=deg)
-        T_deg = _apply_H_filter(intermediate_ret, power=deg)
-        dwtmatr.append(S_deg)
-        intermediate_ret = np.array(T_deg)
-    dwtmatr = [arr[: len(ecg)] for arr in dwtmatr]  # rescale transforms to the same length
+    """Return multiscales wavelet transforms.
+
+    The transform at each degree is the signal filtered by the cascade of the low-pass (H) filters of the previous
+    degrees and the high-pass (G) filter of that degree, so all the degrees are obtained from a single FFT of the
+    signal, multiplied by the (cached) frequency responses of these cascades.
+
+    """
+    ecg = np.asarray(ecg, dtype=float)
+    filterbank, timedelays, nfft = _dwt_compute_filterbank(len(ecg), max_degree)
+    conv = np.fft.irfft(np.fft.rfft(ecg, nfft) * filterbank, nfft)
+    # timeshift and rescale transforms to the same length
+    dwtmatr = [conv[deg, timedelay : timedelay + len(ecg)] for deg, timedelay in enumerate(timedelays)]
     return np.array(dwtmatr)
 
 
+@functools.lru_cache(maxsize=16)
+def _dwt_compute_filterbank(length, max_degree):
+    """Frequency responses of the filter cascades of each degree, zero-padded for a signal of a given length."""
+
+    def _upsample(banks, power=0):
+        filters = np.zeros((len(banks) - 1) * 2 ** power + 1)
+        filters[:: 2 ** power] = banks
+        return filters
+
+    cascade = np.array([1.0])
+    filters = []
+    timedelays = []
+    for deg in range(max_degree):
+        filters.append(np.convolve(cascade, _upsample([2, -2], power=deg)))
+        timedelays.append(2 ** (deg + 1) - 1)  # timeshifts of the previous H filters and of G
+        cascade = np.convolve(cascade, _upsample([1.0 / 8, 3.0 / 8, 3.0 / 8, 1.0 / 8], power=deg))
+
+    # Pad so that the (circular) FFT convolution is a linear one
+    nfft = scipy.fft.next_fast_len(length + max(len(f) for f in filters) - 1)
+    filterbank = np.array([np.fft.rfft(f, nfft) for f in filters])
+    filterbank.flags.writeable = False
+    return filterbank, timedelays, nfft
+
+
 # =============================================================================
 # WAVELET METHOD (CWT)
 # =============================================================================
 def _ecg_delineator_cwt(ecg, rpeaks=None, sampling_rate=1000):
 
+    # The multiscale transform is computed once and shared by all the steps
+    cwtmatr = _ecg_delineator_cwt_transform(ecg)
+
     # P-Peaks and T-Peaks
-    tpeaks, ppeaks = _peaks_delineator(ecg, rpeaks, sampling_rate=sampling_rate)
+    tpeaks, ppeaks = _peaks_delineator(ecg, rpeaks, cwtmatr, sampling_rate=sampling_rate)
 
     # qrs onsets and offsets
-    qrs_onsets, qrs_offsets = _onset_offset_delineator(ecg, rpeaks, peak_type="rpeaks", sampling_rate=sampling_rate)
+    qrs_onsets, qrs_offsets = _onset_offset_delineator(
+        cwtmatr, rpeaks, peak_type="rpeaks", sampling_rate=sampling_rate
+    )
 
     # ppeaks onsets and offsets
-    p_onsets, p_offsets = _onset_offset_delineator(ecg, ppeaks, peak_type="ppeaks", sampling_rate=sampling_rate)
+    p_onsets, p_offsets = _onset_offset_delineator(cwtmatr, ppeaks, peak_type="ppeaks", sampling_rate=sampling_rate)
 
     # tpeaks onsets and offsets
-    t_onsets, t_offsets = _onset_offset_delineator(ecg, tpeaks, peak_type="tpeaks", sampling_rate=sampling_rate)
+    t_onsets, t_offsets = _onset_offset_delineator(cwtmatr, tpeaks, peak_type="tpeaks", sampling_rate=sampling_rate)
 
     # Return info dictionary
     return {
@@ -510,7 +498,30 @@ def _ecg_delineator_cwt(ecg, rpeaks=None, sampling_rate=1000):
 # ---------------------
 
 
-def _onset_offset_delineator(ecg, peaks, peak_type="rpeaks", sampling_rate=1000):
+def _ecg_delineator_cwt_transform(ecg):
+    """Continuous wavelet transform of the signal with the first derivative of the Gaussian ('gaus1').
+
+    Same as ``pywt.cwt(ecg, [1, 2, 4, 8, 16], "gaus1")``, but all the scales are obtained from a single FFT of the
+    signal, multiplied by the (cached) frequency responses of the scaled wavelets.
+
+    """
+    ecg = np.asarray(ecg, dtype=float)
+    n = len(ecg)
+    scales, filterbank, sizes, nfft = _ecg_delineator_cwt_filterbank(n)
+    conv = np.fft.irfft(np.fft.rfft(ecg, nfft) * filterbank, nfft)
+
+    cwtmatr = np.zeros((len(scales), n))
+    for i, scale in enumerate(scales):
+        # Differentiate the convolution with the integrated wavelet and keep its central part (as pywt does)
+        coef = -np.sqrt(scale) * np.diff(conv[i, : n + sizes[i] - 1])
+        start = (coef.size - n) // 2
+        cwtmatr[i] = coef[start : start + n]
+    return cwtmatr
+
+
+@functools.lru_cache(maxsize=16)
+def _ecg_delineator_cwt_filterbank(length):
+    """Frequency responses of the scaled (integrated) wavelets, zero-padded for a signal of a given length."""
     # Try loading pywt
     try:
         import pywt
@@ -521,108 +532,89 @@ def _onset_offset_delineator(ecg, peaks, peak_type="rpeaks", sampling_rate=1000)
         )
     # first derivative of the Gaissian signal
     scales = np.array([1, 2, 4, 8, 16])
-    cwtmatr, __ = pywt.cwt(ecg, scales, "gaus1", sampling_period=1.0 / sampling_rate)
+    int_psi, x = pywt.integrate_wavelet("gaus1", precision=10)
+    step = x[1] - x[0]
+
+    wavelets = []
+    for scale in scales:
+        j = (np.arange(scale * (x[-1] - x[0]) + 1) / (scale * step)).astype(int)
+        wavelets.append(int_psi[j[j < int_psi.size]][::-1])
+    sizes = np.array([len(wavelet) for wavelet in wavelets])
+
+    # Pad so that the (circular) FFT convolution is a linear one
+    nfft = scipy.fft.next_fast_len(length + sizes.max() - 1)
+    filterbank = np.array([np.fft.rfft(wavelet, nfft) for wavelet in wavelets])
+    filterbank.flags.writeable = False
+    return scales, filterbank, sizes, nfft
+
+
+def _onset_offset_delineator(cwtmatr, peaks, peak_type="rpeaks", sampling_rate=1000):
+    # The onset is searched for in the slope before the peak, the offset in the (opposite) slope after it
+    if peak_type == "rpeaks":
+        slope = cwtmatr[2, :]
+        onset_prominence, offset_prominence = 0.20, 0.50
+        onset_weight, offset_weight = 0.05, 0.125
+    else:
+        slope = -cwtmatr[4, :]
+        onset_prominence, offset_prominence = 0.10, 0.10
+        onset_weight, offset_weight = (0.50, 0.9) if peak_type == "ppeaks" else (0.25, 0.4)
 
     half_wave_width = int(0.1 * sampling_rate)  # NEED TO CHECK
-    onsets = []
-    offsets = []
-    for index_peak in peaks:
-        # find onset
-        if np.isnan(index_peak):
-            onsets.append(np.nan)
-            offsets.append(np.nan)
-            continue
-        if peak_type == "rpeaks":
-            search_window = cwtmatr[2, index_peak - half_wave_width : index_peak]
-            prominence = 0.20 * max(search_window)
-            height = 0.0
-            wt_peaks, wt_peaks_data = scipy.signal.find_peaks(search_window, height=height, prominence=prominence)
-
-        elif peak_type in ["tpeaks", "ppeaks"]:
-            search_window = -cwtmatr[4, index_peak - half_wave_width : index_peak]
-
-            prominence = 0.10 * max(search_window)
-            height = 0.0
-            wt_peaks, wt_peaks_data = scipy.signal.find_peaks(search_window, height=height, prominence=prominence)
-
-        if len(wt_peaks) == 0:
-            # print("Fail to find onset at index: %d", index_peak)
-            onsets.append(np.nan)
-        else:
-            # The last peak is nfirst in (Martinez, 2004)
-            nfirst = wt_peaks[-1] + index_peak - half_wave_width
-            if peak_type == "rpeaks":
-                if wt_peaks_data["peak_heights"][-1] > 0:
-                    epsilon_onset = 0.05 * wt_peaks_data["peak_heights"][-1]
-            elif peak_type == "ppeaks":
-                epsilon_onset = 0.50 * wt_peaks_data["peak_heights"][-1]
-            elif peak_type == "tpeaks":
-                epsilon_onset = 0.25 * wt_peaks_data["peak_heights"][-1]
-            leftbase = wt_peaks_data["left_bases"][-1] + index_peak - half_wave_width
-            if peak_type == "rpeaks":
-                candidate_onsets = np.where(cwtmatr[2, nfirst - 100 : nfirst] < epsilon_onset)[0] + nfirst - 100
-            elif peak_type in ["tpeaks", "ppeaks"]:
-                candidate_onsets = np.where(-cwtmatr[4, nfirst - 100 : nfirst] < epsilon_onset)[0] + nfirst - 100
-
-            candidate_onsets = candidate_onsets.tolist() + [leftbase]
-            if len(candidate_onsets) == 0:
-                onsets.append(np.nan)
-            else:
-                onsets.append(max(candidate_onsets))
+    peaks = np.array(peaks, dtype=float)
+    valid = np.flatnonzero(~np.isnan(peaks))
+    index_peaks = peaks[valid].astype(int)
+
+    onsets = np.full(len(peaks), np.nan)
+    offsets = np.full(len(peaks), np.nan)
+
+    # find onset: the last peak of the slope is nfirst in (Martinez, 2004)
+    windows = _ecg_delineate_windows(slope, index_peaks - half_wave_width, half_wave_width)
+    nfirst, heights, leftbase = _onset_offset_slope_peaks(windows, onset_prominence, side="last")
+    found = nfirst >= 0
+    nfirst, leftbase = nfirst + index_peaks - half_wave_width, leftbase + index_peaks - half_wave_width
+
+    below = _ecg_delineate_windows(slope, nfirst - 100, 100) < onset_weight * heights[:, np.newaxis]
+    candidate_onsets = np.where(below.any(axis=1), nfirst - 100 + 99 - np.argmax(below[:, ::-1], axis=1), -1)
+    onsets[valid[found]] = np.maximum(candidate_onsets, leftbase)[found]
+
+    # find offset
+    windows = _ecg_delineate_windows(-slope, index_peaks, half_wave_width)
+    nlast, heights, rightbase = _onset_offset_slope_peaks(windows, offset_prominence, side="first")
+    found = nlast >= 0
+    nlast, rightbase = nlast + index_peaks, rightbase + index_peaks
+
+    below = _ecg_delineate_windows(-slope, nlast, 100) < offset_weight * heights[:, np.newaxis]
+    candidate_offsets = np.where(below.any(axis=1), nlast + np.argmax(below, axis=1), rightbase)
+    offsets[valid[found]] = np.minimum(candidate_offsets, rightbase)[found]
+
+    onsets = np.array([np.nan if np.isnan(x) else int(x) for x in onsets], dtype="object")
+    offsets = np.array([np.nan if np.isnan(x) else int(x) for x in offsets], dtype="object")
+    return onsets, offsets
 
-        # find offset
-        if peak_type == "rpeaks":
-            search_window = -cwtmatr[2, index_peak : index_peak + half_wave_width]
-            prominence = 0.50 * max(search_window)
-            wt_peaks, wt_peaks_data = scipy.signal.find_peaks(search_window, height=height, prominence=prominence)
 
-        elif peak_type in ["tpeaks", "ppeaks"]:
-            search_window = cwtmatr[4, index_peak : index_peak + half_wave_width]
-            prominence = 0.10 * max(search_window)
-            wt_peaks, wt_peaks_data = scipy.signal.find_peaks(search_window, height=height, prominence=prominence)
+def _onset_offset_slope_peaks(windows, prominence, side="last"):
+    """Position, height and base of the last (or first) peak of each search window (-1 if there is none)."""
+    position = np.full(len(windows), -1)
+    heights = np.zeros(len(windows))
+    bases = np.full(len(windows), -1)
 
+    maxima = np.max(np.where(np.isnan(windows), -np.inf, windows), axis=1)
+    for i in np.flatnonzero(np.isfinite(maxima)):
+        wt_peaks, wt_peaks_data = scipy.signal.find_peaks(windows[i], height=0.0, prominence=prominence * maxima[i])
         if len(wt_peaks) == 0:
-            # print("Fail to find offsets at index: %d", index_peak)
-            offsets.append(np.nan)
+            continue
+        if side == "last":
+            position[i], heights[i], bases[i] = (
+                wt_peaks[-1], wt_peaks_data["peak_heights"][-1], wt_peaks_data["left_bases"][-1]
+            )
         else:
-            nlast = wt_peaks[0] + index_peak
-            if peak_type == "rpeaks":
-                if wt_peaks_data["peak_heights"][0] > 0:
-                    epsilon_offset = 0.125 * wt_peaks_data["peak_heights"][0]
-            elif peak_type == "ppeaks":
-                epsilon_offset = 0.9 * wt_peaks_data["peak_heights"][0]
-            elif peak_type == "tpeaks":
-                epsilon_offset = 0.4 * wt_peaks_data["peak_heights"][0]
-            rightbase = wt_peaks_data["right_bases"][0] + index_peak
-            if peak_type == "rpeaks":
-                candidate_offsets = np.where((-cwtmatr[2, nlast : nlast + 100]) < epsilon_offset)[0] + nlast
-            elif peak_type in ["tpeaks", "ppeaks"]:
-                candidate_offsets = np.where((cwtmatr[4, nlast : nlast + 100]) < epsilon_offset)[0] + nlast
-
-            candidate_offsets = candidate_offsets.tolist() + [rightbase]
-            if len(candidate_offsets) == 0:
-                offsets.append(np.nan)
-            else:
-                offsets.append(min(candidate_offsets))
-
-    onsets = np.array(onsets, dtype="object")
-    offsets = np.array(offsets, dtype="object")
-    return onsets, offsets
-
+            position[i], heights[i], bases[i] = (
+                wt_peaks[0], wt_peaks_data["peak_heights"][0], wt_peaks_data["right_bases"][0]
+            )
+    return position, heights, bases
 
-def _peaks_delineator(ecg, rpeaks, sampling_rate=1000):
-    # Try loading pywt
-    try:
-        import pywt
-    except ImportError:
-        raise ImportError(
-            "NeuroKit error: ecg_delineator(): the 'PyWavelets' module is required for this method to run. ",
-            "Please install it first (`pip install PyWavelets`).",
-        )
-    # first derivative of the Gaissian signal
-    scales = np.array([1, 2, 4, 8, 16])
-    cwtmatr, __ = pywt.cwt(ecg, scales, "gaus1", sampling_period=1.0 / sampling_rate)
 
+def _peaks_delineator(ecg, rpeaks, cwtmatr, sampling_rate=1000):
     qrs_duration = 0.1
 
     search_boundary = int(0.9 * qrs_duration * sampling_rate / 2)
@@ -637,10 +629,9 @@ def _peaks_delineator(ecg, rpeaks, sampling_rate=1000):
         peaks_tp = peaks_tp + rpeaks[i] + search_boundary
         # set threshold for heights of peaks to find significant peaks in wavelet
         threshold = 0.125 * max(search_window)
-        significant_peaks_tp = []
-        significant_peaks_tp = [peaks_tp[j] for j in range(len(peaks_tp)) if heights_tp["peak_heights"][j] > threshold]
+        significant_peaks_tp = peaks_tp[heights_tp["peak_heights"] > threshold]
 
-        significant_peaks_groups.append(_find_tppeaks(ecg, significant_peaks_tp, sampling_rate=sampling_rate))
+        significant_peaks_groups.append(_find_tppeaks(ecg, significant_peaks_tp, cwtmatr, sampling_rate=sampling_rate))
 
     tpeaks, ppeaks = zip(*[(g[0], g[-1]) for g in significant_peaks_groups])
 
@@ -649,30 +640,18 @@ def _peaks_delineator(ecg, rpeaks, sampling_rate=1000):
     return tpeaks, ppeaks
 
 
-def _find_tppeaks(ecg, keep_tp, sampling_rate=1000):
-    # Try loading pywt
-    try:
-        import pywt
-    except ImportError:
-        raise ImportError(
-            "NeuroKit error: ecg_delineator(): the 'PyWavelets' module is required for this method to run. ",
-            "Please install it first (`pip install PyWavelets`).",
-        )
-    # first derivative of the Gaissian signal
-    scales = np.array([1, 2, 4, 8, 16])
-    cwtmatr, __ = pywt.cwt(ecg, scales, "gaus1", sampling_period=1.0 / sampling_rate)
+def _find_tppeaks(ecg, keep_tp, cwtmatr, sampling_rate=1000):
     max_search_duration = 0.05
+    keep_tp = np.asarray(keep_tp, dtype=int)
+    # limit 1
+    correct_sign = (cwtmatr[4, keep_tp[:-1]] < 0) & (cwtmatr[4, keep_tp[1:]] > 0)
+    #    near = (index_next - index_cur) < max_wv_peak_dist #limit 2
     tppeaks = []
-    for index_cur, index_next in zip(keep_tp[:-1], keep_tp[1:]):
-        # limit 1
-        correct_sign = cwtmatr[4, :][index_cur] < 0 and cwtmatr[4, :][index_next] > 0  # pylint: disable=R1716
-        #    near = (index_next - index_cur) < max_wv_peak_dist #limit 2
-        #    if near and correct_sign:
-        if correct_sign:
-            index_zero_cr = signal_zerocrossings(cwtmatr[4, :][index_cur:index_next+1])[0] + index_cur
-            nb_idx = int(max_search_duration * sampling_rate)
-            index_max = np.argmax(ecg[index_zero_cr - nb_idx : index_zero_cr + nb_idx]) + (index_zero_cr - nb_idx)
-            tppeaks.append(index_max)
+    for index_cur, index_next in zip(keep_tp[:-1][correct_sign], keep_tp[1:][correct_sign]):
+        index_zero_cr = signal_zerocrossings(cwtmatr[4, index_cur : index_next + 1])[0] + index_cur
+        nb_idx = int(max_search_duration * sampling_rate)
+        index_max = np.argmax(ecg[index_zero_cr - nb_idx : index_zero_cr + nb_idx]) + (index_zero_cr - nb_idx)
+        tppeaks.append(index_max)
     if len(tppeaks) == 0:
         tppeaks = [np.nan]
     return tppeaks
@@ -916,6 +895,19 @@ def _ecg_delineate_plot(ecg_signal, rpeaks=None, signals=None, signal_features_t
     return fig
 
 
+def _ecg_delineate_windows(signal, starts, width):
+    """Stack the search windows ``signal[start:start + width]`` of all beats in a (beats x width) matrix.
+
+    Samples outside of the signal are NaN, which ``scipy.signal.find_peaks()`` treats like the edges of a window.
+
+    """
+    signal = np.asarray(signal, dtype=float)
+    idx = np.asarray(starts, dtype=int)[:, np.newaxis] + np.arange(max(width, 0))
+    windows = signal[np.clip(idx, 0, len(signal) - 1)]
+    windows[(idx < 0) | (idx >= len(signal))] = np.nan
+    return windows
+
+
 def _ecg_delineate_check(waves, rpeaks):
     """This function replaces the delineated features with np.nan if its standardized distance from R-peaks is more than
     3."""
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 from warnings import warn
 
+import numpy as np
+
 from ..epochs.eventrelated_utils import (
     _eventrelated_addinfo,
     _eventrelated_rate,
@@ -104,26 +106,26 @@ def ecg_eventrelated(epochs, silent=False):
     [4 rows x 17 columns]
 
     """
-    # Sanity checks
-    epochs = _eventrelated_sanitizeinput(epochs, what="ecg", silent=silent)
+    # Sanity checks (the epochs are stacked into groups of epochs sharing the same time and columns)
+    groups = _eventrelated_sanitizeinput(epochs, what="ecg", silent=silent)
 
-    # Extract features and build dataframe
+    # Extract features (for all the epochs of a group at once) and build dataframe
     data = {}  # Initialize an empty dict
-    for i in epochs.keys():
+    for group in groups:
 
-        data[i] = {}  # Initialize empty container
+        data[group] = {}  # Initialize empty container
 
         # Rate
-        data[i] = _eventrelated_rate(epochs[i], data[i], var="ECG_Rate")
+        data[group] = _eventrelated_rate(group, data[group], var="ECG_Rate")
 
         # Cardiac Phase
-        data[i] = _ecg_eventrelated_phase(epochs[i], data[i])
+        data[group] = _ecg_eventrelated_phase(group, data[group])
 
         # Quality
-        data[i] = _ecg_eventrelated_quality(epochs[i], data[i])
+        data[group] = _ecg_eventrelated_quality(group, data[group])
 
         # Fill with more info
-        data[i] = _eventrelated_addinfo(epochs[i], data[i])
+        data[group] = _eventrelated_addinfo(group, data[group])
 
     # Return dataframe
     return _eventrelated_sanitizeoutput(data)
@@ -134,10 +136,10 @@ def ecg_eventrelated(epochs, silent=False):
 # =============================================================================
 
 
-def _ecg_eventrelated_phase(epoch, output={}):
+def _ecg_eventrelated_phase(group, output={}):
 
     # Sanitize input
-    if "ECG_Phase_Atrial" not in epoch or "ECG_Phase_Ventricular" not in epoch:
+    if "ECG_Phase_Atrial" not in group or "ECG_Phase_Ventricular" not in group:
         warn(
             "Input does not have an `ECG_Phase_Artrial` or `ECG_Phase_Ventricular` column."
             " Will not indicate whether event onset concurs with cardiac phase.",
@@ -145,22 +147,24 @@ def _ecg_eventrelated_phase(epoch, output={}):
         )
         return output
 
+    # First sample after the onset
+    onset = np.argmax(group.time > 0)
+
     # Indication of atrial systole
-    output["ECG_Phase_Atrial"] = epoch["ECG_Phase_Atrial"][epoch.index > 0].iloc[0]
-    output["ECG_Phase_Completion_Atrial"] = epoch["ECG_Phase_Completion_Atrial"][epoch.index > 0].iloc[0]
+    output["ECG_Phase_Atrial"] = group.at("ECG_Phase_Atrial", onset)
+    output["ECG_Phase_Completion_Atrial"] = group.at("ECG_Phase_Completion_Atrial", onset)
 
     # Indication of ventricular systole
-    output["ECG_Phase_Ventricular"] = epoch["ECG_Phase_Ventricular"][epoch.index > 0].iloc[0]
-    output["ECG_Phase_Completion_Ventricular"] = epoch["ECG_Phase_Completion_Ventricular"][epoch.index > 0].iloc[0]
+    output["ECG_Phase_Ventricular"] = group.at("ECG_Phase_Ventricular", onset)
+    output["ECG_Phase_Completion_Ventricular"] = group.at("ECG_Phase_Completion_Ventricular", onset)
 
     return output
 
 
-def _ecg_eventrelated_quality(epoch, output={}):
+def _ecg_eventrelated_quality(group, output={}):
 
     # Sanitize input
-    colnames = epoch.columns.values
-    if len([i for i in colnames if "ECG_Quality" in i]) == 0:
+    if len([i for i in group.columns if "ECG_Quality" in i]) == 0:
         warn(
             "Input does not have an `ECG_Quality` column."
             " Quality of the signal is not computed.",
@@ -168,7 +172,9 @@ def _ecg_eventrelated_quality(epoch, output={}):
         )
         return output
 
-    # Average signal quality over epochs
-    output["ECG_Quality_Mean"] = epoch["ECG_Quality"].mean()
+    # Average signal quality over epochs (ignoring missing values)
+    quality = np.asarray(group["ECG_Quality"], dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        output["ECG_Quality_Mean"] = np.nansum(quality, axis=1) / np.sum(~np.isnan(quality), axis=1)
 
     return output
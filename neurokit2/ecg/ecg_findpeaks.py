@@ -336,16 +336,16 @@ def _ecg_findpeaks_nabian2018(signal, sampling_rate=1000):
     """
     window_size = int(0.4 * sampling_rate)
 
-    peaks = np.zeros(len(signal))
+    # A sample i is marked when the sample following it is the (first) maximum of the window
+    # [i - window_size, i + window_size[, i.e., when it is the maximum of the whole window and
+    # strictly greater than all the samples preceding it in the window.
+    window_max = _ecg_findpeaks_rollingmax(signal, 2 * window_size)
+    before_max = _ecg_findpeaks_rollingmax(signal, window_size + 1)
 
-    for i in range(1+window_size, len(signal)-window_size):
-        ecg_window = signal[i-window_size:i+window_size]
-        rpeak = np.argmax(ecg_window)
+    i = np.arange(1 + window_size, len(signal) - window_size)
+    peaks = (signal[i + 1] == window_max[i + window_size - 1]) & (before_max[i] < signal[i + 1])
 
-        if i == (i-window_size-1+rpeak):
-            peaks[i] = 1
-
-    rpeaks = np.where(peaks == 1)[0]
+    rpeaks = i[peaks]
 
     # min_distance = 200
 
@@ -370,6 +370,10 @@ def _ecg_findpeaks_hamilton(signal, sampling_rate=1000):
 
     ma[0 : len(b) * 2] = 0
 
+    # The thresholds are only updated at local maxima
+    peaks = _ecg_findpeaks_localmax(ma)
+    ma = ma.tolist()
+
     n_pks = []
     n_pks_ave = 0.0
     s_pks = []
@@ -380,46 +384,39 @@ def _ecg_findpeaks_hamilton(signal, sampling_rate=1000):
 
     th = 0.0
 
-    i = 0
     idx = []
-    peaks = []
-
-    for i in range(len(ma)):  # pylint: disable=C0200,R1702
-
-        if i > 0 and i < len(ma) - 1 and ma[i - 1] < ma[i] and ma[i + 1] < ma[i]:  # pylint: disable=R1716
-            peak = i
-            peaks.append(peak)
-            if ma[peak] > th and (peak - QRS[-1]) > 0.3 * sampling_rate:
-                QRS.append(peak)
-                idx.append(peak)
-                s_pks.append(ma[peak])
-                if len(n_pks) > 8:
-                    s_pks.pop(0)
-                s_pks_ave = np.mean(s_pks)
-
-                if RR_ave != 0.0 and QRS[-1] - QRS[-2] > 1.5 * RR_ave:
-                    missed_peaks = peaks[idx[-2] + 1 : idx[-1]]
-                    for missed_peak in missed_peaks:
-                        if missed_peak - peaks[idx[-2]] > int(0.360 * sampling_rate) and ma[missed_peak] > 0.5 * th:
-                            QRS.append(missed_peak)
-                            QRS.sort()
-                            break
-
-                if len(QRS) > 2:
-                    RR.append(QRS[-1] - QRS[-2])
-                    if len(RR) > 8:
-                        RR.pop(0)
-                    RR_ave = int(np.mean(RR))
 
-            else:
-                n_pks.append(ma[peak])
-                if len(n_pks) > 8:
-                    n_pks.pop(0)
-                n_pks_ave = np.mean(n_pks)
+    for k, peak in enumerate(peaks):  # pylint: disable=R1702
+
+        if ma[peak] > th and (peak - QRS[-1]) > 0.3 * sampling_rate:
+            QRS.append(peak)
+            idx.append(peak)
+            s_pks.append(ma[peak])
+            if len(n_pks) > 8:
+                s_pks.pop(0)
+            s_pks_ave = np.mean(s_pks)
+
+            if RR_ave != 0.0 and QRS[-1] - QRS[-2] > 1.5 * RR_ave:
+                missed_peaks = peaks[: k + 1][idx[-2] + 1 : idx[-1]]
+                for missed_peak in missed_peaks:
+                    if missed_peak - peaks[idx[-2]] > int(0.360 * sampling_rate) and ma[missed_peak] > 0.5 * th:
+                        QRS.append(missed_peak)
+                        QRS.sort()
+                        break
 
-            th = n_pks_ave + 0.45 * (s_pks_ave - n_pks_ave)
+            if len(QRS) > 2:
+                RR.append(QRS[-1] - QRS[-2])
+                if len(RR) > 8:
+                    RR.pop(0)
+                RR_ave = int(np.mean(RR))
 
-            i += 1
+        else:
+            n_pks.append(ma[peak])
+            if len(n_pks) > 8:
+                n_pks.pop(0)
+            n_pks_ave = np.mean(n_pks)
+
+        th = n_pks_ave + 0.45 * (s_pks_ave - n_pks_ave)
 
     QRS.pop(0)
 
@@ -503,12 +500,7 @@ def _ecg_findpeaks_christov(signal, sampling_rate=1000):
 
     MA2 = scipy.signal.lfilter(b, a, MA1)
 
-    Y = []
-    for i in range(1, len(MA2) - 1):
-
-        diff = abs(MA2[i + 1] - MA2[i - 1])
-
-        Y.append(diff)
+    Y = np.abs(MA2[2:] - MA2[:-2])
 
     b = np.ones(int(0.040 * sampling_rate))
     b = b / int(0.040 * sampling_rate)
@@ -524,80 +516,88 @@ def _ecg_findpeaks_christov(signal, sampling_rate=1000):
     ms1200 = int(1.2 * sampling_rate)
     ms350 = int(0.35 * sampling_rate)
 
+    # Running maximum (used for the first 5 seconds)
+    MA3_max = np.maximum.accumulate(MA3).tolist()
+
+    # F: cumulated difference between the maximum of the latest and earliest 50 ms of the
+    # preceding 350 ms
+    F = np.zeros(len(MA3))
+    if len(MA3) > ms350 + 1:
+        window_max = _ecg_findpeaks_rollingmax(MA3, ms50)
+        i = np.arange(ms350 + 1, len(MA3))
+        F[ms350 + 1 :] = (window_max[i - 1] - window_max[i - ms350 + ms50 - 1]) / 150.0
+    F = np.cumsum(F).tolist()
+
     M = 0
     newM5 = 0
-    M_list = []
+    newM5_max = None  # Running maximum since the last QRS
     MM = []
-    M_slope = np.linspace(1.0, 0.6, ms1200 - ms200)
-    F = 0
-    F_list = []
+    MM_mean = 0.0
+    M_slope = np.linspace(1.0, 0.6, ms1200 - ms200).tolist()
     R = 0
     RR = []
     Rm = 0
-    R_list = []
 
     MFR = 0
-    MFR_list = []
 
     QRS = []
+    last = None  # Last QRS
+    MA3 = MA3.tolist()
 
     for i in range(len(MA3)):  # pylint: disable=C0200
 
         # M
         if i < 5 * sampling_rate:
-            M = 0.6 * np.max(MA3[: i + 1])
+            M = 0.6 * MA3_max[i]
             MM.append(M)
             if len(MM) > 5:
                 MM.pop(0)
+            MM_mean = np.mean(MM)
 
-        elif QRS and i < QRS[-1] + ms200:
-            newM5 = 0.6 * np.max(MA3[QRS[-1] : i])
+        elif QRS and i < last + ms200:
+            if newM5_max is None or newM5_max[0] != last:
+                newM5_max = [last, max(MA3[last:i])]
+            else:
+                newM5_max[1] = max(newM5_max[1], MA3[i - 1])
+            newM5 = 0.6 * newM5_max[1]
             if newM5 > 1.5 * MM[-1]:
                 newM5 = 1.1 * MM[-1]
 
-        elif QRS and i == QRS[-1] + ms200:
+        elif QRS and i == last + ms200:
             if newM5 == 0:
                 newM5 = MM[-1]
             MM.append(newM5)
             if len(MM) > 5:
                 MM.pop(0)
-            M = np.mean(MM)
-
-        elif QRS and i > QRS[-1] + ms200 and i < QRS[-1] + ms1200:
+            MM_mean = np.mean(MM)
+            M = MM_mean
 
-            M = np.mean(MM) * M_slope[i - (QRS[-1] + ms200)]
+        elif QRS and i > last + ms200 and i < last + ms1200:
 
-        elif QRS and i > QRS[-1] + ms1200:
-            M = 0.6 * np.mean(MM)
+            M = MM_mean * M_slope[i - (last + ms200)]
 
-        # F
-        if i > ms350:
-            F_section = MA3[i - ms350 : i]
-            max_latest = np.max(F_section[-ms50:])
-            max_earliest = np.max(F_section[:ms50])
-            F += (max_latest - max_earliest) / 150.0
+        elif QRS and i > last + ms1200:
+            M = 0.6 * MM_mean
 
         # R
-        if QRS and i < QRS[-1] + int((2.0 / 3.0 * Rm)):
+        if QRS and i < last + int((2.0 / 3.0 * Rm)):
 
             R = 0
 
-        elif QRS and i > QRS[-1] + int((2.0 / 3.0 * Rm)) and i < QRS[-1] + Rm:
+        elif QRS and i > last + int((2.0 / 3.0 * Rm)) and i < last + Rm:
 
-            dec = (M - np.mean(MM)) / 1.4
+            dec = (M - MM_mean) / 1.4
             R = 0 + dec
 
-        MFR = M + F + R
-        M_list.append(M)
-        F_list.append(F)
-        R_list.append(R)
-        MFR_list.append(MFR)
+        MFR = M + F[i] + R
 
         if not QRS and MA3[i] > MFR:
             QRS.append(i)
+            last = i
 
-        elif QRS and i > QRS[-1] + ms200 and MA3[i] > MFR:
+        elif QRS and i > last + ms200 and MA3[i] > MFR:
             QRS.append(i)
+            last = i
             if len(QRS) > 2:
                 RR.append(QRS[-1] - QRS[-2])
                 if len(RR) > 5:
@@ -669,8 +669,7 @@ def _ecg_findpeaks_engzee(signal, sampling_rate=1000):
     engzee_fake_delay = 0
 
     diff = np.zeros(len(signal))
-    for i in range(4, len(diff)):
-        diff[i] = signal[i] - signal[i - 4]
+    diff[4:] = signal[4:] - signal[:-4]
 
     ci = [1, 4, 6, 4, 1]
     low_pass = scipy.signal.lfilter(ci, 1, diff)
@@ -682,71 +681,79 @@ def _ecg_findpeaks_engzee(signal, sampling_rate=1000):
     ms160 = int(0.16 * sampling_rate)
     neg_threshold = int(0.01 * sampling_rate)
 
+    # Running maximum (used for the first 5 seconds)
+    low_pass_max = np.maximum.accumulate(low_pass).tolist()
+
     M = 0
-    M_list = []
-    neg_m = []
+    newM5_max = None  # Running maximum since the last QRS
     MM = []
-    M_slope = np.linspace(1.0, 0.6, ms1200 - ms200)
+    MM_mean = 0.0
+    M_slope = np.linspace(1.0, 0.6, ms1200 - ms200).tolist()
 
     QRS = []
+    last = None  # Last QRS
     r_peaks = []
 
     counter = 0
 
-    thi_list = []
+    thi_last = None  # Last threshold crossing
     thi = False
-    thf_list = []
     thf = False
 
+    low_pass = low_pass.tolist()
+
     for i in range(len(low_pass)):  # pylint: disable=C0200
 
         # M
         if i < 5 * sampling_rate:
-            M = 0.6 * np.max(low_pass[: i + 1])
+            M = 0.6 * low_pass_max[i]
             MM.append(M)
             if len(MM) > 5:
                 MM.pop(0)
+            MM_mean = np.mean(MM)
 
-        elif QRS and i < QRS[-1] + ms200:
+        elif QRS and i < last + ms200:
 
-            newM5 = 0.6 * np.max(low_pass[QRS[-1] : i])
+            if newM5_max is None or newM5_max[0] != last:
+                newM5_max = [last, max(low_pass[last:i])]
+            else:
+                newM5_max[1] = max(newM5_max[1], low_pass[i - 1])
+            newM5 = 0.6 * newM5_max[1]
 
             if newM5 > 1.5 * MM[-1]:
                 newM5 = 1.1 * MM[-1]
 
-        elif QRS and i == QRS[-1] + ms200:
-            MM.append(newM5)
+        elif QRS and i == last + ms200:
+            MM.append(newM5)  # pylint: disable=E0601
             if len(MM) > 5:
                 MM.pop(0)
-            M = np.mean(MM)
-
-        elif QRS and i > QRS[-1] + ms200 and i < QRS[-1] + ms1200:
+            MM_mean = np.mean(MM)
+            M = MM_mean
 
-            M = np.mean(MM) * M_slope[i - (QRS[-1] + ms200)]
+        elif QRS and i > last + ms200 and i < last + ms1200:
 
-        elif QRS and i > QRS[-1] + ms1200:
-            M = 0.6 * np.mean(MM)
+            M = MM_mean * M_slope[i - (last + ms200)]
 
-        M_list.append(M)
-        neg_m.append(-M)
+        elif QRS and i > last + ms1200:
+            M = 0.6 * MM_mean
 
         if not QRS and low_pass[i] > M:
             QRS.append(i)
-            thi_list.append(i)
+            last = i
+            thi_last = i
             thi = True
 
-        elif QRS and i > QRS[-1] + ms200 and low_pass[i] > M:
+        elif QRS and i > last + ms200 and low_pass[i] > M:
             QRS.append(i)
-            thi_list.append(i)
+            last = i
+            thi_last = i
             thi = True
 
-        if thi and i < thi_list[-1] + ms160:
+        if thi and i < thi_last + ms160:
             if low_pass[i] < -M and low_pass[i - 1] > -M:
-                # thf_list.append(i)
                 thf = True
 
             if thf and low_pass[i] < -M:
-                thf_list.append(i)
                 counter += 1
 
             elif low_pass[i] > -M and thf:
@@ -754,14 +761,14 @@ def _ecg_findpeaks_engzee(signal, sampling_rate=1000):
                 thi = False
                 thf = False
 
-        elif thi and i > thi_list[-1] + ms160:
+        elif thi and i > thi_last + ms160:
             counter = 0
             thi = False
             thf = False
 
         if counter > neg_threshold:
-            unfiltered_section = signal[thi_list[-1] - int(0.01 * sampling_rate) : i]
-            r_peaks.append(engzee_fake_delay + np.argmax(unfiltered_section) + thi_list[-1] - int(0.01 * sampling_rate))
+            unfiltered_section = signal[thi_last - int(0.01 * sampling_rate) : i]
+            r_peaks.append(engzee_fake_delay + np.argmax(unfiltered_section) + thi_last - int(0.01 * sampling_rate))
             counter = 0
             thi = False
             thf = False
@@ -841,18 +848,20 @@ def _ecg_findpeaks_elgendi(signal, sampling_rate=1000):
     blocks = np.zeros(len(signal))
     block_height = np.max(signal)
 
-    for i in range(len(mwa_qrs)):  # pylint: disable=C0200
-        blocks[i] = block_height if mwa_qrs[i] > mwa_beat[i] else 0
+    blocks[mwa_qrs > mwa_beat] = block_height
     QRS = []
 
-    for i in range(1, len(blocks)):
-        if blocks[i - 1] == 0 and blocks[i] == block_height:
+    # Only the onsets and offsets of the blocks matter
+    onsets = (blocks[:-1] == 0) & (blocks[1:] == block_height)
+    offsets = (blocks[:-1] == block_height) & (blocks[1:] == 0)
+    for i in np.where(onsets | offsets)[0] + 1:
+        if onsets[i - 1]:
             start = i
 
-        elif blocks[i - 1] == block_height and blocks[i] == 0:
+        else:
             end = i - 1
 
-            if end - start > int(0.08 * sampling_rate):
+            if end - start > int(0.08 * sampling_rate):  # pylint: disable=E0601
                 detection = np.argmax(signal[start : end + 1]) + start
                 if QRS:
                     if detection - QRS[-1] > int(0.3 * sampling_rate):
@@ -960,8 +969,8 @@ def _ecg_findpeaks_rodrigues(signal, sampling_rate=1000):
     Ramptotal = 0
 
     # Double derivative squared
-    diff_ecg = [signal[i] - signal[i - Nd] for i in range(Nd, len(signal))]
-    ddiff_ecg = [diff_ecg[i] - diff_ecg[i - 1] for i in range(1, len(diff_ecg))]
+    diff_ecg = signal[Nd:] - signal[: len(signal) - Nd]
+    ddiff_ecg = np.diff(diff_ecg)
     squar = np.square(ddiff_ecg)
 
     # Integrate moving window
@@ -969,18 +978,21 @@ def _ecg_findpeaks_rodrigues(signal, sampling_rate=1000):
     a = [1]
     processed_ecg = scipy.signal.lfilter(b, a, squar)
 
+    # Threshold decay per sample
+    decay = np.exp(-Pth / sampling_rate)
+
     # R-peak finder FSM
     while i < tf - sampling_rate:  # ignore last second of recording
 
         # State 1: looking for maximum
         tf1 = np.round(i + Rmin * sampling_rate)
+        end = max(i, int(np.ceil(tf1)))
         Rpeakamp = 0
-        while i < tf1:
-            # Rpeak amplitude and position
-            if processed_ecg[i] > Rpeakamp:
-                Rpeakamp = processed_ecg[i]
-                rpeakpos = i + 1
-            i += 1
+        if end > i and np.max(processed_ecg[i:end]) > Rpeakamp:
+            # Rpeak amplitude and position (first maximum)
+            rpeakpos = i + np.argmax(processed_ecg[i:end]) + 1
+            Rpeakamp = processed_ecg[rpeakpos - 1]
+        i = end
 
         Ramptotal = (19 / 20) * Ramptotal + (1 / 20) * Rpeakamp
         rpeaks.append(rpeakpos)
@@ -988,14 +1000,21 @@ def _ecg_findpeaks_rodrigues(signal, sampling_rate=1000):
         # State 2: waiting state
         d = tf1 - rpeakpos
         tf2 = i + np.round(0.2 * 2 - d)
-        while i <= tf2:
-            i += 1
+        if i <= tf2:
+            i = int(np.floor(tf2)) + 1
 
-        # State 3: decreasing threshold
+        # State 3: decreasing threshold (the threshold is decayed block-wise in the same order as
+        # sample-wise, until the signal reaches it)
         Thr = Ramptotal
-        while processed_ecg[i] < Thr:
-            Thr *= np.exp(-Pth / sampling_rate)
-            i += 1
+        while i < len(processed_ecg):
+            block = processed_ecg[i : i + sampling_rate]
+            thresholds = np.cumprod(np.concatenate([[Thr], np.full(len(block) - 1, decay)]))
+            above = np.where(block >= thresholds)[0]
+            if len(above) > 0:
+                i += above[0]
+                break
+            Thr = thresholds[-1] * decay
+            i += len(block)
 
     return rpeaks
 
@@ -1011,25 +1030,30 @@ def _ecg_findpeaks_MWA(signal, window_size):
     mwa = np.zeros(len(signal))
     sums = np.cumsum(signal)
 
-    def get_mean(begin, end):
-        if begin == 0:
-            return sums[end - 1] / end
+    # Mean of the samples preceding each sample (the first sample is kept as is)
+    begin = np.arange(1, min(window_size, len(signal)))
+    mwa[begin] = sums[begin - 1] / begin
+    if len(signal) > 0:
+        mwa[0] = signal[0]
 
-        dif = sums[end - 1] - sums[begin - 1]
-        return dif / (end - begin)
+    # Mean of the window_size samples preceding each sample
+    if window_size < len(signal):
+        mwa[window_size] = sums[window_size - 1] / window_size
+        mwa[window_size + 1 :] = (sums[window_size:-1] - sums[: -window_size - 1]) / window_size
 
-    for i in range(len(signal)):  # pylint: disable=C0200
-        if i < window_size:
-            section = signal[0:i]
-        else:
-            section = get_mean(i - window_size, i)
+    return mwa
 
-        if i != 0:
-            mwa[i] = np.mean(section)
-        else:
-            mwa[i] = signal[i]
 
-    return mwa
+def _ecg_findpeaks_localmax(signal):
+    """Indices of the samples strictly greater than both their neighbours."""
+    signal = np.asarray(signal)
+    peaks = np.where((signal[1:-1] > signal[:-2]) & (signal[1:-1] > signal[2:]))[0] + 1
+    return peaks.tolist()
+
+
+def _ecg_findpeaks_rollingmax(signal, window_size):
+    """Maximum of the window_size samples ending at each sample (of the available samples at the start)."""
+    return pd.Series(signal).rolling(window_size, min_periods=1).max().values
 
 
 def _ecg_findpeaks_peakdetect(detection, sampling_rate=1000):
@@ -1046,51 +1070,47 @@ def _ecg_findpeaks_peakdetect(detection, sampling_rate=1000):
     threshold_I2 = 0.0
 
     RR_missed = 0
-    index = 0
     indexes = []
 
     missed_peaks = []
-    peaks = []
-
-    for i in range(len(detection)):  # pylint: disable=R1702,C0200
-
-        # pylint: disable=R1716
-        if i > 0 and i < len(detection) - 1 and detection[i - 1] < detection[i] and detection[i + 1] < detection[i]:
-            peak = i
-            peaks.append(peak)  # pylint: disable=R1716
-            if detection[peak] > threshold_I1 and (peak - signal_peaks[-1]) > 0.3 * sampling_rate:
-
-                signal_peaks.append(peak)
-                indexes.append(index)
-                SPKI = 0.125 * detection[signal_peaks[-1]] + 0.875 * SPKI
-                if RR_missed != 0 and signal_peaks[-1] - signal_peaks[-2] > RR_missed:
-                    missed_section_peaks = peaks[indexes[-2] + 1 : indexes[-1]]
-                    missed_section_peaks2 = []
-                    for missed_peak in missed_section_peaks:
-                        if missed_peak - signal_peaks[-2] > min_distance:
-                            if signal_peaks[-1] - missed_peak > min_distance:
-                                if detection[missed_peak] > threshold_I2:
-                                    missed_section_peaks2.append(missed_peak)
-
-                    if missed_section_peaks2:
-                        missed_peak = missed_section_peaks2[np.argmax(detection[missed_section_peaks2])]
-                        missed_peaks.append(missed_peak)
-                        signal_peaks.append(signal_peaks[-1])
-                        signal_peaks[-2] = missed_peak
 
-            else:
-                noise_peaks.append(peak)
-                NPKI = 0.125 * detection[noise_peaks[-1]] + 0.875 * NPKI
+    # The thresholds are only updated at local maxima
+    peaks = _ecg_findpeaks_localmax(detection)
+    detection = np.asarray(detection)
 
-            threshold_I1 = NPKI + 0.25 * (SPKI - NPKI)
-            threshold_I2 = 0.5 * threshold_I1
+    for index, peak in enumerate(peaks):  # pylint: disable=R1702
 
-            if len(signal_peaks) > 8:
-                RR = np.diff(signal_peaks[-9:])
-                RR_ave = int(np.mean(RR))
-                RR_missed = int(1.66 * RR_ave)
+        if detection[peak] > threshold_I1 and (peak - signal_peaks[-1]) > 0.3 * sampling_rate:
+
+            signal_peaks.append(peak)
+            indexes.append(index)
+            SPKI = 0.125 * detection[signal_peaks[-1]] + 0.875 * SPKI
+            if RR_missed != 0 and signal_peaks[-1] - signal_peaks[-2] > RR_missed:
+                missed_section_peaks = peaks[indexes[-2] + 1 : indexes[-1]]
+                missed_section_peaks2 = []
+                for missed_peak in missed_section_peaks:
+                    if missed_peak - signal_peaks[-2] > min_distance:
+                        if signal_peaks[-1] - missed_peak > min_distance:
+                            if detection[missed_peak] > threshold_I2:
+                                missed_section_peaks2.append(missed_peak)
+
+                if missed_section_peaks2:
+                    missed_peak = missed_section_peaks2[np.argmax(detection[missed_section_peaks2])]
+                    missed_peaks.append(missed_peak)
+                    signal_peaks.append(signal_peaks[-1])
+                    signal_peaks[-2] = missed_peak
+
+        else:
+            noise_peaks.append(peak)
+            NPKI = 0.125 * detection[noise_peaks[-1]] + 0.875 * NPKI
+
+        threshold_I1 = NPKI + 0.25 * (SPKI - NPKI)
+        threshold_I2 = 0.5 * threshold_I1
 
-            index += 1
+        if len(signal_peaks) > 8:
+            RR = np.diff(signal_peaks[-9:])
+            RR_ave = int(np.mean(RR))
+            RR_missed = int(1.66 * RR_ave)
 
     signal_peaks.pop(0)
 
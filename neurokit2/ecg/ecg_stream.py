@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pandas as pd
+import scipy.signal
+
+
+class ECGStream:
+    """Real-time (streaming) ECG processing.
+
+    Stateful equivalent of the 'neurokit' pipeline of ``ecg_clean()`` and ``ecg_findpeaks()``, which
+    processes the ECG signal chunk by chunk (for instance, as it comes from a bedside monitor), and
+    returns the R-peaks (with the instantaneous heart rate and a quality index) as soon as they are
+    confirmed. The state of the filters is kept between chunks, and only a bounded amount of signal
+    (a few seconds) is kept in memory, so that it can run indefinitely.
+
+    The main differences with the batch processing are:
+
+    - The highpass Butterworth filter is applied causally (the batch version applies it forward and
+      backward). The powerline filter and the smoothings of the peak detector are zero-phase, but
+      delayed by half their length.
+    - The minimum QRS length used to discard spurious QRS complexes is based on the QRS complexes
+      detected so far (the batch version uses all the QRS complexes of the recording).
+    - The R-peaks are not corrected for artifacts (see ``signal_fixpeaks()``).
+    - The quality index of each heartbeat is its (absolute) average standardized distance from the
+      heartbeats detected so far, rescaled by the smallest and largest distances seen so far (so
+      that 1 corresponds to the most typical heartbeat, see ``ecg_quality()``).
+
+    The R-peaks are confirmed with a latency of about ``0.5 * avgwindow + 0.5 * smoothwindow`` seconds,
+    and returned when the heartbeat (until 0.5 s after the R-peak) is complete.
+
+    Parameters
+    ----------
+    sampling_rate : int
+        The sampling frequency of the ECG signal (in Hz, i.e., samples/second).
+    powerline : int
+        The frequency of the powerline noise to remove (in Hz). Defaults to 50.
+    smoothwindow : float
+        Size (in seconds) of the window used to smooth the gradient (see ``ecg_findpeaks()``).
+    avgwindow : float
+        Size (in seconds) of the window used to average the smoothed gradient (see ``ecg_findpeaks()``).
+    gradthreshweight : float
+        Weight applied to the averaged gradient to obtain the QRS threshold.
+    minlenweight : float
+        Weight applied to the average length of the QRS complexes to obtain their minimum length.
+    mindelay : float
+        Minimum delay (in seconds) between two R-peaks.
+    window : float
+        Maximum duration (in seconds) of signal kept in memory.
+
+    Returns
+    -------
+    ECGStream
+        The stream, to which chunks of raw ECG signal are fed with its ``update()`` method.
+
+    See Also
+    --------
+    ecg_clean, ecg_findpeaks, ecg_process, ecg_quality, signal_rate
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import pandas as pd
+    >>> import neurokit2 as nk
+    >>>
+    >>> ecg = nk.ecg_simulate(duration=20, sampling_rate=500, heart_rate=70, random_state=42)
+    >>>
+    >>> stream = nk.ECGStream(sampling_rate=500)
+    >>> beats = [stream.update(chunk) for chunk in np.array_split(ecg, 40)]
+    >>> beats.append(stream.flush())
+    >>> beats = pd.concat(beats, ignore_index=True)
+    >>> beats.columns.tolist()
+    ['ECG_R_Peaks', 'ECG_Rate', 'ECG_Quality']
+
+    """
+
+    def __init__(
+        self,
+        sampling_rate=1000,
+        powerline=50,
+        smoothwindow=0.1,
+        avgwindow=0.75,
+        gradthreshweight=1.5,
+        minlenweight=0.4,
+        mindelay=0.3,
+        window=10,
+    ):
+        self.sampling_rate = sampling_rate
+        self.gradthreshweight = gradthreshweight
+        self.minlenweight = minlenweight
+        self.mindelay = int(np.rint(sampling_rate * mindelay))
+        self.window = int(np.rint(sampling_rate * window))
+
+        # Highpass Butterworth (as in ecg_clean(method="neurokit"))
+        self._sos = scipy.signal.butter(5, [0.5], btype="highpass", output="sos", fs=sampling_rate)
+        self._zi = None
+
+        # Powerline: moving average applied forward and backward (i.e., a triangular kernel)
+        if sampling_rate >= 100:
+            powerline_kernel = np.ones(int(sampling_rate / powerline))
+        else:
+            powerline_kernel = np.ones(2)
+        powerline_kernel = np.convolve(powerline_kernel, powerline_kernel) / len(powerline_kernel) ** 2
+
+        smooth_kernel = int(np.rint(smoothwindow * sampling_rate))
+        avg_kernel = int(np.rint(avgwindow * sampling_rate))
+        self._powerline = _ECGStreamFilter(powerline_kernel, len(powerline_kernel) // 2)
+        self._gradient = _ECGStreamFilter(np.array([0.5, 0, -0.5]), 1)
+        self._smooth = _ECGStreamFilter(np.ones(smooth_kernel) / smooth_kernel, smooth_kernel // 2)
+        self._avg = _ECGStreamFilter(np.ones(avg_kernel) / avg_kernel, avg_kernel // 2)
+
+        # Buffers (and the index of their first sample)
+        self._clean = np.array([])
+        self._clean_start = 0
+        self._smoothgrad = np.array([])
+        self._smoothgrad_start = 0
+        self._n_qrs = 0  # Number of samples for which the QRS state is known
+        self._n_samples = 0  # Number of raw samples received
+        self._last_sample = 0
+
+        # State of the QRS detection
+        self._qrs_previous = True
+        self._qrs_beg = None
+        self._qrs_lengths = [0, 0]  # Sum and number of the QRS lengths
+        self._last_peak = 0
+
+        # Heartbeats
+        self._beat_start = int(np.rint(0.35 * sampling_rate))
+        self._beat_end = int(np.rint(0.5 * sampling_rate))
+        self._pending = []
+        self._previous_peak = None
+        self._beats = [0, None, None]  # Number of heartbeats, their mean and sum of squares
+        self._dist_range = [np.inf, -np.inf]
+
+    def update(self, ecg_signal):
+        """Process a new chunk of raw ECG signal.
+
+        Parameters
+        ----------
+        ecg_signal : Union[list, np.array, pd.Series]
+            The new samples of the raw ECG channel.
+
+        Returns
+        -------
+        DataFrame
+            A DataFrame with one row per newly confirmed heartbeat, containing the location of the
+            R-peak ("ECG_R_Peaks", as the sample index since the beginning of the stream), the heart
+            rate since the previous R-peak ("ECG_Rate") and the quality of the heartbeat ("ECG_Quality").
+
+        """
+        ecg_signal = np.asarray(ecg_signal, dtype=float)
+        self._n_samples += len(ecg_signal)
+        if len(ecg_signal) == 0:
+            return self._emit()
+        self._last_sample = ecg_signal[-1]
+
+        # Clean
+        if self._zi is None:
+            self._zi = scipy.signal.sosfilt_zi(self._sos) * ecg_signal[0]
+        highpassed, self._zi = scipy.signal.sosfilt(self._sos, ecg_signal, zi=self._zi)
+        clean = self._powerline.update(highpassed)
+        self._clean = np.concatenate([self._clean, clean])
+
+        # Smoothed gradient and its average
+        smoothgrad = self._smooth.update(np.abs(self._gradient.update(clean)))
+        self._smoothgrad = np.concatenate([self._smoothgrad, smoothgrad])
+        avggrad = self._avg.update(smoothgrad)
+
+        # QRS complexes
+        smoothgrad = self._smoothgrad[self._n_qrs - self._smoothgrad_start :][: len(avggrad)]
+        qrs = smoothgrad > self.gradthreshweight * avggrad
+        self._update_qrs(qrs)
+        self._n_qrs += len(qrs)
+
+        self._trim()
+        return self._emit()
+
+    def flush(self):
+        """Process the end of the signal.
+
+        The signal is extended by repeating its last sample to get the last R-peaks out of the filters.
+
+        Returns
+        -------
+        DataFrame
+            The heartbeats confirmed by the end of the signal (see ``update()``).
+
+        """
+        n_samples = self._n_samples
+        if n_samples == 0:
+            return self._emit()
+        delay = self._avg.delay + self._smooth.delay + self._gradient.delay + self._powerline.delay + 1
+        beats = [
+            self.update(np.full(delay, self._last_sample)),
+            self.update(np.full(self._beat_end, self._last_sample)),
+        ]
+        beats = pd.concat(beats, ignore_index=True)
+        self._n_samples = n_samples
+        return beats[beats["ECG_R_Peaks"] < n_samples].reset_index(drop=True)
+
+    # =========================================================================
+    # Internals
+    # =========================================================================
+    def _update_qrs(self, qrs):
+        """Identify start and end of QRS complexes, and the R-peaks within them."""
+        qrs = np.concatenate([[self._qrs_previous], qrs])
+        self._qrs_previous = qrs[-1]
+
+        # Same definitions as ecg_findpeaks(): the beginning is the last sample before the QRS, and the
+        # end is its last sample
+        beg_qrs = np.where(np.logical_and(np.logical_not(qrs[0:-1]), qrs[1:]))[0]
+        end_qrs = np.where(np.logical_and(qrs[0:-1], np.logical_not(qrs[1:])))[0]
+        events = np.concatenate([beg_qrs, end_qrs])
+        is_beg = np.concatenate([np.ones(len(beg_qrs), dtype=bool), np.zeros(len(end_qrs), dtype=bool)])
+
+        for i in np.argsort(events, kind="mergesort"):
+            index = self._n_qrs - 1 + events[i]
+            if is_beg[i]:
+                self._qrs_beg = index
+            elif self._qrs_beg is not None:
+                self._find_peak(self._qrs_beg, index)
+                self._qrs_beg = None
+
+    def _find_peak(self, beg, end):
+        # Ignore QRS that are too short
+        self._qrs_lengths[0] += end - beg
+        self._qrs_lengths[1] += 1
+        if end - beg < self._qrs_lengths[0] / self._qrs_lengths[1] * self.minlenweight:
+            return
+
+        # Find local maxima and their prominence within QRS
+        data = self._clean[beg - self._clean_start : end - self._clean_start]
+        locmax, props = scipy.signal.find_peaks(data, prominence=(None, None))
+
+        if locmax.size > 0:
+            # Identify most prominent local maximum
+            peak = beg + locmax[np.argmax(props["prominences"])]
+            # Enforce minimum delay between peaks
+            if peak - self._last_peak > self.mindelay:
+                self._last_peak = peak
+                self._pending.append(peak)
+
+    def _emit(self):
+        """Return the heartbeats whose window is complete."""
+        n_clean = self._clean_start + len(self._clean)
+        peaks, rates, qualities = [], [], []
+        while len(self._pending) > 0 and self._pending[0] + self._beat_end <= n_clean:
+            peak = self._pending.pop(0)
+
+            # Rate
+            if self._previous_peak is None:
+                rates.append(np.nan)
+            else:
+                rates.append(60 * self.sampling_rate / (peak - self._previous_peak))
+            self._previous_peak = peak
+
+            # Quality
+            start = peak - self._beat_start - self._clean_start
+            if start >= 0:
+                qualities.append(self._quality(self._clean[start : peak + self._beat_end - self._clean_start]))
+            else:
+                qualities.append(np.nan)
+            peaks.append(peak)
+
+        return pd.DataFrame(
+            {"ECG_R_Peaks": np.array(peaks, dtype=int), "ECG_Rate": rates, "ECG_Quality": qualities}
+        )
+
+    def _quality(self, heartbeat):
+        # Update the running mean and sum of squares of the heartbeats (Welford's algorithm)
+        n, mean, m2 = self._beats
+        n += 1
+        if mean is None:
+            mean, m2 = heartbeat.copy(), np.zeros(len(heartbeat))
+        else:
+            delta = heartbeat - mean
+            mean = mean + delta / n
+            m2 = m2 + delta * (heartbeat - mean)
+        self._beats = [n, mean, m2]
+        if n < 2:
+            return 1.0
+
+        # Average standardized distance
+        std = np.sqrt(m2 / (n - 1))
+        std[std == 0] = np.nan
+        dist = np.abs(np.nanmean((heartbeat - mean) / std))
+        self._dist_range = [min(self._dist_range[0], dist), max(self._dist_range[1], dist)]
+        if self._dist_range[1] == self._dist_range[0]:
+            return 1.0
+        return 1 - (dist - self._dist_range[0]) / (self._dist_range[1] - self._dist_range[0])
+
+    def _trim(self):
+        """Only keep the part of the signal that can still be needed."""
+        needed = self._n_qrs - 1
+        if self._qrs_beg is not None:
+            needed = self._qrs_beg
+        if len(self._pending) > 0:
+            needed = min(needed, self._pending[0])
+        needed -= self._beat_start  # Beginning of the heartbeat
+
+        # Bound the memory (dropping the QRS complex if it has been going on for too long)
+        n_clean = self._clean_start + len(self._clean)
+        if n_clean - needed > self.window:
+            needed = n_clean - self.window
+            if self._qrs_beg is not None and self._qrs_beg < needed:
+                self._qrs_beg = None
+
+        if needed > self._clean_start:
+            self._clean = self._clean[needed - self._clean_start :]
+            self._clean_start = needed
+        if self._n_qrs > self._smoothgrad_start:
+            self._smoothgrad = self._smoothgrad[self._n_qrs - self._smoothgrad_start :]
+            self._smoothgrad_start = self._n_qrs
+
+
+class _ECGStreamFilter:
+    """Zero-phase FIR filter applied with a delay.
+
+    The output at a given sample is only returned once `kernel` minus `delay` samples after it have been
+    received. The beginning of the signal is extended by repeating its first sample.
+
+    """
+
+    def __init__(self, kernel, delay):
+        self.kernel = kernel
+        self.delay = delay
+        self._tail = None
+
+    def update(self, signal):
+        if len(signal) == 0:
+            return signal
+        if self._tail is None:
+            self._tail = np.full(self.delay, signal[0])
+
+        signal = np.concatenate([self._tail, signal])
+        self._tail = signal[max(0, len(signal) - (len(self.kernel) - 1)) :]
+        if len(signal) < len(self.kernel):
+            return np.array([])
+        return np.convolve(signal, self.kernel, mode="valid")
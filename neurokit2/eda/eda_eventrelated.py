@@ -77,37 +77,33 @@ def eda_eventrelated(epochs, silent=False):
     >>> nk.eda_eventrelated(epochs) #doctest: +SKIP
 
     """
-    # Sanity checks
-    epochs = _eventrelated_sanitizeinput(epochs, what="eda", silent=silent)
+    # Sanity checks (the epochs are stacked into groups of epochs sharing the same time and columns)
+    groups = _eventrelated_sanitizeinput(epochs, what="eda", silent=silent)
 
-    # Extract features and build dataframe
+    # Extract features (for all the epochs of a group at once) and build dataframe
     data = {}  # Initialize an empty dict
-    for i in epochs.keys():
+    for group in groups:
 
-        data[i] = {}  # Initialize an empty dict for the current epoch
+        data[group] = {}  # Initialize an empty dict for the current group of epochs
 
         # Maximum phasic amplitude
-        data[i] = _eda_eventrelated_eda(epochs[i], data[i])
+        data[group] = _eda_eventrelated_eda(group, data[group])
 
         # Detect activity following the events
-        if np.any(epochs[i]["SCR_Peaks"][epochs[i].index > 0] == 1) and np.any(
-            epochs[i]["SCR_Onsets"][epochs[i].index > 0] == 1
-        ):
-            data[i]["EDA_SCR"] = 1
-        else:
-            data[i]["EDA_SCR"] = 0
-
-        # Analyze based on if activations are present
-        if data[i]["EDA_SCR"] != 0:
-            data[i] = _eda_eventrelated_scr(epochs[i], data[i])
-        else:
-            data[i]["SCR_Peak_Amplitude"] = np.nan
-            data[i]["SCR_Peak_Amplitude_Time"] = np.nan
-            data[i]["SCR_RiseTime"] = np.nan
-            data[i]["SCR_RecoveryTime"] = np.nan
+        after = group.time > 0
+        activated = np.any(group["SCR_Peaks"][:, after] == 1, axis=1) & np.any(
+            group["SCR_Onsets"][:, after] == 1, axis=1
+        )
+        data[group]["EDA_SCR"] = activated.astype(int)
+
+        # Analyze based on if activations are present (nans otherwise)
+        for x in ["SCR_Peak_Amplitude", "SCR_Peak_Amplitude_Time", "SCR_RiseTime", "SCR_RecoveryTime"]:
+            data[group][x] = np.full(len(group), np.nan)
+        if np.any(activated):
+            data[group] = _eda_eventrelated_scr(group, data[group], activated)
 
         # Fill with more info
-        data[i] = _eventrelated_addinfo(epochs[i], data[i])
+        data[group] = _eventrelated_addinfo(group, data[group])
 
     df = _eventrelated_sanitizeoutput(data)
 
@@ -117,10 +113,10 @@ def eda_eventrelated(epochs, silent=False):
 # =============================================================================
 # Internals
 # =============================================================================
-def _eda_eventrelated_eda(epoch, output={}):
+def _eda_eventrelated_eda(group, output={}):
 
     # Sanitize input
-    if "EDA_Phasic" not in epoch:
+    if "EDA_Phasic" not in group:
         warn(
             "Input does not have an `EDA_Phasic` column."
             " Will skip computation of maximum amplitude of phasic EDA component.",
@@ -128,14 +124,14 @@ def _eda_eventrelated_eda(epoch, output={}):
         )
         return output
 
-    output["EDA_Peak_Amplitude"] = epoch["EDA_Phasic"].max()
+    output["EDA_Peak_Amplitude"] = np.fmax.reduce(np.asarray(group["EDA_Phasic"], dtype=float), axis=1)
     return output
 
 
-def _eda_eventrelated_scr(epoch, output={}):
+def _eda_eventrelated_scr(group, output={}, activated=None):
 
     # Sanitize input
-    if "SCR_Amplitude" not in epoch:
+    if "SCR_Amplitude" not in group:
         warn(
             "Input does not have an `SCR_Amplitude` column."
             " Will skip computation of SCR peak amplitude.",
@@ -143,7 +139,7 @@ def _eda_eventrelated_scr(epoch, output={}):
         )
         return output
 
-    if "SCR_RecoveryTime" not in epoch:
+    if "SCR_RecoveryTime" not in group:
         warn(
             "Input does not have an `SCR_RecoveryTime` column."
             " Will skip computation of SCR half-recovery times.",
@@ -151,7 +147,7 @@ def _eda_eventrelated_scr(epoch, output={}):
         )
         return output
 
-    if "SCR_RiseTime" not in epoch:
+    if "SCR_RiseTime" not in group:
         warn(
             "Input does not have an `SCR_RiseTime` column."
             " Will skip computation of SCR rise times.",
@@ -159,21 +155,22 @@ def _eda_eventrelated_scr(epoch, output={}):
         )
         return output
 
+    if activated is None:
+        activated = np.full(len(group), True)
+    after = group.time > 0
+    rows = np.where(activated)[0]
+
     # Peak amplitude and Time of peak
-    first_activation = np.where(epoch["SCR_Amplitude"][epoch.index > 0] != 0)[0][0]
-    peak_amplitude = epoch["SCR_Amplitude"][epoch.index > 0].iloc[first_activation]
-    output["SCR_Peak_Amplitude"] = peak_amplitude
-    output["SCR_Peak_Amplitude_Time"] = epoch["SCR_Amplitude"][epoch.index > 0].index[first_activation]
+    amplitude = group["SCR_Amplitude"][rows][:, after]
+    first_activation = np.argmax(amplitude != 0, axis=1)
+    output["SCR_Peak_Amplitude"][rows] = amplitude[np.arange(len(rows)), first_activation]
+    output["SCR_Peak_Amplitude_Time"][rows] = group.time[after][first_activation]
 
     # Rise Time
-    rise_time = epoch["SCR_RiseTime"][epoch.index > 0].iloc[first_activation]
-    output["SCR_RiseTime"] = rise_time
+    output["SCR_RiseTime"][rows] = group["SCR_RiseTime"][rows][:, after][np.arange(len(rows)), first_activation]
 
     # Recovery Time
-    if any(epoch["SCR_RecoveryTime"][epoch.index > 0] != 0):
-        recovery_time = np.where(epoch["SCR_RecoveryTime"][epoch.index > 0] != 0)[0][0]
-        output["SCR_RecoveryTime"] = recovery_time
-    else:
-        output["SCR_RecoveryTime"] = np.nan
+    recovery = group["SCR_RecoveryTime"][rows][:, after] != 0
+    output["SCR_RecoveryTime"][rows] = np.where(np.any(recovery, axis=1), np.argmax(recovery, axis=1), np.nan)
 
     return output
@@ -51,39 +51,35 @@ def emg_eventrelated(epochs, silent=False):
     >>> nk.emg_eventrelated(epochs) #doctest: +SKIP
 
     """
-    # Sanity checks
-    epochs = _eventrelated_sanitizeinput(epochs, what="emg", silent=silent)
+    # Sanity checks (the epochs are stacked into groups of epochs sharing the same time and columns)
+    groups = _eventrelated_sanitizeinput(epochs, what="emg", silent=silent)
 
-    # Extract features and build dataframe
+    # Extract features (for all the epochs of a group at once) and build dataframe
     data = {}  # Initialize an empty dict
-    for i in epochs.keys():
+    for group in groups:
 
-        data[i] = {}  # Initialize an empty dict for the current epoch
+        data[group] = {}  # Initialize an empty dict for the current group of epochs
 
         # Activation following event
-        if "EMG_Onsets" not in epochs[i]:
+        if "EMG_Onsets" not in group:
             warn(
                 "Input does not have an `EMG_Onsets` column."
                 " Unable to process EMG features.",
                 category=NeuroKitWarning
             )
-            data[i]["EMG_Activation"] = 0
-        elif np.any(epochs[i]["EMG_Onsets"][epochs[i].index > 0] != 0):
-            data[i]["EMG_Activation"] = 1
+            activated = np.full(len(group), False)
         else:
-            data[i]["EMG_Activation"] = 0
+            activated = np.any(group["EMG_Onsets"][:, group.time > 0] != 0, axis=1)
+        data[group]["EMG_Activation"] = activated.astype(int)
 
-        # Analyze features based on activation
-        if data[i]["EMG_Activation"] == 1:
-            data[i] = _emg_eventrelated_features(epochs[i], data[i])
-        else:
-            data[i]["EMG_Amplitude_Mean"] = np.nan
-            data[i]["EMG_Amplitude_Max"] = np.nan
-            data[i]["EMG_Amplitude_Max_Time"] = np.nan
-            data[i]["EMG_Bursts"] = np.nan
+        # Analyze features based on activation (nans otherwise)
+        for x in ["EMG_Amplitude_Mean", "EMG_Amplitude_Max", "EMG_Amplitude_Max_Time", "EMG_Bursts"]:
+            data[group][x] = np.full(len(group), np.nan)
+        if np.any(activated):
+            data[group] = _emg_eventrelated_features(group, data[group], activated)
 
         # Fill with more info
-        data[i] = _eventrelated_addinfo(epochs[i], data[i])
+        data[group] = _eventrelated_addinfo(group, data[group])
 
     df = _eventrelated_sanitizeoutput(data)
 
@@ -93,10 +89,10 @@ def emg_eventrelated(epochs, silent=False):
 # =============================================================================
 # Internals
 # =============================================================================
-def _emg_eventrelated_features(epoch, output={}):
+def _emg_eventrelated_features(group, output={}, activated=None):
 
     # Sanitize input
-    if "EMG_Activity" not in epoch or "EMG_Amplitude" not in epoch:
+    if "EMG_Activity" not in group or "EMG_Amplitude" not in group:
         warn(
             "Input does not have an `EMG_Activity` column or `EMG_Amplitude` column."
             " Will skip computation of EMG amplitudes.",
@@ -104,18 +100,26 @@ def _emg_eventrelated_features(epoch, output={}):
         )
         return output
 
+    if activated is None:
+        activated = np.full(len(group), True)
+    after = group.time > 0
+    rows = np.where(activated)[0]
+
     # Peak amplitude and Time of peak
-    activations = len(np.where(epoch["EMG_Onsets"][epoch.index > 0] == 1)[0])
-    activated_signal = np.where(epoch["EMG_Activity"][epoch.index > 0] == 1)
-    mean = np.array(epoch["EMG_Amplitude"][epoch.index > 0].iloc[activated_signal]).mean()
-    maximum = np.array(epoch["EMG_Amplitude"][epoch.index > 0].iloc[activated_signal]).max()
-
-    index_time = np.where(epoch["EMG_Amplitude"][epoch.index > 0] == maximum)[0]
-    time = np.array(epoch["EMG_Amplitude"][epoch.index > 0].index[index_time])[0]
-
-    output["EMG_Amplitude_Mean"] = mean
-    output["EMG_Amplitude_Max"] = maximum
-    output["EMG_Amplitude_Max_Time"] = time
-    output["EMG_Bursts"] = activations
+    activations = np.sum(group["EMG_Onsets"][rows][:, after] == 1, axis=1)
+    activated_signal = group["EMG_Activity"][rows][:, after] == 1
+    amplitude = np.asarray(group["EMG_Amplitude"][rows][:, after], dtype=float)
+    n = np.sum(activated_signal, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.sum(np.where(activated_signal, amplitude, 0), axis=1) / n
+    maximum = np.where(n > 0, np.max(np.where(activated_signal, amplitude, -np.inf), axis=1), np.nan)
+
+    index_time = amplitude == maximum[:, np.newaxis]
+    time = np.where(np.any(index_time, axis=1), group.time[after][np.argmax(index_time, axis=1)], np.nan)
+
+    output["EMG_Amplitude_Mean"][rows] = mean
+    output["EMG_Amplitude_Max"][rows] = maximum
+    output["EMG_Amplitude_Max_Time"][rows] = time
+    output["EMG_Bursts"][rows] = activations
 
     return output
@@ -71,25 +71,25 @@ def eog_eventrelated(epochs, silent=False):
     [4 rows x 9 columns]
 
     """
-    # Sanity checks
-    epochs = _eventrelated_sanitizeinput(epochs, what="eog", silent=silent)
+    # Sanity checks (the epochs are stacked into groups of epochs sharing the same time and columns)
+    groups = _eventrelated_sanitizeinput(epochs, what="eog", silent=silent)
 
-    # Extract features and build dataframe
+    # Extract features (for all the epochs of a group at once) and build dataframe
     data = {}  # Initialize an empty dict
-    for i in epochs.keys():
+    for group in groups:
 
-        data[i] = {}  # Initialize an empty dict for the current epoch
+        data[group] = {}  # Initialize an empty dict for the current group of epochs
 
         # Rate
-        data[i] = _eventrelated_rate(epochs[i], data[i], var="EOG_Rate")
+        data[group] = _eventrelated_rate(group, data[group], var="EOG_Rate")
 
         # Number of blinks per epoch
-        data[i] = _eog_eventrelated_features(epochs[i], data[i])
+        data[group] = _eog_eventrelated_features(group, data[group])
         for x in ["EOG_Rate_Trend_Quadratic", "EOG_Rate_Trend_Linear", "EOG_Rate_Trend_R2"]:
-            data[i].pop(x, None)
+            data[group].pop(x, None)
 
         # Fill with more info
-        data[i] = _eventrelated_addinfo(epochs[i], data[i])
+        data[group] = _eventrelated_addinfo(group, data[group])
 
     df = _eventrelated_sanitizeoutput(data)
 
@@ -99,10 +99,10 @@ def eog_eventrelated(epochs, silent=False):
 # =============================================================================
 # Internals
 # =============================================================================
-def _eog_eventrelated_features(epoch, output={}):
+def _eog_eventrelated_features(group, output={}):
 
     # Sanitize input
-    if "EOG_Blinks" not in epoch:
+    if "EOG_Blinks" not in group:
         warn(
             "Input does not have an `EOG_Blinks` column."
             " Unable to process blink features.",
@@ -110,7 +110,7 @@ def _eog_eventrelated_features(epoch, output={}):
         )
         return output
 
-    if "EOG_Rate" not in epoch:
+    if "EOG_Rate" not in group:
         warn(
             "Input does not have an `EOG_Rate` column."
             " Will skip computation of EOG rate.",
@@ -119,11 +119,7 @@ def _eog_eventrelated_features(epoch, output={}):
         return output
 
     # Detect whether blink exists after onset of stimulus
-    blinks_presence = len(np.where(epoch["EOG_Blinks"][epoch.index > 0] == 1)[0])
-
-    if blinks_presence > 0:
-        output["EOG_Blinks_Presence"] = 1
-    else:
-        output["EOG_Blinks_Presence"] = 0
+    blinks_presence = np.sum(group["EOG_Blinks"][:, group.time > 0] == 1, axis=1)
+    output["EOG_Blinks_Presence"] = (blinks_presence > 0).astype(int)
 
     return output
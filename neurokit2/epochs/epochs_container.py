@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+from collections.abc import ItemsView, ValuesView
+
+import numpy as np
+import pandas as pd
+
+
+class Epochs(dict):
+    """Epochs container.
+
+    Container returned by ``epochs_create()``. It behaves like a dict containing one DataFrame per
+    epoch (indexed by the event labels), but the epochs are not copied out of the data: it only
+    stores the location of the epochs (and their metadata), and each epoch's DataFrame is created
+    when it is first accessed (and then stored, so that it can be modified in place). The numeric
+    (float) channels can be retrieved as arrays, either for one epoch (a view of the data if the
+    epoch lies within it, see ``get_array()``) or for all of them at once (as a 3D array, see
+    ``to_array()``).
+
+    Note that, as the epochs are views of the data, modifying the latter (in place) after the creation
+    of the epochs also modifies the epochs that have not been accessed yet.
+
+    Attributes
+    ----------
+    onset : np.ndarray
+        The onset of the events (in samples).
+    label : np.ndarray
+        The label of the events.
+    condition : np.ndarray
+        The condition of the events (None if not specified).
+    start : np.ndarray
+        The index of the first sample of each epoch.
+    end : np.ndarray
+        The index of the last sample (excluded) of each epoch.
+    columns : list
+        The name of the numeric (float) channels, i.e., the last dimension of the arrays.
+
+    See Also
+    ----------
+    epochs_create, epochs_to_array, epochs_to_df
+
+    Examples
+    ----------
+    >>> import neurokit2 as nk
+    >>>
+    >>> signal = nk.signal_simulate(duration=10, sampling_rate=100)
+    >>> epochs = nk.epochs_create(signal, events=[100, 400, 700], sampling_rate=100, epochs_end=1)
+    >>> epochs
+    <Epochs: 3 epochs, 1 channel(s)>
+    >>> epochs["1"].columns.tolist()
+    ['Signal', 'Index', 'Label']
+    >>> epochs.to_array().shape
+    (3, 100, 1)
+
+    """
+
+    def __init__(self, data, start, end, time_start, time_end, label, condition, onset, baseline=None):
+        super().__init__()
+        self.onset = np.asarray(onset)
+        self.label = np.array(label, dtype=object)
+        self.condition = np.asarray(condition, dtype=object)
+        self.start = np.asarray(start, dtype=int)
+        self.end = np.asarray(end, dtype=int)
+        self._time_start = np.asarray(time_start, dtype=float)
+        self._time_end = np.asarray(time_end, dtype=float)
+        self._baseline = baseline  # End of the baseline (None if no baseline correction)
+
+        # Source data (the float channels are stored as one 2D array, which is a view of the data if
+        # they are contiguous)
+        self._data = data
+        floats = [col for col in data.columns if pd.api.types.is_float_dtype(data[col].dtype)]
+        self.columns = floats
+        if len(floats) == len(data.columns):
+            self._values = data.to_numpy(dtype=float, copy=False)
+        else:
+            self._values = data[floats].to_numpy(dtype=float, copy=False)
+
+        for i, key in enumerate(label):
+            dict.__setitem__(self, key, i)
+
+    # -------------------------------------------------------------------------
+    # Dict interface
+    # -------------------------------------------------------------------------
+    def __getitem__(self, key):
+        i = dict.__getitem__(self, key)
+        if not isinstance(i, (int, np.integer)):  # Already accessed or replaced by the user
+            return i
+        # Store the DataFrame so that in-place modifications persist (as with a dict)
+        epoch = self._get_df(i)
+        dict.__setitem__(self, key, epoch)
+        return epoch
+
+    def __iter__(self):
+        # Overriding __iter__ disables the fast path of dict(epochs) and {**epochs}, which would
+        # otherwise copy the stored indices rather than the DataFrames
+        return dict.__iter__(self)
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def values(self):
+        return ValuesView(self)
+
+    def items(self):
+        return ItemsView(self)
+
+    def copy(self):
+        return _epochs_rebuild(self.__dict__, dict.items(self))
+
+    def __reduce__(self):
+        # Pickle the location of the epochs rather than their DataFrames
+        return _epochs_rebuild, (self.__dict__, list(dict.items(self)))
+
+    def __repr__(self):
+        return f"<Epochs: {len(self)} epochs, {len(self.columns)} channel(s)>"
+
+    def to_dict(self):
+        """Convert to a dict containing one DataFrame per epoch."""
+        return {key: self[key] for key in self.keys()}
+
+    # -------------------------------------------------------------------------
+    # Arrays
+    # -------------------------------------------------------------------------
+    def get_array(self, key):
+        """Get the float channels of an epoch as an array (samples x channels).
+
+        The array is a view of the data if the epoch lies within it (and if no baseline correction is
+        applied), and a copy padded with NaNs otherwise.
+        """
+        i = dict.__getitem__(self, key)
+        if not isinstance(i, (int, np.integer)):  # Already accessed or replaced by the user
+            return i[self.columns].values
+        start, end = self.start[i], self.end[i]
+        if start >= 0 and end <= len(self._values) and self._baseline is None:
+            return self._values[start:end]
+        return self._get_arrays([i])[0]
+
+    def to_array(self):
+        """Get the float channels of all the epochs as a 3D array (epochs x samples x channels).
+
+        The epochs must have the same length.
+        """
+        if not all(isinstance(i, (int, np.integer)) for i in dict.values(self)):
+            return np.array([self[key][self.columns].values for key in self.keys()])
+        return self._get_arrays([i for i in dict.values(self)])
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+    def _is_lazy(self):
+        """Whether the fast paths give the same output as the concatenation of the DataFrames.
+
+        That is the case if no epoch has been replaced by the user, if the labels and conditions are
+        strings (non-numeric), and if the baseline correction (if any) only concerns float channels.
+        """
+        if not all(isinstance(i, (int, np.integer)) for i in dict.values(self)):
+            return False
+        if not all(isinstance(i, str) for i in self.label):
+            return False
+        if not all(i is None or isinstance(i, str) for i in self.condition):
+            return False
+        return self._baseline is None or len(self.columns) == len(self._data.columns)
+
+    def _get_positions(self, indices):
+        """Get the sample indices of the epochs (epochs x samples) and whether they lie within the data."""
+        indices = np.asarray(indices, dtype=int)
+        lengths = self.end[indices] - self.start[indices]
+        if len(indices) > 0 and np.any(lengths != lengths[0]):
+            raise ValueError("NeuroKit error: Epochs: the epochs must have the same length.")
+        length = lengths[0] if len(indices) > 0 else 0
+        positions = self.start[indices, np.newaxis] + np.arange(length)
+        return positions, (positions >= 0) & (positions < len(self._values))
+
+    def _get_arrays(self, indices):
+        positions, valid = self._get_positions(indices)
+        arrays = self._values[np.clip(positions, 0, max(0, len(self._values) - 1))]
+        if not np.all(valid):
+            arrays[~valid] = np.nan
+
+        if self._baseline is not None:
+            indices = np.asarray(indices, dtype=int)
+            time_start, time_end = self._time_start[indices], self._time_end[indices]
+            if np.any(time_start != time_start[0]) or np.any(time_end != time_end[0]):
+                return np.array([self._get_df(i)[self.columns].values for i in indices])
+            times = np.linspace(time_start[0], time_end[0], num=positions.shape[1], endpoint=True)
+            baseline = arrays[:, times <= self._baseline]
+            counts = np.sum(~np.isnan(baseline), axis=1)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                arrays = arrays - np.nansum(baseline, axis=1, keepdims=True) / counts[:, np.newaxis]
+        return arrays
+
+    def _get_df(self, i):
+        """Create the DataFrame of an epoch."""
+        positions = np.arange(self.start[i], self.end[i])
+        valid = (positions >= 0) & (positions < len(self._data))
+        positions = positions[valid]
+
+        epoch = {}
+        for col in self._data.columns:
+            values = self._data[col].values
+            if pd.api.types.is_float_dtype(values.dtype):
+                epoch[col] = np.full(len(valid), np.nan)
+            else:
+                # Non-float channels are stored as objects (to hold the NaNs)
+                epoch[col] = np.full(len(valid), np.nan, dtype=object)
+            epoch[col][valid] = values[positions]
+        epoch = pd.DataFrame(epoch, columns=self._data.columns)
+
+        epoch["Index"] = np.arange(self.start[i], self.end[i])
+        epoch.index = np.linspace(self._time_start[i], self._time_end[i], num=len(epoch), endpoint=True)
+
+        if self._baseline is not None:
+            epoch = epoch - epoch.loc[: self._baseline].mean()
+
+        epoch["Label"] = self.label[i]
+        if self.condition[i] is not None:
+            epoch["Condition"] = self.condition[i]
+        return epoch
+
+    def _to_df(self):
+        """Concatenate the epochs into one DataFrame (the fast path of ``epochs_to_df()``)."""
+        indices = np.array([i for i in dict.values(self)], dtype=int)
+        lengths = self.end[indices] - self.start[indices]
+        offsets = np.cumsum(lengths) - lengths
+        positions = np.arange(np.sum(lengths)) - np.repeat(offsets - self.start[indices], lengths)
+        valid = (positions >= 0) & (positions < len(self._data))
+
+        data = {}
+        for col in self._data.columns:
+            values = self._data[col].values
+            if pd.api.types.is_float_dtype(values.dtype):
+                data[col] = np.full(len(valid), np.nan)
+            else:
+                data[col] = np.full(len(valid), np.nan, dtype=object)
+            data[col][valid] = values[positions[valid]]
+        data = pd.DataFrame(data, columns=self._data.columns)
+
+        data["Index"] = positions
+        data["Label"] = np.repeat(np.array(self.label[indices].tolist()), lengths)
+        conditions = np.array([np.nan if i is None else i for i in self.condition[indices]], dtype=object)
+        if np.any(self.condition[indices] != None):  # noqa: E711
+            data["Condition"] = np.repeat(conditions, lengths)
+        data["Time"] = np.concatenate(
+            [
+                np.linspace(self._time_start[i], self._time_end[i], num=n, endpoint=True)
+                for i, n in zip(indices, lengths)
+            ]
+        )
+        return data
+
+
+def _epochs_rebuild(attributes, items):
+    epochs = Epochs.__new__(Epochs)
+    epochs.__dict__.update(attributes)
+    dict.update(epochs, items)
+    return epochs
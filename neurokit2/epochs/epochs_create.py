@@ -4,6 +4,7 @@ import pandas as pd
 
 from ..events.events_find import _events_find_label
 from ..misc import listify
+from .epochs_container import Epochs
 
 
 def epochs_create(
@@ -47,13 +48,14 @@ def epochs_create(
 
     Returns
     ----------
-    dict
-        A dict containing DataFrames for all epochs.
+    Epochs
+        A dict containing DataFrames for all epochs (indexed by the event labels). The epochs are not
+        copied out of the data, but created when accessed (see ``Epochs``).
 
 
     See Also
     ----------
-    events_find, events_plot, epochs_to_df, epochs_plot
+    events_find, events_plot, epochs_to_df, epochs_plot, Epochs
 
     Examples
     ----------
@@ -89,7 +91,7 @@ def epochs_create(
         data = data[0]
 
     if isinstance(data, (list, np.ndarray, pd.Series)):
-        data = pd.DataFrame({"Signal": list(data)})
+        data = pd.DataFrame({"Signal": np.asarray(data)})
 
     # Sanitize events input
     if events is None:
@@ -114,41 +116,30 @@ def epochs_create(
     parameters["duration"] = np.array(parameters["end"]) - np.array(parameters["start"])
     epoch_max_duration = int(max((i * sampling_rate for i in parameters["duration"])))
 
-    # Extend data by the max samples in epochs * NaN (to prevent non-complete data)
+    # Locate the epochs, as if the data was extended by the max samples in epochs * NaN (to prevent
+    # non-complete data)
     length_buffer = epoch_max_duration
-    buffer = pd.DataFrame(index=range(length_buffer), columns=data.columns)
-    data = data.append(buffer, ignore_index=True, sort=False)
-    data = buffer.append(data, ignore_index=True, sort=False)
-
-    # Adjust the Onset of the events for the buffer
-    parameters["onset"] = [i + length_buffer for i in parameters["onset"]]
-
-    epochs = {}
-    for i, label in enumerate(parameters["label"]):
-
-        # Find indices
-        start = parameters["onset"][i] + (parameters["start"][i] * sampling_rate)
-        end = parameters["onset"][i] + (parameters["end"][i] * sampling_rate)
-
-        # Slice dataframe
-        epoch = data.iloc[int(start) : int(end)].copy()
-
-        # Correct index
-        epoch["Index"] = epoch.index.values - length_buffer
-        epoch.index = np.linspace(
-            start=parameters["start"][i], stop=parameters["end"][i], num=len(epoch), endpoint=True
-        )
-
-        if baseline_correction is True:
-            baseline_end = 0 if epochs_start <= 0 else epochs_start
-            epoch = epoch - epoch.loc[:baseline_end].mean()
-
-        # Add additional
-        epoch["Label"] = parameters["label"][i]
-        if parameters["condition"][i] is not None:
-            epoch["Condition"] = parameters["condition"][i]
-
-        # Store
-        epochs[label] = epoch
+    onsets = np.array(parameters["onset"]) + length_buffer
+    start = (onsets + np.array(parameters["start"]) * sampling_rate).astype(int)
+    end = (onsets + np.array(parameters["end"]) * sampling_rate).astype(int)
+    start = np.clip(start, 0, len(data) + 2 * length_buffer)
+    end = np.clip(end, start, len(data) + 2 * length_buffer)
+
+    if baseline_correction is True:
+        baseline_end = 0 if epochs_start <= 0 else epochs_start
+    else:
+        baseline_end = None
+
+    epochs = Epochs(
+        data,
+        start=start - length_buffer,
+        end=end - length_buffer,
+        time_start=parameters["start"],
+        time_end=parameters["end"],
+        label=parameters["label"],
+        condition=parameters["condition"],
+        onset=event_onsets,
+        baseline=baseline_end,
+    )
 
     return epochs
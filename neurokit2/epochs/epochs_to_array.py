@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 import numpy as np
 
+from .epochs_container import Epochs
+
 
 def epochs_to_array(epochs):
     """Convert epochs to an array.
@@ -10,7 +12,8 @@ def epochs_to_array(epochs):
     Parameters
     ----------
     epochs : dict
-        A dict containing one DataFrame per event/trial. Usually obtained via `epochs_create()`.
+        A dict containing one DataFrame per event/trial. Usually obtained via `epochs_create()`, in
+        which case the array is directly extracted from the data (see ``Epochs.to_array()``).
 
 
     Returns
@@ -37,6 +40,12 @@ def epochs_to_array(epochs):
     >>> nk.signal_plot(X.T)
 
     """
+    if isinstance(epochs, Epochs) and epochs._is_lazy():
+        array = np.moveaxis(epochs.to_array(), 0, -1)  # samples x channels x epochs
+        if array.shape[1] == 1:
+            array = array[:, 0, :]
+        return array
+
     example_array = epochs[list(epochs.keys())[0]].select_dtypes(include=["number"])
     if example_array.shape[1] == 2:
         array = np.full((example_array.shape[0], len(epochs)), np.nan)
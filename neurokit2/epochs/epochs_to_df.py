@@ -2,6 +2,8 @@
 import numpy as np
 import pandas as pd
 
+from .epochs_container import Epochs
+
 
 def epochs_to_df(epochs):
     """Convert epochs to a DataFrame.
@@ -43,6 +45,9 @@ def epochs_to_df(epochs):
     >>> data = nk.epochs_to_df(epochs)
 
     """
+    if isinstance(epochs, Epochs) and epochs._is_lazy() and epochs._baseline is None:
+        return epochs._to_df()
+
     data = pd.concat(epochs)
     data["Time"] = data.index.get_level_values(1).values
     data = data.reset_index(drop=True)
@@ -6,6 +6,7 @@ import pandas as pd
 
 from ..misc import NeuroKitWarning, find_closest
 from ..stats import fit_r2
+from .epochs_container import Epochs
 from .epochs_to_df import _df_to_epochs
 
 
@@ -21,9 +22,13 @@ def _eventrelated_sanitizeinput(epochs, what="ecg", silent=False):
             "or dataframe."
         )
 
+    # Stack the epochs sharing the same time and columns
+    groups = _eventrelated_groups(epochs)
+
     # Warning for long epochs
     if silent is False:
-        length_mean = np.mean([np.max(epochs[i].index) - np.min(epochs[i].index) for i in epochs.keys()])
+        lengths = [len(group) * (np.max(group.time) - np.min(group.time)) for group in groups]
+        length_mean = np.sum(lengths) / len(epochs)
         if length_mean > 10:
             warn(
                 str(what) + "_eventrelated():"
@@ -31,33 +36,33 @@ def _eventrelated_sanitizeinput(epochs, what="ecg", silent=False):
                 " to use " + str(what) + "_intervalrelated().",
                 category=NeuroKitWarning
             )
-    return epochs
-
+    return groups
 
-def _eventrelated_addinfo(epoch, output={}):
 
-    # Add label
-    if "Index" in epoch.columns:
-        output["Event_Onset"] = epoch.loc[np.min(np.abs(epoch.index))]["Index"]
+def _eventrelated_addinfo(group, output={}):
 
-    # Add label
-    if "Label" in epoch.columns and len(set(epoch["Label"])) == 1:
-        output["Label"] = epoch["Label"].values[0]
+    # Add event onset
+    if "Index" in group:
+        output["Event_Onset"] = group.at("Index", np.argmin(np.abs(group.time)))
 
-    # Add condition
-    if "Condition" in epoch.columns and len(set(epoch["Condition"])) == 1:
-        output["Condition"] = epoch["Condition"].values[0]
-
-    # Add participant_id
-    if "Participant" in epoch.columns and len(set(epoch["Participant"])) == 1:
-        output["Participant"] = epoch["Participant"].values[0]
+    # Add label, condition and participant_id
+    for var in ["Label", "Condition", "Participant"]:
+        if var in group:
+            values, constant = group.constant(var)
+            if np.all(constant):
+                output[var] = values
+            elif np.any(constant):
+                output[var] = np.where(constant, values, np.nan)
 
     return output
 
 
 def _eventrelated_sanitizeoutput(data):
 
-    df = pd.DataFrame.from_dict(data, orient="index")  # Convert to a dataframe
+    # Convert to a dataframe (one row per epoch, in the order of the input)
+    df = pd.concat([pd.DataFrame(output, index=group.keys) for group, output in data.items()])
+    order = np.concatenate([group.order for group in data.keys()])
+    df = df.iloc[np.argsort(order, kind="stable")]
 
     colnames = df.columns.values
     if "Event_Onset" in colnames:
@@ -73,11 +78,10 @@ def _eventrelated_sanitizeoutput(data):
     return df
 
 
-def _eventrelated_rate(epoch, output={}, var="ECG_Rate"):
+def _eventrelated_rate(group, output={}, var="ECG_Rate"):
 
     # Sanitize input
-    colnames = epoch.columns.values
-    if len([i for i in colnames if var in i]) == 0:
+    if len([i for i in group.columns if var in i]) == 0:
         warn(
             "Input does not have an `" + var + "` column."
             " Will skip all rate-related features.",
@@ -86,30 +90,180 @@ def _eventrelated_rate(epoch, output={}, var="ECG_Rate"):
         return output
 
     # Get baseline
-    zero = find_closest(0, epoch.index.values, return_index=True)  # Find closest to 0
-    baseline = epoch[var].iloc[zero]
+    zero = find_closest(0, group.time, return_index=True)  # Find closest to 0
+    values = group[var]
+    baseline = values[:, zero]
 
-    signal = epoch[var].values[zero + 1 : :]
-    index = epoch.index.values[zero + 1 : :]
+    signal = values[:, zero + 1 : :]
+    index = group.time[zero + 1 : :]
 
     # Max / Min / Mean
     output[var + "_Baseline"] = baseline
-    output[var + "_Max"] = np.max(signal) - baseline
-    output[var + "_Min"] = np.min(signal) - baseline
-    output[var + "_Mean"] = np.mean(signal) - baseline
+    output[var + "_Max"] = np.max(signal, axis=1) - baseline
+    output[var + "_Min"] = np.min(signal, axis=1) - baseline
+    output[var + "_Mean"] = np.mean(signal, axis=1) - baseline
 
     # Time of Max / Min
-    output[var + "_Max_Time"] = index[np.argmax(signal)]
-    output[var + "_Min_Time"] = index[np.argmin(signal)]
+    output[var + "_Max_Time"] = index[np.argmax(signal, axis=1)]
+    output[var + "_Min_Time"] = index[np.argmin(signal, axis=1)]
 
     # Modelling
     # These are experimental indices corresponding to parameters of a quadratic model
     # Instead of raw values (such as min, max etc.)
-    coefs = np.polyfit(index, signal - baseline, 2)
+    y = signal - baseline[:, np.newaxis]
+    coefs = _eventrelated_polyfit(index, y, 2)
     output[var + "_Trend_Quadratic"] = coefs[0]
     output[var + "_Trend_Linear"] = coefs[1]
-    output[var + "_Trend_R2"] = fit_r2(
-        y=signal - baseline, y_predicted=np.polyval(coefs, index), adjusted=False, n_parameters=3
-    )
+
+    # R2 (for all epochs at once)
+    y_predicted = (np.vander(index, 3) @ coefs).T
+    output[var + "_Trend_R2"] = fit_r2(y=y, y_predicted=y_predicted, adjusted=False, n_parameters=3)
 
     return output
+
+
+# =============================================================================
+# Stacking
+# =============================================================================
+class _EventRelatedGroup:
+    """Epochs sharing the same time vector and columns, accessed as (epochs x time) arrays.
+
+    The arrays are gathered from the data (for the epochs of an ``Epochs`` container) or stacked
+    from the DataFrames (for the other epochs) when a column is first accessed.
+    """
+
+    def __init__(self, keys, order, time, columns):
+        self.keys = keys
+        self.order = np.asarray(order, dtype=int)
+        self.time = np.asarray(time)
+        self.columns = columns
+        self._arrays = {}
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, var):
+        return var in self.columns
+
+    def __getitem__(self, var):
+        if var not in self._arrays:
+            self._arrays[var] = self._get(var)
+        return self._arrays[var]
+
+    def at(self, var, position):
+        """Get the values of a column at a given sample of all the epochs."""
+        return self[var][:, position]
+
+    def constant(self, var):
+        """Get the first value of a column in all the epochs, and whether it is constant within them."""
+        values = self[var]
+        return values[:, 0], np.all(values == values[:, [0]], axis=1)
+
+
+class _EventRelatedGroupDict(_EventRelatedGroup):
+    def __init__(self, epochs, keys, order):
+        first = epochs[keys[0]]
+        _EventRelatedGroup.__init__(self, keys, order, first.index.values, list(first.columns))
+        self._epochs = epochs
+
+    def _get(self, var):
+        return _eventrelated_numeric(np.array([self._epochs[key][var].values for key in self.keys]))
+
+
+class _EventRelatedGroupEpochs(_EventRelatedGroup):
+    def __init__(self, epochs, keys, order):
+        self._epochs = epochs
+        self._indices = np.array([dict.__getitem__(epochs, key) for key in keys], dtype=int)
+        i = self._indices[0]
+        time = np.linspace(
+            epochs._time_start[i], epochs._time_end[i], num=epochs.end[i] - epochs.start[i], endpoint=True
+        )
+        columns = list(epochs._data.columns) + ["Index", "Label"]
+        if epochs.condition[i] is not None:
+            columns += ["Condition"]
+        _EventRelatedGroup.__init__(self, keys, order, time, columns)
+
+    def _get(self, var):
+        positions = self._epochs.start[self._indices, np.newaxis] + np.arange(len(self.time))
+        return self._gather(var, positions)
+
+    def at(self, var, position):
+        if var in self._arrays:
+            return self._arrays[var][:, position]
+        return self._gather(var, self._epochs.start[self._indices] + position)
+
+    def constant(self, var):
+        if var == "Label":
+            values = self._epochs.label[self._indices]
+        elif var == "Condition":
+            values = self._epochs.condition[self._indices]
+        else:
+            return _EventRelatedGroup.constant(self, var)
+        return values, np.full(len(values), True)
+
+    def _gather(self, var, positions):
+        if var == "Index":
+            return positions
+        if var == "Label":
+            return np.repeat(self._epochs.label[self._indices, np.newaxis], positions.shape[-1], axis=1)
+        if var == "Condition":
+            return np.repeat(self._epochs.condition[self._indices, np.newaxis], positions.shape[-1], axis=1)
+
+        values = self._epochs._data[var].values
+        valid = (positions >= 0) & (positions < len(values))
+        out = values[np.clip(positions, 0, max(0, len(values) - 1))]
+        if not np.all(valid):
+            out = out.astype(float) if out.dtype.kind in "biuf" else out.astype(object)
+            out[~valid] = np.nan
+        return out
+
+
+def _eventrelated_groups(epochs):
+    """Split the epochs into groups of epochs sharing the same time vector and columns."""
+    groups = {}
+    for order, key in enumerate(epochs.keys()):
+        index = dict.__getitem__(epochs, key) if isinstance(epochs, Epochs) else None
+        if isinstance(index, (int, np.integer)) and epochs._baseline is None:
+            group = (
+                "Epochs",
+                epochs.end[index] - epochs.start[index],
+                epochs._time_start[index],
+                epochs._time_end[index],
+                epochs.condition[index] is None,
+            )
+        else:
+            epoch = epochs[key]
+            group = ("DataFrame", tuple(epoch.columns), len(epoch), epoch.index.values.tobytes())
+        groups.setdefault(group, ([], []))
+        groups[group][0].append(key)
+        groups[group][1].append(order)
+
+    return [
+        _EventRelatedGroupEpochs(epochs, keys, order)
+        if group[0] == "Epochs"
+        else _EventRelatedGroupDict(epochs, keys, order)
+        for group, (keys, order) in groups.items()
+    ]
+
+
+def _eventrelated_numeric(values):
+    """Convert (object) arrays of numbers to floats."""
+    if values.dtype == object and pd.api.types.infer_dtype(values.ravel(), skipna=True) in [
+        "integer",
+        "floating",
+        "mixed-integer-float",
+        "boolean",
+    ]:
+        values = values.astype(float)
+    return values
+
+
+def _eventrelated_polyfit(x, y, deg=2):
+    """Fit a polynomial to each row of y (epochs x time)."""
+    coefs = np.full((deg + 1, len(y)), np.nan)
+    finite = np.all(np.isfinite(y), axis=1)
+    if np.any(finite):
+        coefs[:, finite] = np.polyfit(x, y[finite].T, deg).reshape(deg + 1, -1)
+    for i in np.where(~finite)[0]:
+        coefs[:, i] = np.polyfit(x, y[i], deg)
+    return coefs
@@ -2,11 +2,34 @@
 import pandas as pd
 from ..misc import as_vector
 from ..complexity import entropy_shannon
+from ..complexity.utils_symbolic import _symbolic_entropy_rate
 
 
-def microstates_complexity(microstates):
+def microstates_complexity(microstates, order=2):
     """Complexity of microstates pattern
 
+    Parameters
+    ----------
+    microstates : np.ndarray
+        The sequence of microstates.
+    order : int
+        The number of consecutive microstates (blocks) used to estimate the entropy rate, i.e., the
+        entropy of a microstate given the ``order - 1`` previous ones. Defaults to 2.
+
+    Returns
+    -------
+    DataFrame
+        The Shannon entropy and the entropy rate of the sequence.
+
+    Examples
+    --------
+    >>> import neurokit2 as nk
+    >>>
+    >>> microstates = [0, 0, 0, 1, 1, 2, 2, 2, 2, 1, 0, 0]
+    >>> nk.microstates_complexity(microstates)  #doctest: +ELLIPSIS
+       Microstate_Entropy_Shannon  Microstate_Entropy_Rate
+    0 ...
+
     """
     microstates = as_vector(microstates)
     out = {}
@@ -14,6 +37,9 @@ def microstates_complexity(microstates):
     # Empirical Shannon entropy
     out["Entropy_Shannon"] = entropy_shannon(microstates)
 
+    # Entropy rate H(order) - H(order - 1)
+    out["Entropy_Rate"] = _symbolic_entropy_rate(microstates, order=order)
+
     # Maximym entropy given the number of different states
 #    h_max = np.log2(len(np.unique(microstates)))
 
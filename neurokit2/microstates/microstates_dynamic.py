@@ -46,9 +46,8 @@ def microstates_dynamic(microstates):
     results = transition_matrix(microstates)
     T = results["Observed"]
 
-    for row in T.index:
-        for col in T.columns:
-            out[str(T.loc[row].name) + "_to_" + str(T[col].name)] = T[col][row]
+    names = [str(row) + "_to_" + str(col) for row in T.index for col in T.columns]
+    out.update(zip(names, T.values.ravel()))
 
     for _, rez in enumerate(results):
         if rez not in ["Observed", "Expected"]:
@@ -1,24 +1,43 @@
 # -*- coding: utf-8 -*-
+import functools
+
 import numpy as np
 import pandas as pd
+import scipy.linalg
 
+from ..misc.parallel import _parallel_imap
 from ..stats.cluster_quality import _cluster_quality_dispersion
-from .microstates_segment import microstates_segment
+from .microstates_clean import microstates_clean
+from .microstates_segment import _microstates_segment, _microstates_segment_normalize
 
 
-def microstates_findnumber(eeg, n_max=12, show=False, **kwargs):
+def microstates_findnumber(eeg, n_max=12, show=False, warm_start=False, n_jobs=1, verbose=False, **kwargs):
     """Estimate optimal number of microstates.
 
-    Estimate the optimal number of microstates using a variety of indices.
+    Estimate the optimal number of microstates using a variety of indices. The data is cleaned (see
+    ``microstates_clean()``) only once, and the same training samples (e.g., GFP peaks) are used for all
+    the numbers of microstates.
 
     Parameters
     ----------
-    seeg : np.ndarray
+    eeg : np.ndarray
         An array (channels, times) of M/EEG data or a Raw or Epochs object from MNE.
     n_max : int
         Maximum number of microstates to try. A higher number leads to a longer process.
     show : bool
         Plot indices normalized on the same scale.
+    warm_start : bool
+        For the modified k-means algorithm. If True, the numbers of microstates are fitted in increasing
+        order, and the segmentation with k + 1 microstates has an additional run starting from the k
+        microstates found previously plus a new one, splitting the worst-fitting microstate (the leading
+        direction of its residuals). This run is usually close to convergence, so that fewer random runs
+        (``n_runs``) are needed.
+    n_jobs : int
+        The number of processes to use. Without ``warm_start``, the numbers of microstates are fitted in
+        parallel. With ``warm_start``, they are fitted in order and the runs of each number are spread
+        over the processes. If negative, uses the number of CPUs plus one plus this value.
+    verbose : bool
+        Print the scores of each number of microstates as soon as it is fitted.
     **kwargs
         Arguments to be passed to ``microstates_segment()``
 
@@ -43,30 +62,32 @@ def microstates_findnumber(eeg, n_max=12, show=False, **kwargs):
     >>> # results = nk.microstates_findnumber(eeg, n_max=4, show=True, method="kmod")
 
     """
-    # Retrieve data
-    if isinstance(eeg, (pd.DataFrame, np.ndarray)) is False:
-        data = eeg.get_data()
-    elif isinstance(eeg, pd.DataFrame):
-        data = eeg.values
+    # Retrieve and clean data (with the defaults of microstates_segment())
+    clean_args = {"train": "gfp", "sampling_rate": None, "standardize_eeg": False, "gfp_method": "l1"}
+    clean_args = {key: kwargs.pop(key, value) for key, value in clean_args.items()}
+    segment_args = ["method", "n_runs", "max_iterations", "criterion", "random_state", "optimize", "abandon"]
+    data, indices, gfp, info_mne = microstates_clean(
+        eeg, **clean_args, **{key: value for key, value in kwargs.items() if key not in segment_args}
+    )
+
+    # Draw the seed of each number of microstates, so that results do not depend on the order of fitting
+    random_state = kwargs.pop("random_state", None)
+    if isinstance(random_state, np.random.RandomState):
+        random_state = random_state.randint(np.iinfo(np.int32).max, size=n_max - 1)
     else:
-        data = eeg.copy()
+        random_state = [random_state] * (n_max - 1)
+
+    sweep = _microstates_findnumber_sweep(
+        data, indices, gfp, info_mne, random_state, n_max=n_max, warm_start=warm_start, n_jobs=n_jobs, **kwargs
+    )
 
     # Loop accross number and get indices of fit
     n_channel, _ = data.shape
     dispersion_previous = np.nan
     dispersion_diff_previous = np.nan
     results = []
-    for idx, n_microstates in enumerate(range(2, n_max + 1)):
-        print(idx, n_microstates)
-        out = microstates_segment(eeg, n_microstates=n_microstates)
-
+    for idx, (n_microstates, out) in enumerate(zip(range(2, n_max + 1), sweep)):
         segmentation = out["Sequence"]
-        #        info = out["Info_algorithm"]
-        #        sd = out["GFP"]
-
-        #        nk.cluster_quality(data.T, segmentation, clusters=microstates, info=info, n_random=10, sd=gfp)
-
-        #        _, rez = _cluster_quality_sklearn(data.T, segmentation, microstates)
         rez = {}
 
         rez["Score_GEV"] = out["GEV"]
@@ -92,15 +113,81 @@ def microstates_findnumber(eeg, n_max=12, show=False, **kwargs):
         dispersion_previous = dispersion_current.copy()
         dispersion_diff_previous = dispersion_diff.copy()
 
+        if verbose is True:
+            print(
+                "n_microstates = {}: GEV = {:.4f}, Dispersion = {:.4f}".format(
+                    n_microstates, rez["Score_GEV"], dispersion_current
+                )
+            )
+
         results.append(rez)
     results = pd.DataFrame(results)
-    #        results.append(pd.DataFrame.from_dict(rez, orient="index").T)
-    #    results = pd.concat(results, axis=0).reset_index(drop=True)
 
     if show is True:
         normalized = (results - results.min()) / (results.max() - results.min())
-        normalized["n_Clusters"] = np.rint(np.arange(2, n_max))
+        normalized["n_Clusters"] = np.rint(np.arange(2, n_max + 1))
         normalized.columns = normalized.columns.str.replace("Score", "Normalized")
         normalized.plot(x="n_Clusters")
 
     return results
+
+
+# =============================================================================
+# Utils
+# =============================================================================
+def _microstates_findnumber_sweep(data, indices, gfp, info_mne, random_state, n_max=12, warm_start=False, n_jobs=1,
+                                  **kwargs):
+    """Yield the segmentation of each number of microstates (from 2 to n_max) as soon as it is done."""
+    if warm_start is False:
+        function = functools.partial(
+            _microstates_findnumber_run, data=data, indices=indices, gfp=gfp, info_mne=info_mne, **kwargs
+        )
+        tasks = zip(range(2, n_max + 1), random_state)
+        for out in _parallel_imap(function, tasks, n_jobs=n_jobs):
+            yield out
+        return
+
+    data_normalized = _microstates_segment_normalize(data)
+    microstates = None
+    for n_microstates, seed in zip(range(2, n_max + 1), random_state):
+        init_microstates = None
+        if microstates is not None:
+            init_microstates = _microstates_findnumber_split(data[:, indices].T, microstates)
+        out = _microstates_segment(
+            data,
+            indices,
+            gfp,
+            info_mne,
+            n_microstates=n_microstates,
+            random_state=seed,
+            n_jobs=n_jobs,
+            init_microstates=init_microstates,
+            data_normalized=data_normalized,
+            **kwargs
+        )
+        microstates = out["Microstates"]
+        yield out
+
+
+def _microstates_findnumber_run(task, data=None, indices=None, gfp=None, info_mne=None, **kwargs):
+    n_microstates, seed = task
+    return _microstates_segment(data, indices, gfp, info_mne, n_microstates=n_microstates, random_state=seed, **kwargs)
+
+
+def _microstates_findnumber_split(data, microstates):
+    """Add a map to the microstates, along the leading direction of the residuals of the state that fits
+    the data (samples x channels) the worst."""
+    microstates = microstates / np.linalg.norm(microstates, axis=1, keepdims=True)
+    activation = microstates.dot(data.T)
+    segmentation = np.argmax(np.abs(activation), axis=0)
+    activation = activation[segmentation, np.arange(len(data))]
+
+    # Residuals of each sample after projection on its state
+    residuals = data - activation[:, np.newaxis] * microstates[segmentation]
+    residual_state = np.bincount(
+        segmentation, weights=np.sum(residuals ** 2, axis=1), minlength=len(microstates)
+    )
+
+    residuals = residuals[segmentation == np.argmax(residual_state)]
+    _, eigen_vectors = scipy.linalg.eigh(residuals.T.dot(residuals))
+    return np.vstack([microstates, eigen_vectors[:, -1]])
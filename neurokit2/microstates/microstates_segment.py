@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
+import functools
+
 import numpy as np
 
+from ..misc.parallel import _parallel_imap
 from ..stats import cluster
 from ..stats.cluster_quality import _cluster_quality_gev
 from .microstates_classify import microstates_classify
@@ -20,6 +23,8 @@ def microstates_segment(
     criterion="gev",
     random_state=None,
     optimize=False,
+    n_jobs=1,
+    abandon=False,
     **kwargs
 ):
     """Segment a continuous M/EEG signal into microstates using different clustering algorithms.
@@ -79,6 +84,17 @@ def microstates_segment(
     optimize : bool
         To use a new optimized method in https://www.biorxiv.org/content/10.1101/289850v1.full.pdf.
         For the k-means modified method. Default to False.
+    n_jobs : int
+        The number of processes over which the runs of the modified k-means algorithm are spread.
+        If 1 (default), runs are performed sequentially. If negative, uses the number of CPUs plus one
+        plus this value (i.e., -1 uses all CPUs). Each run has its own seed (drawn from
+        ``random_state``), so that the results do not depend on ``n_jobs``.
+    abandon : bool
+        For the modified k-means algorithm. If True, runs are abandoned as soon as the variance they
+        explain in the training data is not expected to reach that of the best run finished so far (and
+        hence are not expected to give the best segmentation). This can save a lot of time when
+        ``n_runs`` is large. Note that with several processes, each run is compared to the runs
+        finished when it started, so that the abandoned runs may depend on ``n_jobs``.
 
     Returns
     -------
@@ -151,6 +167,51 @@ def microstates_segment(
         **kwargs
     )
 
+    return _microstates_segment(
+        data,
+        indices,
+        gfp,
+        info_mne,
+        n_microstates=n_microstates,
+        method=method,
+        n_runs=n_runs,
+        max_iterations=max_iterations,
+        criterion=criterion,
+        random_state=random_state,
+        optimize=optimize,
+        n_jobs=n_jobs,
+        abandon=abandon,
+        **kwargs
+    )
+
+
+# =============================================================================
+# Utils
+# =============================================================================
+def _microstates_segment(
+    data,
+    indices,
+    gfp,
+    info_mne=None,
+    n_microstates=4,
+    method="kmod",
+    n_runs=10,
+    max_iterations=1000,
+    criterion="gev",
+    random_state=None,
+    optimize=False,
+    n_jobs=1,
+    abandon=False,
+    init_microstates=None,
+    data_normalized=None,
+    **kwargs
+):
+    """Segmentation of data already cleaned by ``microstates_clean()``.
+
+    For the modified k-means algorithm, ``init_microstates`` (if not None) are the initial maps of an
+    additional run, and ``data_normalized`` the data centered and normalized across channels (computed
+    if None).
+    """
     # Run clustering algorithm
     if method in ["kmods", "kmod", "kmeans modified", "modified kmeans"]:
 
@@ -170,24 +231,30 @@ def microstates_segment(
         info = None
 
         # Do several runs of the k-means algorithm, keep track of the best segmentation.
-        for run in range(n_runs):
-
-            # Run clustering on subset of data
-            _, _, current_info = cluster(
-                data[:, indices].T,
-                method="kmod",
-                n_clusters=n_microstates,
-                random_state=random_state[run],
-                max_iterations=max_iterations,
-                threshold=1e-6,
-                optimize=optimize,
-            )
+        runs = _microstates_segment_kmod(
+            data[:, indices].T,
+            random_state,
+            n_microstates=n_microstates,
+            max_iterations=max_iterations,
+            optimize=optimize,
+            abandon=abandon,
+            n_jobs=n_jobs,
+            init_microstates=init_microstates,
+        )
+        # Data normalized (across channels) once for the GEV of all the runs
+        if data_normalized is None:
+            data_normalized = _microstates_segment_normalize(data)
+
+        for current_info in runs:
+            if current_info["abandoned"]:
+                continue
+
             current_microstates = current_info["clusters_normalized"]
             current_residual = current_info["residual"]
 
             # Run segmentation on the whole dataset
             s, p, g, g_all = _microstates_segment_runsegmentation(
-                data, current_microstates, gfp, n_microstates=n_microstates
+                data, current_microstates, gfp, n_microstates=n_microstates, data_normalized=data_normalized
             )
 
             if criterion == "gev":
@@ -207,7 +274,7 @@ def microstates_segment(
                 if current_residual < cv:
                     microstates, segmentation, polarity = current_microstates, s, p
                     cv, gev, gev_all = current_residual, g, g_all
-                    info -= current_info
+                    info = current_info
 
     else:
         # Run clustering algorithm on subset
@@ -245,17 +312,89 @@ def microstates_segment(
     return info
 
 
-# =============================================================================
-# Utils
-# =============================================================================
-def _microstates_segment_runsegmentation(data, microstates, gfp, n_microstates):
+def _microstates_segment_kmod(data, seeds, n_microstates=4, max_iterations=1000, optimize=False, abandon=False,
+                              n_jobs=1, init_microstates=None):
+    """Run the modified k-means algorithm once per seed (possibly over a pool of processes).
+
+    The runs are submitted progressively, each with the highest explained variance among the runs
+    finished so far as the threshold below which it is abandoned (if ``abandon`` is True). If
+    ``init_microstates`` is not None, a first run starts from these maps.
+    """
+    best = {"explained_variance": None}
+
+    def tasks():
+        if init_microstates is not None:
+            yield None, None, init_microstates
+        for seed in seeds:
+            yield seed, best["explained_variance"] if abandon else None, None
+
+    function = functools.partial(
+        _microstates_segment_kmod_run,
+        data=data,
+        n_microstates=n_microstates,
+        max_iterations=max_iterations,
+        optimize=optimize,
+    )
+    runs = []
+    for info in _parallel_imap(function, tasks(), n_jobs=n_jobs):
+        if not info["abandoned"] and (
+            best["explained_variance"] is None or info["explained_variance"] > best["explained_variance"]
+        ):
+            best["explained_variance"] = info["explained_variance"]
+        runs.append(info)
+    return runs
+
+
+def _microstates_segment_kmod_run(task, data=None, n_microstates=4, max_iterations=1000, optimize=False):
+    seed, gev_threshold, init_microstates = task
+    _, _, info = cluster(
+        data,
+        method="kmod",
+        n_clusters=n_microstates,
+        random_state=seed,
+        max_iterations=max_iterations,
+        threshold=1e-6,
+        optimize=optimize,
+        gev_threshold=gev_threshold,
+        init_clusters=init_microstates,
+    )
+    return info
+
+
+def _microstates_segment_normalize(data):
+    """Data (channels x times) centered and normalized across channels."""
+    data_normalized = data - np.mean(data, axis=0)
+    data_normalized /= np.linalg.norm(data_normalized, axis=0)
+    return data_normalized
+
+
+def _microstates_segment_runsegmentation(data, microstates, gfp, n_microstates, data_normalized=None):
     # Find microstate corresponding to each datapoint
     activation = microstates.dot(data)
     segmentation = np.argmax(np.abs(activation), axis=0)
     polarity = np.sign(np.choose(segmentation, activation))
 
     # Get Global Explained Variance (GEV)
-    gev, gev_all = _cluster_quality_gev(
-        data.T, microstates, segmentation, sd=gfp, n_clusters=n_microstates
-    )
+    if data_normalized is None:
+        gev, gev_all = _cluster_quality_gev(
+            data.T, microstates, segmentation, sd=gfp, n_clusters=n_microstates
+        )
+    else:
+        gev, gev_all = _microstates_segment_gev(
+            data_normalized, microstates, segmentation, gfp, n_microstates=n_microstates
+        )
     return segmentation, polarity, gev, gev_all
+
+
+def _microstates_segment_gev(data_normalized, microstates, segmentation, gfp, n_microstates=4):
+    """GEV from data already centered and normalized across channels (same as _cluster_quality_gev())."""
+    maps = microstates - np.mean(microstates, axis=1, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        maps /= np.linalg.norm(maps, axis=1, keepdims=True)
+
+    # Correlation of each sample with its microstate
+    map_corr = maps.dot(data_normalized)[segmentation, np.arange(len(segmentation))]
+
+    gev_all = np.bincount(segmentation, weights=(gfp * map_corr) ** 2, minlength=n_microstates)
+    gev_all = gev_all[0:n_microstates] / np.sum(gfp ** 2)
+    return np.sum(gev_all), gev_all
@@ -3,7 +3,8 @@ import numpy as np
 import pandas as pd
 import matplotlib.gridspec
 from matplotlib import pyplot as plt
-from ..misc import find_groups, as_vector
+from ..complexity.utils_symbolic import _symbolic_runs
+from ..misc import as_vector
 
 
 def microstates_static(microstates, sampling_rate=1000, show=False):
@@ -71,14 +72,9 @@ def _microstates_duration(microstates, sampling_rate=1000, out=None):
     if out is None:
         out = {}
 
-    # Find durations of each state
-    groups = find_groups(microstates)
-    # Initialize empty containers for duration and type
-    durations = np.full(len(groups), np.nan)
-    types = np.full(len(groups), np.nan)
-    for i, group in enumerate(groups):
-        types[i] = group[0]
-        durations[i] = len(group) / sampling_rate
+    # Find durations of each state (i.e., of each run of consecutive identical states)
+    types, lengths = _symbolic_runs(microstates)
+    durations = lengths / sampling_rate
 
     # Average duration
     for s in states:
@@ -123,14 +119,14 @@ def _microstates_duration_plot(durations, types, ax=None):
 # =============================================================================
 def _microstates_prevalence(microstates, out=None):
     n = len(microstates)
-    states = np.unique(microstates)
+    states, counts = np.unique(microstates, return_counts=True)
 
     if out is None:
         out = {}
 
     # Average proportion
-    for s in states:
-        out[str(s) + "_Proportion"] = np.sum(microstates == s) / n
+    for s, count in zip(states, counts):
+        out[str(s) + "_Proportion"] = count / n
 
     # Leftime distribution
     out, lifetimes = _microstates_lifetime(microstates, out=out)
@@ -167,31 +163,13 @@ def _microstates_lifetime(microstates, out=None):
 
     Compute the lifetime distributions for each symbol in a symbolic sequence X with ns symbols.
     """
-    n = len(microstates)
     states = np.unique(microstates)
+    runs, tau = _symbolic_runs(microstates)  # symbol and lifetime of each run
 
-    tau_dict = {s: [] for s in states}
-    s = microstates[0]  # current symbol
-    tau = 1.0  # current lifetime
-    for i in range(n):
-        if microstates[i] == s:
-            tau += 1.0
-        else:
-            tau_dict[s].append(tau)
-            s = microstates[i]
-            tau = 1.0
-    tau_dict[s].append(tau)  # last state
-
-    # Initialize empty distributions with max lifetime for each symbol
+    # Lifetime distributions (number of runs of each lifetime, up to the max lifetime of each symbol)
     lifetimes = {}
     for s in states:
-        lifetimes[s] = np.zeros(int(np.max(tau_dict[s])))
-
-    # Lifetime distributions
-    for s in states:
-        for j in range(len(tau_dict[s])):
-            tau = tau_dict[s][j]
-            lifetimes[s][int(tau)-1] += 1.0
+        lifetimes[s] = np.bincount(tau[runs == s] - 1).astype(float)
 
     # Get Area under curve (AUCs)
     if out is None:
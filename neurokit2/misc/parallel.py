@@ -0,0 +1,81 @@
+import collections
+import concurrent.futures
+import os
+
+
+def _parallel_map(function, iterable, n_jobs=1):
+    """Apply a function to every element of an iterable, possibly over a pool of processes.
+
+    The results are returned in the same order as the elements. The function (and its arguments) must
+    be picklable, i.e., a module-level function (for instance wrapped by ``functools.partial()``).
+
+    Parameters
+    ----------
+    function : callable
+        The function to apply.
+    iterable : iterable
+        The elements to which the function is applied.
+    n_jobs : int
+        The number of processes. If 1 (default), everything is run sequentially in the current process.
+        If negative, the number of processes is the number of CPUs plus one plus this value (i.e., -1
+        uses all CPUs).
+
+    Returns
+    -------
+    list
+        The results.
+
+    """
+    if n_jobs is None or n_jobs == 1:
+        return [function(i) for i in iterable]
+
+    if n_jobs < 0:
+        n_jobs = max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        return list(executor.map(function, iterable))
+
+
+def _parallel_imap(function, iterable, n_jobs=1, buffersize=None):
+    """Lazily apply a function to every element of an iterable, possibly over a pool of processes.
+
+    Contrary to ``_parallel_map()``, the elements are consumed and the results yielded progressively
+    (in the same order as the elements), with at most ``buffersize`` elements being processed at the
+    same time (defaults to twice the number of processes), so that long iterators (e.g., of recordings)
+    do not have to fit in memory.
+
+    Parameters
+    ----------
+    function : callable
+        The function to apply.
+    iterable : iterable
+        The elements to which the function is applied.
+    n_jobs : int
+        The number of processes (see ``_parallel_map()``).
+    buffersize : int
+        The maximum number of elements submitted but not yet yielded.
+
+    Yields
+    ------
+    object
+        The results.
+
+    """
+    if n_jobs is None or n_jobs == 1:
+        for i in iterable:
+            yield function(i)
+        return
+
+    if n_jobs < 0:
+        n_jobs = max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    if buffersize is None:
+        buffersize = 2 * n_jobs
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        pending = collections.deque()
+        for i in iterable:
+            pending.append(executor.submit(function, i))
+            if len(pending) >= buffersize:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
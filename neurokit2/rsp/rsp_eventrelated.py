@@ -73,26 +73,26 @@ def rsp_eventrelated(epochs, silent=False):
     >>> rsp2 #doctest: +SKIP
 
     """
-    # Sanity checks
-    epochs = _eventrelated_sanitizeinput(epochs, what="rsp", silent=silent)
+    # Sanity checks (the epochs are stacked into groups of epochs sharing the same time and columns)
+    groups = _eventrelated_sanitizeinput(epochs, what="rsp", silent=silent)
 
-    # Extract features and build dataframe
+    # Extract features (for all the epochs of a group at once) and build dataframe
     data = {}  # Initialize an empty dict
-    for i in epochs.keys():
+    for group in groups:
 
-        data[i] = {}  # Initialize empty container
+        data[group] = {}  # Initialize empty container
 
         # Rate
-        data[i] = _eventrelated_rate(epochs[i], data[i], var="RSP_Rate")
+        data[group] = _eventrelated_rate(group, data[group], var="RSP_Rate")
 
         # Amplitude
-        data[i] = _rsp_eventrelated_amplitude(epochs[i], data[i])
+        data[group] = _rsp_eventrelated_amplitude(group, data[group])
 
         # Inspiration
-        data[i] = _rsp_eventrelated_inspiration(epochs[i], data[i])
+        data[group] = _rsp_eventrelated_inspiration(group, data[group])
 
         # Fill with more info
-        data[i] = _eventrelated_addinfo(epochs[i], data[i])
+        data[group] = _eventrelated_addinfo(group, data[group])
 
     df = _eventrelated_sanitizeoutput(data)
 
@@ -104,10 +104,10 @@ def rsp_eventrelated(epochs, silent=False):
 # =============================================================================
 
 
-def _rsp_eventrelated_amplitude(epoch, output={}):
+def _rsp_eventrelated_amplitude(group, output={}):
 
     # Sanitize input
-    if "RSP_Amplitude" not in epoch:
+    if "RSP_Amplitude" not in group:
         warn(
             "Input does not have an `RSP_Amplitude` column."
             " Will skip all amplitude-related features.",
@@ -116,25 +116,27 @@ def _rsp_eventrelated_amplitude(epoch, output={}):
         return output
 
     # Get baseline
-    if np.min(epoch.index.values) <= 0:
-        baseline = epoch["RSP_Amplitude"][epoch.index <= 0].values
-        signal = epoch["RSP_Amplitude"][epoch.index > 0].values
+    amplitude = group["RSP_Amplitude"]
+    if np.min(group.time) <= 0:
+        baseline = amplitude[:, group.time <= 0]
+        signal = amplitude[:, group.time > 0]
     else:
-        baseline = epoch["RSP_Amplitude"][np.min(epoch.index.values) : np.min(epoch.index.values)].values
-        signal = epoch["RSP_Amplitude"][epoch.index > np.min(epoch.index)].values
+        baseline = amplitude[:, group.time == np.min(group.time)]
+        signal = amplitude[:, group.time > np.min(group.time)]
+    baseline = np.mean(baseline, axis=1)
 
     # Max / Min / Mean
-    output["RSP_Amplitude_Max"] = np.max(signal) - np.mean(baseline)
-    output["RSP_Amplitude_Min"] = np.min(signal) - np.mean(baseline)
-    output["RSP_Amplitude_Mean"] = np.mean(signal) - np.mean(baseline)
+    output["RSP_Amplitude_Max"] = np.max(signal, axis=1) - baseline
+    output["RSP_Amplitude_Min"] = np.min(signal, axis=1) - baseline
+    output["RSP_Amplitude_Mean"] = np.mean(signal, axis=1) - baseline
 
     return output
 
 
-def _rsp_eventrelated_inspiration(epoch, output={}):
+def _rsp_eventrelated_inspiration(group, output={}):
 
     # Sanitize input
-    if "RSP_Phase" not in epoch:
+    if "RSP_Phase" not in group:
         warn(
             "Input does not have an `RSP_Phase` column."
             " Will not indicate whether event onset concurs with inspiration.",
@@ -143,7 +145,8 @@ def _rsp_eventrelated_inspiration(epoch, output={}):
         return output
 
     # Indication of inspiration
-    output["RSP_Phase"] = epoch["RSP_Phase"][epoch.index > 0].iloc[0]
-    output["RSP_Phase_Completion"] = epoch["RSP_Phase_Completion"][epoch.index > 0].iloc[0]
+    onset = np.argmax(group.time > 0)
+    output["RSP_Phase"] = group.at("RSP_Phase", onset)
+    output["RSP_Phase_Completion"] = group.at("RSP_Phase_Completion", onset)
 
     return output
@@ -4,19 +4,24 @@ from ..events import events_plot
 from ..misc import as_vector
 
 
-def signal_changepoints(signal, change="meanvar", penalty=None, show=False):
+def signal_changepoints(signal, change="meanvar", penalty=None, method="pelt", show=False):
     """Change Point Detection.
 
-    Only the PELT method is implemented for now.
+    Changepoints are detected with the PELT method (exact), or with binary segmentation (approximate but
+    faster on very long signals).
 
     Parameters
     -----------
     signal : Union[list, np.array, pd.Series]
         Vector of values.
-    change : str
-        Can be one of "meanvar" (default), "mean" or "var".
+    change : str or function
+        Can be one of "meanvar" (default), "mean" or "var". Can also be a function that takes the signal
+        and returns a cost function ``cost(start, end)``, giving the cost of the segment(s)
+        ``signal[start:end]`` for arrays of starts and ends (see the cost functions of this module).
     penalty : float
         The algorithm penalty. Default to ``np.log(len(signal))``.
+    method : str
+        Can be "pelt" (default) or "binseg" (binary segmentation).
     show : bool
         Defaults to False.
 
@@ -42,7 +47,14 @@ def signal_changepoints(signal, change="meanvar", penalty=None, show=False):
 
     """
     signal = as_vector(signal)
-    changepoints = _signal_changepoints_pelt(signal, change=change, penalty=penalty)
+
+    method = method.lower()
+    if method == "pelt":
+        changepoints = _signal_changepoints_pelt(signal, change=change, penalty=penalty)
+    elif method in ["binseg", "binary"]:
+        changepoints = _signal_changepoints_binseg(signal, change=change, penalty=penalty)
+    else:
+        raise ValueError("NeuroKit error: signal_changepoints(): 'method' should be one of 'pelt' or 'binseg'.")
 
     if show is True:
         events_plot(changepoints, signal)
@@ -61,35 +73,31 @@ def _signal_changepoints_pelt(signal, change="meanvar", penalty=None):
     length = len(signal)
     if penalty is None:
         penalty = np.log(length)  # pylint: disable=E1111
-    if change.lower() == "var":
-        cost = _signal_changepoints_cost_var(signal)
-    elif change.lower() == "mean":
-        cost = _signal_changepoints_cost_mean(signal)
-    else:
-        cost = _signal_changepoints_cost_meanvar(signal)
+    cost = _signal_changepoints_cost(signal, change)
 
     # Run algorithm
     F = np.zeros(length + 1)
-    R = np.array([0], dtype=int)
+    R = np.zeros(length + 1, dtype=int)  # Candidate changepoints (the first n_R)
+    n_R = 1
     candidates = np.zeros(length + 1, dtype=int)
 
     F[0] = -penalty  # pylint: disable=E1130
 
-    for tstar in range(2, length + 1):
-        cpt_cands = R
-        seg_costs = np.zeros(len(cpt_cands))
-        for i in range(0, len(cpt_cands)):  # pylint: disable=C0200
-            seg_costs[i] = cost(cpt_cands[i], tstar)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for tstar in range(2, length + 1):
+            cpt_cands = R[:n_R]
+            F_cost = F[cpt_cands] + cost(cpt_cands, tstar)
 
-        F_cost = F[cpt_cands] + seg_costs
-        F[tstar] = np.min(F_cost) + penalty
-        tau = np.argmin(F_cost)
-        candidates[tstar] = cpt_cands[tau]
+            tau = np.argmin(F_cost)
+            F[tstar] = F_cost[tau] + penalty
+            candidates[tstar] = cpt_cands[tau]
 
-        ineq_prune = [val < F[tstar] for val in F_cost]
-        R = [cpt_cands[j] for j, val in enumerate(ineq_prune) if val]
-        R.append(tstar - 1)
-        R = np.array(R, dtype=int)
+            # Prune (in place)
+            keep = cpt_cands[F_cost < F[tstar]]
+            n_R = len(keep)
+            R[:n_R] = keep
+            R[n_R] = tstar - 1
+            n_R += 1
 
     last = candidates[-1]
     changepoints = [last]
@@ -100,21 +108,60 @@ def _signal_changepoints_pelt(signal, change="meanvar", penalty=None):
     return np.sort(changepoints)
 
 
+def _signal_changepoints_binseg(signal, change="meanvar", penalty=None, min_size=2):
+    """Binary segmentation to find change points in a signal.
+
+    Each segment is split at the point that decreases the cost the most, as long as this decrease is
+    larger than the penalty. All the possible splits of a segment are evaluated at once.
+
+    """
+    # Initialize
+    length = len(signal)
+    if penalty is None:
+        penalty = np.log(length)  # pylint: disable=E1111
+    cost = _signal_changepoints_cost(signal, change)
+
+    changepoints = [0]
+    segments = [(0, length)]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        while segments:
+            start, end = segments.pop()
+            splits = np.arange(start + min_size, end - min_size + 1)
+            if len(splits) == 0:
+                continue
+
+            gain = cost(start, end) - (cost(start, splits) + cost(splits, end))
+            gain[np.isnan(gain)] = -np.inf
+            best = np.argmax(gain)
+            if gain[best] > penalty:
+                changepoints.append(splits[best])
+                segments += [(start, splits[best]), (splits[best], end)]
+
+    return np.sort(changepoints)
+
+
 # =============================================================================
 # Cost functions
 # =============================================================================
+def _signal_changepoints_cost(signal, change="meanvar"):
+    if callable(change):
+        return change(signal)
+    if change.lower() == "var":
+        return _signal_changepoints_cost_var(signal)
+    if change.lower() == "mean":
+        return _signal_changepoints_cost_mean(signal)
+    return _signal_changepoints_cost_meanvar(signal)
+
+
 def _signal_changepoints_cost_mean(signal):
     """Cost function for a normally distributed signal with a changing mean."""
     i_variance_2 = 1 / (np.var(signal) ** 2)
-    cmm = [0.0]
-    cmm.extend(np.cumsum(signal))
-
-    cmm2 = [0.0]
-    cmm2.extend(np.cumsum(np.abs(signal)))
+    cmm = np.concatenate([[0.0], np.cumsum(signal)])
+    cmm2 = np.concatenate([[0.0], np.cumsum(np.abs(signal))])
 
     def cost(start, end):
         cmm2_diff = cmm2[end] - cmm2[start]
-        cmm_diff = pow(cmm[end] - cmm[start], 2)
+        cmm_diff = np.power(cmm[end] - cmm[start], 2.0)
         i_diff = end - start
         diff = cmm2_diff - cmm_diff
         return (diff / i_diff) * i_variance_2
@@ -124,11 +171,10 @@ def _signal_changepoints_cost_mean(signal):
 
 def _signal_changepoints_cost_var(signal):
     """Cost function for a normally distributed signal with a changing variance."""
-    cumm = [0.0]
-    cumm.extend(np.cumsum(np.power(np.abs(signal - np.mean(signal)), 2)))
+    cumm = np.concatenate([[0.0], np.cumsum(np.power(np.abs(signal - np.mean(signal)), 2))])
 
     def cost(s, t):
-        dist = float(t - s)
+        dist = np.asarray(t - s, dtype=float)
         diff = cumm[t] - cumm[s]
         return dist * np.log(diff / dist)
 
@@ -140,18 +186,21 @@ def _signal_changepoints_cost_meanvar(signal):
     signal = np.hstack(([0.0], np.array(signal)))
 
     cumm = np.cumsum(signal)
-    cumm_sq = np.cumsum([val ** 2 for val in signal])
+    cumm_sq = np.cumsum(np.power(signal, 2.0))
 
+    # Note: np.power() is used rather than ** 2 (which multiplies the values by themselves for arrays)
+    # so that the costs are the same for arrays of segments as for single segments
     def cost(s, t):
         ts_i = 1.0 / (t - s)
         mu = (cumm[t] - cumm[s]) * ts_i
-        sig = (cumm_sq[t] - cumm_sq[s]) * ts_i - mu ** 2
+        mu_sq = np.power(mu, 2.0)
+        sig = (cumm_sq[t] - cumm_sq[s]) * ts_i - mu_sq
         sig_i = 1.0 / sig
         return (
             (t - s) * np.log(sig)
             + (cumm_sq[t] - cumm_sq[s]) * sig_i
             - 2 * (cumm[t] - cumm[s]) * mu * sig_i
-            + ((t - s) * mu ** 2) * sig_i
+            + ((t - s) * mu_sq) * sig_i
         )
 
     return cost
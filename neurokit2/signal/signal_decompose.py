@@ -1,4 +1,6 @@
 import numpy as np
+import scipy.fft
+import scipy.sparse.linalg
 
 from ..misc import as_vector
 
@@ -21,7 +23,10 @@ def signal_decompose(signal, method="emd", n_components=None, **kwargs):
         Number of components to extract. Only used for 'ssa' method. If ``None``, will default
         to 50.
     **kwargs
-        Other arguments passed to other functions.
+        Other arguments passed to other functions. For the 'ssa' method, a ``window`` (the length of the
+        subseries stacked in the trajectory matrix) longer than ``n_components`` can be specified, in which
+        case only the ``n_components`` leading components are computed (e.g., for long signals). The
+        same ``window`` should then be passed to ``signal_recompose()``.
 
     Returns
     -------
@@ -53,6 +58,9 @@ def signal_decompose(signal, method="emd", n_components=None, **kwargs):
     >>> components = nk.signal_decompose(signal, method="ssa", n_components=5)
     >>> fig = nk.signal_plot(components)  # Visualize components
     >>> fig  #doctest: +SKIP
+    >>>
+    >>> # SSA method (leading components with a long window)
+    >>> components = nk.signal_decompose(signal, method="ssa", n_components=5, window=1000)
 
     """
     # Apply method
@@ -60,7 +68,7 @@ def signal_decompose(signal, method="emd", n_components=None, **kwargs):
     if method in ["emd"]:
         components = _signal_decompose_emd(signal, **kwargs)
     elif method in ["ssa"]:
-        components = _signal_decompose_ssa(signal, n_components=n_components)
+        components = _signal_decompose_ssa(signal, n_components=n_components, **kwargs)
     else:
         raise ValueError("NeuroKit error: signal_decompose(): 'method' should be one of 'emd'")
     return components
@@ -69,23 +77,32 @@ def signal_decompose(signal, method="emd", n_components=None, **kwargs):
 # =============================================================================
 # Singular spectrum analysis (SSA)
 # =============================================================================
-def _signal_decompose_ssa(signal, n_components=None):
+def _signal_decompose_ssa(signal, n_components=None, window=None):
     """Singular spectrum analysis (SSA)-based signal separation method.
 
     SSA decomposes a time series into a set of summable components that are grouped together and
     interpreted as trend, periodicity and noise.
 
+    By default, the window length is the number of components, and all the components are obtained
+    from the full SVD of the trajectory matrix. If a (longer) ``window`` is specified, only the leading
+    components are computed with a truncated (Lanczos) SVD, in which the trajectory matrix is never
+    formed. In both cases, the components are reconstructed without forming the elementary matrices.
+
     References
     ----------
     - https://www.kaggle.com/jdarcy/introducing-ssa-for-time-series-decomposition
 
     """
     # sanitize input
-    signal = as_vector(signal)
+    signal = as_vector(signal).astype(float)
 
     # Parameters
     # The window length.
-    if n_components is None:
+    if window is not None:
+        L = window
+        if n_components is None:
+            n_components = 50
+    elif n_components is None:
         L = 50 if len(signal) >= 100 else int(len(signal) / 2)
     else:
         L = n_components
@@ -93,31 +110,70 @@ def _signal_decompose_ssa(signal, n_components=None):
     # Length.
     N = len(signal)
     if not 2 <= L <= N / 2:
+        if window is not None:
+            raise ValueError("`window` must be in the interval [2, len(signal)/2].")
         raise ValueError("`n_components` must be in the interval [2, len(signal)/2].")
 
-    # The number of columns in the trajectory matrix.
+    if window is None:
+        # Embed the time series in a trajectory matrix by pulling the relevant subseries of F,
+        # and stacking them as columns (a strided view of the signal).
+        X = np.lib.stride_tricks.sliding_window_view(signal, L).T
+
+        # Decompose the trajectory matrix
+        u, sigma, vt = np.linalg.svd(X, full_matrices=False)
+    else:
+        if not 1 <= n_components < L:
+            raise ValueError("`n_components` must be lower than the `window`.")
+        u, sigma, vt = _signal_decompose_ssa_svds(signal, L, n_components)
+
+    # Get n components (the rank of the trajectory matrix, as in np.linalg.matrix_rank())
+    d = np.sum(sigma > sigma.max() * max(L, N - L + 1) * np.finfo(float).eps)
+
+    # Reconstruct the components without storing the elementary matrices
+    return _signal_decompose_ssa_reconstruct(u[:, :d], sigma[:d], vt[:d])
+
+
+def _signal_decompose_ssa_svds(signal, L, n_components):
+    """Leading singular values and vectors of the trajectory matrix of the signal.
+
+    The trajectory matrix X (with X[i, j] = signal[i + j]) is only used through its products with
+    vectors, which are convolutions with the (reversed) vectors, computed by FFT.
+
+    """
+    N = len(signal)
     K = N - L + 1
+    nfft = scipy.fft.next_fast_len(N + K - 1)
+    signal_fft = np.fft.rfft(signal, nfft)
 
-    # Embed the time series in a trajectory matrix by pulling the relevant subseries of F,
-    # and stacking them as columns.
-    X = np.array([signal[i : L + i] for i in range(0, K)]).T
+    def _matvec(v):
+        return np.fft.irfft(signal_fft * np.fft.rfft(np.ravel(v)[::-1], nfft), nfft)[K - 1 : K - 1 + L]
 
-    # Get n components
-    d = np.linalg.matrix_rank(X)
+    def _rmatvec(w):
+        return np.fft.irfft(signal_fft * np.fft.rfft(np.ravel(w)[::-1], nfft), nfft)[L - 1 : L - 1 + K]
 
-    # Decompose the trajectory matrix
-    u, sigma, vt = np.linalg.svd(X, full_matrices=False)
+    X = scipy.sparse.linalg.LinearOperator((L, K), matvec=_matvec, rmatvec=_rmatvec, dtype=float)
+    u, sigma, vt = scipy.sparse.linalg.svds(X, k=n_components)
 
-    # Initialize components matrix
-    components = np.zeros((N, d))
-    # Reconstruct the elementary matrices without storing them
-    for i in range(d):
-        X_elem = sigma[i] * np.outer(u[:, i], vt[i, :])
-        X_rev = X_elem[::-1]
-        components[:, i] = [X_rev.diagonal(j).mean() for j in range(-X_rev.shape[0] + 1, X_rev.shape[1])]
+    # Sort by decreasing singular values
+    order = np.argsort(sigma)[::-1]
+    return u[:, order], sigma[order], vt[order]
 
-    # Return the components
-    return components.T
+
+def _signal_decompose_ssa_reconstruct(u, sigma, vt):
+    """Diagonal averaging of the elementary matrices sigma[i] * outer(u[:, i], vt[i]).
+
+    The sums over the anti-diagonals of an elementary matrix are the convolution of its singular
+    vectors, so that all the components are obtained by FFT without forming the matrices.
+
+    """
+    L, K = u.shape[0], vt.shape[1]
+    N = L + K - 1
+    nfft = scipy.fft.next_fast_len(N)
+    sums = np.fft.irfft(np.fft.rfft(u.T * sigma[:, np.newaxis], nfft) * np.fft.rfft(vt, nfft), nfft)[:, :N]
+
+    # Number of elements of each anti-diagonal
+    counts = np.minimum(np.minimum(np.arange(1, N + 1), np.arange(N, 0, -1)), min(L, K))
+    return sums / counts
 
 
 # =============================================================================
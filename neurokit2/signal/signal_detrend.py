@@ -1,16 +1,27 @@
 # -*- coding: utf-8 -*-
 import numpy as np
+import scipy.linalg
 import scipy.sparse
 
 from ..stats import fit_loess, fit_polynomial
 
 
-def signal_detrend(signal, method="polynomial", order=1, regularization=500, alpha=0.75, window=1.5, stepsize=0.02):
+def signal_detrend(
+    signal,
+    method="polynomial",
+    order=1,
+    regularization=500,
+    alpha=0.75,
+    window=1.5,
+    stepsize=0.02,
+    chunksize=None,
+    delta="auto",
+):
     """Polynomial detrending of signal.
 
     Apply a baseline (order = 0), linear (order = 1), or polynomial (order > 1) detrending to the signal
     (i.e., removing a general trend). One can also use other methods, such as smoothness priors approach
-    described by Tarvainen (2002) or LOESS regression, but these scale badly for long signals.
+    described by Tarvainen (2002) or LOESS regression.
 
     Parameters
     ----------
@@ -28,8 +39,18 @@ def signal_detrend(signal, method="polynomial", order=1, regularization=500, alp
         order to minimize the RMSE.
     regularization : int
         Only used if `method='tarvainen2002'`. The regularization parameter (default to 500).
+    chunksize : int
+        Only used if `method='tarvainen2002'`. If not None, the signal is detrended in overlapping chunks
+        of (approximately) this number of samples, which bounds the memory used for very long recordings
+        (e.g., multi-hour signals). The overlap is derived from `regularization` so that the stitched
+        trend matches the one obtained on the whole signal.
     alpha : float
         Only used if `method` is 'loess'. The parameter which controls the degree of smoothing.
+    delta : Union[float, str]
+        Only used if `method` is 'loess'. The spacing of the points at which the trend is computed, the
+        trend being linearly interpolated in between (see :func:`.fit_loess`). If 'auto' (default), the
+        spacing is 1% of the LOESS window, which keeps long signals fast. If 0, the trend is computed
+        at every point (exact fit).
     window : float
         Only used if `method` is 'locreg'. The detrending 'window' should correspond to the desired low
         frequency band to remove multiplied by the sampling rate (for instance, ``1.5*1000`` will remove
@@ -93,11 +114,11 @@ def signal_detrend(signal, method="polynomial", order=1, regularization=500, alp
     """
     method = method.lower()
     if method in ["tarvainen", "tarvainen2002"]:
-        detrended = _signal_detrend_tarvainen2002(signal, regularization)
+        detrended = _signal_detrend_tarvainen2002(signal, regularization, chunksize=chunksize)
     elif method in ["poly", "polynomial"]:
         detrended = _signal_detrend_polynomial(signal, order)
     elif method in ["loess", "lowess"]:
-        detrended = _signal_detrend_loess(signal, alpha=alpha)
+        detrended = _signal_detrend_loess(signal, alpha=alpha, delta=delta)
     elif method in ["locdetrend", "runline", "locreg", "locregression"]:
         detrended = _signal_detrend_locreg(signal, window=window, stepsize=stepsize)
     else:
@@ -111,8 +132,8 @@ def signal_detrend(signal, method="polynomial", order=1, regularization=500, alp
 # =============================================================================
 # Internals
 # =============================================================================
-def _signal_detrend_loess(signal, alpha=0.75):
-    detrended = np.array(signal) - fit_loess(signal, alpha=alpha)
+def _signal_detrend_loess(signal, alpha=0.75, delta="auto"):
+    detrended = np.array(signal) - fit_loess(signal, alpha=alpha, delta=delta)
     return detrended
 
 
@@ -125,25 +146,69 @@ def _signal_detrend_polynomial(signal, order=1):
     return detrended
 
 
-def _signal_detrend_tarvainen2002(signal, regularization=500):
+def _signal_detrend_tarvainen2002(signal, regularization=500, chunksize=None):
     """Method by Tarvainen et al., 2002.
 
+    The trend is the solution of ``(I + regularization^2 * D2' D2) trend = signal``, where D2 is the second
+    order difference matrix. As this system is symmetric, positive-definite and pentadiagonal, it is solved
+    with a banded Cholesky decomposition in O(N) time and memory (instead of inverting the dense N x N matrix).
+
     - Tarvainen, M. P., Ranta-Aho, P. O., & Karjalainen, P. A. (2002). An advanced detrending method
     with application to HRV analysis. IEEE Transactions on Biomedical Engineering, 49(2), 172-175.
 
     """
+    signal = np.asarray(signal, dtype=float)
+    if chunksize is None or chunksize >= len(signal):
+        trend = _signal_detrend_tarvainen2002_trend(signal, regularization)
+    else:
+        trend = _signal_detrend_tarvainen2002_chunked(signal, regularization, chunksize=int(chunksize))
+
+    # detrend
+    detrended = signal - trend
+    return detrended
+
+
+def _signal_detrend_tarvainen2002_trend(signal, regularization=500):
     N = len(signal)
-    identity = np.eye(N)
+    if N < 3:
+        return signal.copy()
+
     B = np.dot(np.ones((N - 2, 1)), np.array([[1, -2, 1]]))
     D_2 = scipy.sparse.dia_matrix((B.T, [0, 1, 2]), shape=(N - 2, N))  # pylint: disable=E1101
-    inv = np.linalg.inv(identity + regularization ** 2 * D_2.T @ D_2)
-    z_stat = ((identity - inv)) @ signal
+    A = scipy.sparse.identity(N) + regularization ** 2 * (D_2.T @ D_2)
 
-    trend = np.squeeze(np.asarray(signal - z_stat))
+    # Upper banded form of the (pentadiagonal) system matrix
+    ab = np.zeros((3, N))
+    ab[0, 2:] = A.diagonal(2)
+    ab[1, 1:] = A.diagonal(1)
+    ab[2, :] = A.diagonal(0)
 
-    # detrend
-    detrended = np.array(signal) - trend
-    return detrended
+    return scipy.linalg.solveh_banded(ab, signal, check_finite=False)
+
+
+def _signal_detrend_tarvainen2002_chunked(signal, regularization=500, chunksize=100000):
+    """Solve the smoothness priors system on overlapping chunks and keep only their central parts.
+
+    The influence of a sample on the trend decays exponentially with a length scale of about
+    ``sqrt(regularization)`` samples, so a margin of several of these length scales makes the chunk
+    boundaries invisible.
+
+    """
+    N = len(signal)
+    overlap = int(np.ceil(40 * np.sqrt(regularization))) + 2
+    chunksize = max(chunksize, 2 * overlap)
+
+    trend = np.zeros(N)
+    start = 0
+    while start < N:
+        end = min(start + chunksize, N)
+        left = max(start - overlap, 0)
+        right = min(end + overlap, N)
+        chunk_trend = _signal_detrend_tarvainen2002_trend(signal[left:right], regularization)
+        trend[start:end] = chunk_trend[start - left : end - left]
+        start = end
+
+    return trend
 
 
 def _signal_detrend_locreg(signal, window=1.5, stepsize=0.02):
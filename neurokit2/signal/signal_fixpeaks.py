@@ -209,22 +209,15 @@ def _find_artifacts(peaks, c1=0.13, c2=0.17, alpha=5.2, window_width=91, medfilt
     padding = 2
     drrs_pad = np.pad(drrs, padding, "reflect")
 
+    d = drrs_pad[padding:padding + drrs.size]
     s12 = np.zeros(drrs.size)
-    for d in np.arange(padding, padding + drrs.size):
-
-        if drrs_pad[d] > 0:
-            s12[d - padding] = np.max([drrs_pad[d - 1], drrs_pad[d + 1]])
-        elif drrs_pad[d] < 0:
-            s12[d - padding] = np.min([drrs_pad[d - 1], drrs_pad[d + 1]])
+    s12[d > 0] = np.maximum(drrs_pad[padding - 1:-padding - 1], drrs_pad[padding + 1:-padding + 1])[d > 0]
+    s12[d < 0] = np.minimum(drrs_pad[padding - 1:-padding - 1], drrs_pad[padding + 1:-padding + 1])[d < 0]
 
     # Cast dRRs to subspace s22.
     s22 = np.zeros(drrs.size)
-    for d in np.arange(padding, padding + drrs.size):
-
-        if drrs_pad[d] >= 0:
-            s22[d - padding] = np.min([drrs_pad[d + 1], drrs_pad[d + 2]])
-        elif drrs_pad[d] < 0:
-            s22[d - padding] = np.max([drrs_pad[d + 1], drrs_pad[d + 2]])
+    s22[d >= 0] = np.minimum(drrs_pad[padding + 1:-1], drrs_pad[padding + 2:])[d >= 0]
+    s22[d < 0] = np.maximum(drrs_pad[padding + 1:-1], drrs_pad[padding + 2:])[d < 0]
 
     # Compute mRRs: time series of deviation of RRs from median.
     df = pd.DataFrame({"signal": rr})
@@ -238,69 +231,33 @@ def _find_artifacts(peaks, c1=0.13, c2=0.17, alpha=5.2, window_width=91, medfilt
     # Artifact classification #################################################
     ###########################################################################
 
-    # Artifact classes.
-    extra_idcs = []
-    missed_idcs = []
-    ectopic_idcs = []
-    longshort_idcs = []
-
-    i = 0
-    while i < rr.size - 2:  # The flow control is implemented based on Figure 1
-
-        if np.abs(drrs[i]) <= 1:  # Figure 1
-            i += 1
-            continue
-        eq1 = np.logical_and(drrs[i] > 1, s12[i] < (-c1 * drrs[i] - c2))  # pylint: disable=E1111
-        eq2 = np.logical_and(drrs[i] < -1, s12[i] > (-c1 * drrs[i] + c2))  # pylint: disable=E1111
-
-        if np.any([eq1, eq2]):
-            # If any of the two equations is true.
-            ectopic_idcs.append(i)
-            i += 1
-            continue
-        # If none of the two equations is true.
-        if ~np.any([np.abs(drrs[i]) > 1, np.abs(mrrs[i]) > 3]):  # Figure 1
-            i += 1
-            continue
-        longshort_candidates = [i]
-        # Check if the following beat also needs to be evaluated.
-        if np.abs(drrs[i + 1]) < np.abs(drrs[i + 2]):
-            longshort_candidates.append(i + 1)
-
-        for j in longshort_candidates:
-            # Long beat.
-            eq3 = np.logical_and(drrs[j] > 1, s22[j] < -1)  # pylint: disable=E1111
-            # Long or short.
-            eq4 = np.abs(mrrs[j]) > 3  # Figure 1
-            # Short beat.
-            eq5 = np.logical_and(drrs[j] < -1, s22[j] > 1)  # pylint: disable=E1111
-
-            if ~np.any([eq3, eq4, eq5]):
-                # If none of the three equations is true: normal beat.
-                i += 1
-                continue
-            # If any of the three equations is true: check for missing or extra
-            # peaks.
-
-            # Missing.
-            eq6 = np.abs(rr[j] / 2 - medrr[j]) < th2[j]  # Figure 1
-            # Extra.
-            eq7 = np.abs(rr[j] + rr[j + 1] - medrr[j]) < th2[j]  # Figure 1
-
-            # Check if extra.
-            if np.all([eq5, eq7]):
-                extra_idcs.append(j)
-                i += 1
-                continue
-            # Check if missing.
-            if np.all([eq3, eq6]):
-                missed_idcs.append(j)
-                i += 1
-                continue
-            # If neither classified as extra or missing, classify as "long or
-            # short".
-            longshort_idcs.append(j)
-            i += 1
+    # The flow control is implemented based on Figure 1, for all beats at once
+    ectopic, candidate = _classify_artifacts(drrs, mrrs, s12, c1=c1, c2=c2)
+
+    # Long beat.
+    eq3 = np.logical_and(drrs > 1, s22 < -1)
+    # Long or short.
+    eq4 = np.abs(mrrs) > 3  # Figure 1
+    # Short beat.
+    eq5 = np.logical_and(drrs < -1, s22 > 1)
+    # If none of the three equations is true: normal beat.
+    candidate = candidate & (eq3 | eq4 | eq5)
+
+    # If any of the three equations is true: check for missing or extra peaks.
+    # Missing.
+    eq6 = np.abs(rr / 2 - medrr) < th2  # Figure 1
+    # Extra.
+    eq7 = np.abs(rr + np.append(rr[1:], np.nan) - medrr) < th2  # Figure 1
+
+    extra = candidate & eq5 & eq7
+    missed = candidate & ~extra & eq3 & eq6
+    # If neither classified as extra or missing, classify as "long or short".
+    longshort = candidate & ~extra & ~missed
+
+    extra_idcs = np.flatnonzero(extra).tolist()
+    missed_idcs = np.flatnonzero(missed).tolist()
+    ectopic_idcs = np.flatnonzero(ectopic).tolist()
+    longshort_idcs = np.flatnonzero(longshort).tolist()
 
     # Prepare output
     artifacts = {"ectopic": ectopic_idcs, "missed": missed_idcs, "extra": extra_idcs, "longshort": longshort_idcs}
@@ -310,6 +267,39 @@ def _find_artifacts(peaks, c1=0.13, c2=0.17, alpha=5.2, window_width=91, medfilt
     return artifacts, subspaces
 
 
+def _classify_artifacts(drrs, mrrs, s12, c1=0.13, c2=0.17):
+    """Ectopic beats and candidates for the long, short, missed and extra classes (Figure 1).
+
+    Beats are visited in order: a beat with an abnormal dRRs that is not ectopic is a candidate, and so
+    is the following beat if its dRRs is smaller than the next one, in which case that following beat
+    is not visited by itself. As only chains of such consecutive "double" candidates depend on each other
+    (the visited beats alternate along a chain), they are resolved with a cumulative maximum.
+    """
+    n = drrs.size
+    visitable = np.arange(n) < n - 2
+    abnormal = ~(np.abs(drrs) <= 1) & visitable  # Figure 1
+
+    eq1 = np.logical_and(drrs > 1, s12 < (-c1 * drrs - c2))
+    eq2 = np.logical_and(drrs < -1, s12 > (-c1 * drrs + c2))
+    ectopic = abnormal & (eq1 | eq2)
+    # If none of the two equations is true.
+    stage = abnormal & ~ectopic & ((np.abs(drrs) > 1) | (np.abs(mrrs) > 3))  # Figure 1
+
+    # Check if the following beat also needs to be evaluated.
+    double = np.zeros(n, dtype=bool)
+    double[: n - 2] = stage[: n - 2] & (np.abs(drrs[1 : n - 1]) < np.abs(drrs[2:]))
+
+    # Within a chain of consecutive doubles, only every other beat (from its start) is visited
+    idx = np.arange(n)
+    chain_start = np.maximum.accumulate(np.where(double & ~np.append(False, double[:-1]), idx, 0))
+    visited_double = double & ((idx - chain_start) % 2 == 0)
+    skipped = np.append(False, visited_double[:-1])
+
+    ectopic = ectopic & ~skipped
+    candidate = (stage & ~skipped) | skipped
+    return ectopic, candidate
+
+
 def _compute_threshold(signal, alpha, window_width):
 
     df = pd.DataFrame({"signal": np.abs(signal)})
@@ -409,14 +399,13 @@ def _correct_misaligned(misaligned_idcs, peaks):
 
 def _update_indices(source_idcs, update_idcs, update):
     """For every element s in source_idcs, change every element u in update_idcs according to update, if u is larger
-    than s."""
+    than s (in the original indices)."""
     if not update_idcs:
         return update_idcs
 
-    for s in source_idcs:
-        update_idcs = [u + update if u > s else u for u in update_idcs]
-
-    return update_idcs
+    # Cumulative offset: number of (deleted or inserted) beats before each index
+    offset = np.searchsorted(np.sort(source_idcs), update_idcs, side="left")
+    return (np.asarray(update_idcs) + update * offset).tolist()
 
 
 def _plot_artifacts_lipponen2019(artifacts, info):
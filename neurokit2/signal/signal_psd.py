@@ -27,8 +27,11 @@ def signal_psd(
 
     Parameters
     ----------
-    signal : Union[list, np.array, pd.Series]
-        The signal (i.e., a time series) in the form of a vector of values.
+    signal : Union[list, np.array, pd.Series, pd.DataFrame]
+        The signal (i.e., a time series) in the form of a vector of values. For the 'burg' method,
+        several signals (e.g., channels or windows) can be passed at once as a 2D array (one signal
+        per row) or as a DataFrame (one signal per column), in which case their AR models are
+        fitted together.
     sampling_rate : int
         The sampling frequency of the signal (in Hz, i.e., samples/second).
     method : str
@@ -67,7 +70,8 @@ def signal_psd(
     -------
     data : pd.DataFrame
         A DataFrame containing the Power Spectrum values and a plot if
-        `show` is True.
+        `show` is True. If several signals are passed, the DataFrame contains the power of each
+        of them in a separate column (named after the columns of the input DataFrame).
 
     Examples
     --------
@@ -79,10 +83,28 @@ def signal_psd(
     >>> psd_welch = nk.signal_psd(signal, method="welch", min_frequency=1, show=True)
     >>> psd_burg = nk.signal_psd(signal, method="burg", min_frequency=1, show=True)
     >>> psd_lomb = nk.signal_psd(signal, method="lomb", min_frequency=1, show=True)
+    >>>
+    >>> # Several signals at once
+    >>> import pandas as pd
+    >>> signals = pd.DataFrame({"A": signal, "B": nk.signal_simulate(frequency=10)})
+    >>> psd_burg = nk.signal_psd(signals, method="burg", min_frequency=1)
+    >>> list(psd_burg.columns)
+    ['Frequency', 'A', 'B']
 
     """
+    # Several signals (one per row, or one per DataFrame column)
+    names = None
+    if isinstance(signal, pd.DataFrame):
+        names = list(signal.columns)
+        signal = signal.values.T
+    signal = np.asarray(signal)
+    if signal.ndim > 1 and method.lower() not in ["burg", "pburg", "spectrum"]:
+        raise ValueError(
+            "NeuroKit error: signal_psd(): several signals can only be passed at once for the 'burg' method."
+        )
+
     # Constant Detrend
-    signal = signal - np.mean(signal)
+    signal = signal - np.mean(signal, axis=-1, keepdims=True)
 
     # MNE
     if method.lower() in ["multitapers", "mne"]:
@@ -105,14 +127,14 @@ def signal_psd(
             nperseg = int((2 / min_frequency) * sampling_rate)
 
         # in case duration of recording is not sufficient
-        if nperseg > len(signal) / 2:
+        if nperseg > signal.shape[-1] / 2:
             warn(
                 "The duration of recording is too short to support a"
                 " sufficiently long window for high frequency resolution."
                 " Consider using a longer recording or increasing the `min_frequency`",
                 category=NeuroKitWarning
             )
-            nperseg = int(len(signal) / 2)
+            nperseg = int(signal.shape[-1] / 2)
 
         # Welch (Scipy)
         if method.lower() in ["welch"]:
@@ -149,14 +171,18 @@ def signal_psd(
             )
 
     # Store results
-    data = pd.DataFrame({"Frequency": frequency, "Power": power})
+    if signal.ndim > 1:
+        data = pd.DataFrame(power.T, columns=names)
+        data.insert(0, "Frequency", frequency)
+    else:
+        data = pd.DataFrame({"Frequency": frequency, "Power": power})
 
     # Filter
     data = data.loc[np.logical_and(data["Frequency"] >= min_frequency, data["Frequency"] <= max_frequency)]
 #    data["Power"] = 10 * np.log(data["Power"])
 
     if show is True:
-        ax = data.plot(x="Frequency", y="Power", title="Power Spectral Density (" + str(method) + " method)")
+        ax = data.plot(x="Frequency", title="Power Spectral Density (" + str(method) + " method)")
         ax.set(xlabel="Frequency (Hz)", ylabel="Spectrum")
 
     return data
@@ -265,16 +291,16 @@ def _signal_psd_burg(
 
     # signal is real, not complex
     if nfft % 2 == 0:
-        power = psd[0 : int(nfft / 2 + 1)] * 2
+        power = psd[..., 0 : int(nfft / 2 + 1)] * 2
     else:
-        power = psd[0 : int((nfft + 1) / 2)] * 2
+        power = psd[..., 0 : int((nfft + 1) / 2)] * 2
 
     # angular frequencies, w
     # for one-sided psd, w spans [0, pi]
     # for two-sdied psd, w spans [0, 2pi)
     # for dc-centered psd, w spans (-pi, pi] for even nfft, (-pi, pi) for add nfft
     if side == "one-sided":
-        w = np.pi * np.linspace(0, 1, len(power))
+        w = np.pi * np.linspace(0, 1, power.shape[-1])
     #    elif side == "two-sided":
     #        w = np.pi * np.linspace(0, 2, len(power), endpoint=False)  #exclude last point
     #    elif side == "centerdc":
@@ -286,93 +312,107 @@ def _signal_psd_burg(
 
     frequency = (w * sampling_rate) / (2 * np.pi)
     if normalize is True:
-        power /= np.max(power)
+        power /= np.max(power, axis=-1, keepdims=True)
 
     return frequency, power
 
 
-
 def _signal_arma_burg(signal, order=16, criteria="KIC", corrected=True):
+    """Burg's AR estimation of a signal, or of several signals at once.
 
+    If ``signal`` is 2D, each row (e.g., a channel or a window) is fitted independently, but the
+    recursion runs on all rows at once. Rows for which the order criteria stops the recursion keep
+    their coefficients (padded with zeros) while the remaining rows continue. The AR coefficients
+    and the reflection coefficients are then returned as 2D arrays (one row per signal, ``order``
+    columns) and ``rho`` as a vector.
 
+    """
     # Sanitize order and signal
+    if not isinstance(signal, np.ndarray):
+        signal = np.array(signal)
     if order <= 0.0:
         raise ValueError("Order must be > 0")
-    if order > len(signal):
+    if order > signal.shape[-1]:
         raise ValueError("Order must be less than length signal minus 2")
-    if not isinstance(signal, np.ndarray):
-        signal = np.array(signal)
 
-    N = len(signal)
+    if signal.ndim == 1:
+        ar, rho, ref, n_order = _signal_arma_burg_batch(
+            signal[np.newaxis, :], order=order, criteria=criteria, corrected=corrected
+        )
+        return ar[0, 0 : n_order[0]], rho[0], ref[0, 0 : n_order[0]]
+
+    ar, rho, ref, _ = _signal_arma_burg_batch(signal, order=order, criteria=criteria, corrected=corrected)
+    return ar, rho, ref
+
+
+def _signal_arma_burg_batch(signal, order=16, criteria="KIC", corrected=True):
+
+    n_signals, N = signal.shape
+    dtype = complex if np.iscomplexobj(signal) else float
 
     # Initialisation
     # rho is variance of driving white noise process (prediction error)
-    rho = sum(abs(signal) ** 2.0) / float(N)
-    denominator = rho * 2.0 * N
+    rho = np.sum(np.abs(signal) ** 2.0, axis=1) / float(N)
 
-    ar = np.zeros(0, dtype=complex)  # AR parametric signal model estimate
-    ref = np.zeros(0, dtype=complex)  # vector K of reflection coefficients (parcor coefficients)
-    ef = signal.astype(complex)  # forward prediction error
-    eb = signal.astype(complex)  # backward prediction error
-    temp = 1.0
+    ar = np.zeros((n_signals, order), dtype=dtype)  # AR parametric signal model estimate
+    ref = np.zeros((n_signals, order), dtype=dtype)  # reflection coefficients (parcor coefficients)
+    ef = signal.astype(dtype)  # forward prediction error
+    eb = ef.copy()  # backward prediction error
+    residual_old = np.zeros(n_signals)
 
-    # Main recursion
+    active = np.ones(n_signals, dtype=bool)  # signals for which the recursion is still running
+    n_order = np.zeros(n_signals, dtype=int)
 
+    # Main recursion
     for k in range(0, order):
 
-        # calculate the next order reflection coefficient
-        numerator = sum([ef[j] * eb[j - 1].conjugate() for j in range(k + 1, N)])
-        denominator = temp * denominator - abs(ef[k]) ** 2 - abs(eb[N - 1]) ** 2
+        # calculate the next order reflection coefficient. The denominator is computed directly
+        # rather than with its recursive update, which loses precision when the reflection
+        # coefficients are close to 1 (e.g., for smooth or purely sinusoidal signals).
+        numerator = np.einsum("ij,ij->i", ef[:, k + 1 : N], np.conj(eb[:, k : N - 1]))
+        denominator = np.sum(np.abs(ef[:, k + 1 : N]) ** 2 + np.abs(eb[:, k : N - 1]) ** 2, axis=1)
         kp = -2.0 * numerator / denominator
 
         # Update the prediction error
-        temp = 1.0 - abs(kp) ** 2.0
+        temp = 1.0 - np.abs(kp) ** 2.0
         new_rho = temp * rho
 
         if criteria is not None:
             # k=k+1 because order goes from 1 to P whereas k starts at 0.
             residual_new = _criteria(criteria=criteria, N=N, k=k + 1, rho=new_rho, corrected=corrected)
             if k == 0:
-                residual_old = 2.0 * abs(residual_new)
+                residual_old = 2.0 * np.abs(residual_new)
 
             # Stop as criteria has reached
-            if residual_new > residual_old:
+            active &= ~(residual_new > residual_old)
+            if not np.any(active):
                 break
 
             # This should be after the criteria
             residual_old = residual_new
-        rho = new_rho
-        if rho <= 0:
-            raise ValueError("Found a negative value (expected positive strictly) %s." "Decrease the order" % rho)
-
-        ar = np.resize(ar, ar.size + 1)
-        ar[k] = kp
-        if k == 0:
-            for j in range(N - 1, k, -1):
-                ef_previous = ef[j]  # previous value
-                ef[j] = ef_previous + kp * eb[j - 1]  # Eq. (8.7)
-                eb[j] = eb[j - 1] + kp.conjugate() * ef_previous
 
-        else:
-            # Update the AR coeff
-            khalf = (k + 1) // 2  # khalf must be an integer
-            for j in range(0, khalf):
-                ar_previous = ar[j]  # previous value
-                ar[j] = ar_previous + kp * ar[k - j - 1].conjugate()  # Eq. (8.2)
-                if j != k - j - 1:
-                    ar[k - j - 1] = ar[k - j - 1] + kp * ar_previous.conjugate()  # Eq. (8.2)
-
-            # Update the forward and backward prediction errors
-            for j in range(N - 1, k, -1):
-                ef_previous = ef[j]  # previous value
-                ef[j] = ef_previous + kp * eb[j - 1]  # Eq. (8.7)
-                eb[j] = eb[j - 1] + kp.conjugate() * ef_previous
+        # Signals that have stopped are left untouched by a null reflection coefficient
+        kp = np.where(active, kp, 0)
+        rho = np.where(active, new_rho, rho)
+        if np.any(rho[active] <= 0):
+            raise ValueError(
+                "Found a negative value (expected positive strictly) %s." "Decrease the order" % rho[active].min()
+            )
+
+        # Update the AR coeff (Eq. 8.2)
+        ar[:, 0:k] = ar[:, 0:k] + kp[:, np.newaxis] * np.conj(ar[:, 0:k][:, ::-1])
+        ar[:, k] = kp
+
+        # Update the forward and backward prediction errors (Eq. 8.7)
+        ef_previous = ef[:, k + 1 : N].copy()
+        ef[:, k + 1 : N] += kp[:, np.newaxis] * eb[:, k : N - 1]
+        eb[:, k + 1 : N] = eb[:, k : N - 1] + np.conj(kp)[:, np.newaxis] * ef_previous
 
         # save the reflection coefficient
-        ref = np.resize(ref, ref.size + 1)
-        ref[k] = kp
+        ref[:, k] = kp
+        n_order[active] = k + 1
 
-    return ar, rho, ref
+    return ar, rho, ref, n_order
 
 
 # =============================================================================
@@ -434,28 +474,22 @@ def _criteria(criteria=None, N=None, k=None, rho=None, corrected=True):
 
 
 def _signal_psd_from_arma(ar=None, ma=None, rho=1., sampling_rate=1000, nfft=None, side="one-sided"):
+    """PSD of an ARMA model, obtained from the FFT of its polynomials.
 
+    ``ar`` and ``ma`` can be 2D (one row of coefficients per model, with ``rho`` being a vector), in
+    which case the PSDs of all models are returned as rows.
 
+    """
     if ar is None and ma is None:
         raise ValueError("Either AR or MA model must be provided")
-
-    psd = np.zeros(nfft, dtype=complex)
+    if np.ndim(rho) > 0:
+        rho = np.asarray(rho)[:, np.newaxis]
 
     if ar is not None:
-        ip = len(ar)
-        den = np.zeros(nfft, dtype=complex)
-        den[0] = 1.0 + 0j
-        for k in range(0, ip):
-            den[k + 1] = ar[k]
-        denf = np.fft.fft(den, nfft)
+        denf = np.fft.fft(_signal_psd_polynomial(ar), nfft)
 
     if ma is not None:
-        iq = len(ma)
-        num = np.zeros(nfft, dtype=complex)
-        num[0] = 1.0 + 0j
-        for k in range(0, iq):
-            num[k + 1] = ma[k]
-        numf = np.fft.fft(num, nfft)
+        numf = np.fft.fft(_signal_psd_polynomial(ma), nfft)
 
     if ar is not None and ma is not None:
         psd = rho / sampling_rate * abs(numf) ** 2.0 / abs(denf) ** 2.0
@@ -468,9 +502,9 @@ def _signal_psd_from_arma(ar=None, ma=None, rho=1., sampling_rate=1000, nfft=Non
 
     # convert to one-sided
     if side == "one-sided":
-        assert len(psd) % 2 == 0
-        one_side_psd = np.array(psd[0 : len(psd) // 2 + 1]) * 2.0
-        one_side_psd[0] /= 2.0
+        assert psd.shape[-1] % 2 == 0
+        one_side_psd = np.array(psd[..., 0 : psd.shape[-1] // 2 + 1]) * 2.0
+        one_side_psd[..., 0] /= 2.0
         #        one_side_psd[-1] = psd[-1]
         psd = one_side_psd
 
@@ -484,3 +518,9 @@ def _signal_psd_from_arma(ar=None, ma=None, rho=1., sampling_rate=1000, nfft=Non
         psd = center_psd
 
     return psd
+
+
+def _signal_psd_polynomial(coefs):
+    """Prepend the leading 1 to the coefficients of an AR or MA polynomial."""
+    coefs = np.asarray(coefs)
+    return np.concatenate([np.ones(coefs.shape[:-1] + (1,), dtype=coefs.dtype), coefs], axis=-1)
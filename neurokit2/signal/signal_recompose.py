@@ -2,10 +2,8 @@ import matplotlib.pyplot as plt
 import numpy as np
 import scipy.cluster
 
-from .signal_zerocrossings import signal_zerocrossings
 
-
-def signal_recompose(components, method="wcorr", threshold=0.5, keep_sd=None, **kwargs):
+def signal_recompose(components, method="wcorr", threshold=0.5, keep_sd=None, window=None, **kwargs):
     """Combine signal sources after decomposition.
 
     Combine and reconstruct meaningful signal sources after signal decomposition.
@@ -23,6 +21,12 @@ def signal_recompose(components, method="wcorr", threshold=0.5, keep_sd=None, **
         or equal to that percentage of the max standard deviaiton (SD) of the components. For
         instance, ``keep_sd=0.01`` will remove all components with SD is lower that 1% of the
         max SD. This can be used to filter out noise.
+    window : int
+        The length of the window (i.e., of the subseries in the trajectory matrix) of the singular
+        spectrum analysis (SSA) that produced the components, used to weight the w-correlations. If
+        ``None`` (default), it is the number of components, as when ``signal_decompose()`` is called
+        without ``window``. It must be specified when the components were obtained with a (longer)
+        ``window``.
     **kwargs
         Other arguments to override for instance ``metric='chebyshev'``.
 
@@ -53,7 +57,7 @@ def signal_recompose(components, method="wcorr", threshold=0.5, keep_sd=None, **
     # Apply method
     method = method.lower()
     if method in ["wcorr"]:
-        clusters = _signal_recompose_wcorr(components, threshold=threshold, **kwargs)
+        clusters = _signal_recompose_wcorr(components, threshold=threshold, window=window, **kwargs)
         recomposed = _signal_recompose_sum(components, clusters)
     else:
         raise ValueError("NeuroKit error: signal_decompose(): 'method' should be one of 'emd'")
@@ -89,10 +93,10 @@ def _signal_recompose_sum(components, clusters):
 
 # Weighted Correlation
 # ----------------------------------------------------------------------------
-def _signal_recompose_wcorr(components, threshold=0.5, metric="chebyshev"):
+def _signal_recompose_wcorr(components, threshold=0.5, window=None, metric="chebyshev"):
     """"""
     # Calculate the w-correlation matrix.
-    wcorr = _signal_recompose_get_wcorr(components, show=False)
+    wcorr = _signal_recompose_get_wcorr(components, window=window, show=False)
 
     # Find clusters in correlation matrix
     pairwise_distances = scipy.cluster.hierarchy.distance.pdist(wcorr, metric=metric)
@@ -103,7 +107,7 @@ def _signal_recompose_wcorr(components, threshold=0.5, metric="chebyshev"):
     return clusters
 
 
-def _signal_recompose_get_wcorr(components, show=False):
+def _signal_recompose_get_wcorr(components, window=None, show=False):
     """Calculates the weighted correlation matrix for the time series.
 
     References
@@ -111,28 +115,27 @@ def _signal_recompose_get_wcorr(components, show=False):
     - https://www.kaggle.com/jdarcy/introducing-ssa-for-time-series-decomposition
 
     """
-    # Reorient components
-    components = components.T
-
-    L = components.shape[1]
-    K = components.shape[0] - L + 1
-
-    # Calculate the weights
-    w = np.array(list(np.arange(L) + 1) + [L] * (K - L - 1) + list(np.arange(L) + 1)[::-1])
-
-    def w_inner(F_i, F_j):
-        return w.dot(F_i * F_j)
-
-    # Calculated weighted norms, ||F_i||_w, then invert.
-    F_wnorms = np.array([w_inner(components[:, i], components[:, i]) for i in range(L)])
-    F_wnorms = F_wnorms ** -0.5
-
-    # Calculate Wcorr.
-    Wcorr = np.identity(L)
-    for i in range(L):
-        for j in range(i + 1, L):
-            Wcorr[i, j] = abs(w_inner(components[:, i], components[:, j]) * F_wnorms[i] * F_wnorms[j])
-            Wcorr[j, i] = Wcorr[i, j]
+    components = np.asarray(components)
+    n_components, N = components.shape
+    # The window length (the number of components for a decomposition with a full window)
+    L = n_components if window is None else window
+    if not n_components <= L <= N / 2:
+        raise ValueError(
+            "NeuroKit error: signal_recompose(): the `window` must be at least the number of components,"
+            " and at most half the length of the signal."
+        )
+    K = N - L + 1
+
+    # Calculate the weights (the number of elements in each anti-diagonal of the trajectory matrix)
+    w = np.minimum(np.minimum(np.arange(1, N + 1), np.arange(N, 0, -1)), min(L, K))
+
+    # Weighted inner products of all pairs of components, (F_i, F_j)_w, as a single Gram product
+    Wcorr = (components * w) @ components.T
+
+    # Normalize by the weighted norms, ||F_i||_w.
+    F_wnorms = np.diag(Wcorr) ** -0.5
+    Wcorr = np.abs(Wcorr * F_wnorms[:, np.newaxis] * F_wnorms[np.newaxis, :])
+    np.fill_diagonal(Wcorr, 1)
 
     if show is True:
         ax = plt.imshow(Wcorr)
@@ -163,11 +166,8 @@ def _signal_recompose_filter_sd(components, threshold=0.01):
 
 
 def _signal_recompose_meanfreq(components, sampling_rate=1000):
-    """Get the mean frequency of components."""
-    duration = components.shape[1] / sampling_rate
-    n = len(components)
-    freqs = np.zeros(n)
-
-    for i in range(n):
-        c = components[i, :] - np.mean(components[i, :])
-        freqs[i] = len(signal_zerocrossings(c)) / duration
+    """Get the mean frequency of components (the centroid of their power spectrum)."""
+    components = np.asarray(components)
+    power = np.abs(np.fft.rfft(components - np.mean(components, axis=1, keepdims=True), axis=1)) ** 2
+    freqs = np.fft.rfftfreq(components.shape[1], d=1 / sampling_rate)
+    return power @ freqs / np.sum(power, axis=1)
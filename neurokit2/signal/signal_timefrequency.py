@@ -6,7 +6,22 @@ import matplotlib.pyplot as plt
 from ..signal.signal_detrend import signal_detrend
 
 
-def signal_timefrequency(signal, sampling_rate=1000, min_frequency=0.04, max_frequency=None, method="stft", window=None, window_type='hann', mode='psd', nfreqbin=None, overlap=None, analytical_signal=True, show=True):
+def signal_timefrequency(
+    signal,
+    sampling_rate=1000,
+    min_frequency=0.04,
+    max_frequency=None,
+    method="stft",
+    window=None,
+    window_type='hann',
+    mode='psd',
+    nfreqbin=None,
+    overlap=None,
+    analytical_signal=True,
+    hop=1,
+    chunksize=None,
+    show=True,
+):
     """Quantify changes of a nonstationary signal’s frequency over time.
     The objective of time-frequency analysis is to offer a more informative description of the signal
     which reveals the temporal variation of its frequency contents.
@@ -42,7 +57,7 @@ def signal_timefrequency(signal, sampling_rate=1000, min_frequency=0.04, max_fre
     sampling_rate : int
         The sampling frequency of the signal (in Hz, i.e., samples/second).
     method : str
-        Time-Frequency decomposition method.
+        Time-Frequency decomposition method. Can be 'stft', 'cwt', 'wvd', 'pwvd' or 'spwvd'.
     min_frequency : float
         The minimum frequency.
     max_frequency : float
@@ -63,6 +78,13 @@ def signal_timefrequency(signal, sampling_rate=1000, min_frequency=0.04, max_fre
     analytical_signal : bool
         If True, analytical signal instead of actual signal is used in Wigner Ville Distrubution
         methods.
+    hop : int
+        The step (in samples) between the time points at which the Wigner Ville Distribution methods
+        are computed. Increasing it reduces the time resolution, as well as the computation time and the
+        size of the output, which is useful for long signals. Defaults to 1.
+    chunksize : int
+        If not None, the Wigner Ville Distribution methods process the time points in chunks of this
+        size, which bounds the memory used for long signals.
     show : bool
         If True, will return two PSD plots.
 
@@ -86,6 +108,8 @@ def signal_timefrequency(signal, sampling_rate=1000, min_frequency=0.04, max_fre
     >>> f, t, cwtm = nk.signal_timefrequency(signal, sampling_rate, max_frequency=20, method="cwt", show=True)
     >>> f, t, wvd = nk.signal_timefrequency(signal, sampling_rate, max_frequency=20, method="wvd", show=True)
     >>> f, t, pwvd = nk.signal_timefrequency(signal, sampling_rate, max_frequency=20, method="pwvd", show=True)
+    >>> f, t, spwvd = nk.signal_timefrequency(signal, sampling_rate, max_frequency=20, method="spwvd", hop=10,
+    ...                                       show=True)
     """
     # Initialize empty container for results
     # Define window length
@@ -98,40 +122,53 @@ def signal_timefrequency(signal, sampling_rate=1000, min_frequency=0.04, max_fre
     if method.lower() in ["stft"]:
 
         frequency, time, tfr = short_term_ft(
-                signal,
-                sampling_rate=sampling_rate,
-                overlap=overlap,
-                window=window,
-                mode=mode,
-                min_frequency=min_frequency,
-                window_type=window_type
-                )
+            signal,
+            sampling_rate=sampling_rate,
+            overlap=overlap,
+            window=window,
+            mode=mode,
+            min_frequency=min_frequency,
+            window_type=window_type
+        )
     # CWT
     elif method.lower() in ["cwt", "wavelet"]:
         frequency, time, tfr = continuous_wt(
-                signal,
-                sampling_rate=sampling_rate,
-                min_frequency=min_frequency,
-                max_frequency=max_frequency
-                )
+            signal,
+            sampling_rate=sampling_rate,
+            min_frequency=min_frequency,
+            max_frequency=max_frequency
+        )
     # WVD
     elif method in ["WignerVille", "wvd"]:
         frequency, time, tfr = wvd(
-                signal,
-                sampling_rate=sampling_rate,
-                n_freqbins=nfreqbin,
-                analytical_signal=analytical_signal,
-                method="WignerVille"
-                )
+            signal,
+            sampling_rate=sampling_rate,
+            n_freqbins=nfreqbin,
+            analytical_signal=analytical_signal,
+            method="WignerVille",
+            hop=hop,
+            chunksize=chunksize
+        )
     # pseudoWVD
     elif method in ["pseudoWignerVille", "pwvd"]:
         frequency, time, tfr = wvd(
-                signal,
-                sampling_rate=sampling_rate,
-                n_freqbins=nfreqbin,
-                analytical_signal=analytical_signal,
-                method="pseudoWignerVille"
-                )
+            signal,
+            sampling_rate=sampling_rate,
+            n_freqbins=nfreqbin,
+            analytical_signal=analytical_signal,
+            method="pseudoWignerVille",
+            hop=hop,
+            chunksize=chunksize
+        )
+    # smoothed pseudoWVD
+    elif method in ["smoothedpseudoWignerVille", "spwvd"]:
+        frequency, time, tfr = smooth_pseudo_wvd(
+            signal,
+            sampling_rate=sampling_rate,
+            segment_step=hop,
+            nfreqbin=nfreqbin,
+            chunksize=chunksize
+        )
 
     # Sanitize output
     lower_bound = len(frequency) - len(frequency[frequency >= min_frequency])
@@ -141,12 +178,13 @@ def signal_timefrequency(signal, sampling_rate=1000, min_frequency=0.04, max_fre
 
     if show is True:
         plot_timefrequency(
-                z,
-                time,
-                f,
-                signal=signal,
-                method=method,
-                )
+            z,
+            time,
+            f,
+            signal=signal,
+            method=method,
+            sampling_rate=sampling_rate
+        )
 
 
     return f, time, z
@@ -224,12 +262,50 @@ def continuous_wt(signal, sampling_rate=1000, min_frequency=0.04, max_frequency=
 # =============================================================================
 # Wigner-Ville Distribution
 # =============================================================================
-def wvd(signal, sampling_rate=1000, n_freqbins=None, analytical_signal=True, method="WignerVille"):
+def wvd(signal, sampling_rate=1000, n_freqbins=None, analytical_signal=True, method="WignerVille",
+        hop=1, chunksize=None, out=None):
     """Wigner Ville Distribution and Pseudo-Wigner Ville Distribution.
+
+    The lag products of all the time points are gathered in a (n_freqbins x n_times) lag matrix,
+    which is transformed with a single FFT.
+
+    Parameters
+    ----------
+    signal : Union[list, np.array, pd.Series]
+        The signal (i.e., a time series) in the form of a vector of values.
+    sampling_rate : int
+        The sampling frequency of the signal (in Hz, i.e., samples/second).
+    n_freqbins : int
+        Number of frequency bins. Defaults to 256.
+    analytical_signal : bool
+        If True, analytical signal instead of actual signal is used.
+    method : str
+        Can be "WignerVille" or "pseudoWignerVille".
+    hop : int
+        The step (in samples) between the time points at which the distribution is computed.
+        Defaults to 1 (every sample).
+    chunksize : int
+        If not None, the time points are processed in chunks of this size, which bounds the memory
+        used by the lag matrix.
+    out : np.ndarray
+        Preallocated array (e.g., a ``np.memmap``) of shape (n_freqbins, n_times) in which the
+        distribution is written. If None (default), a new array is created.
+
+    Returns
+    -------
+    frequency : np.array
+        Frequency.
+    time : np.array
+        Time array.
+    tfr : np.array
+        The distribution. Time increases across its columns and frequency increases down the rows.
+
     """
     # Compute the analytical signal
     if analytical_signal:
         signal = scipy.signal.hilbert(signal_detrend(signal))
+    signal = np.asarray(signal)
+    N = signal.shape[0]
 
     # Pre-processing
     if n_freqbins is None:
@@ -240,46 +316,39 @@ def wvd(signal, sampling_rate=1000, n_freqbins=None, analytical_signal=True, met
         fwindows_mpts = len(fwindows) // 2
         windows_length = n_freqbins // 4
         windows_length = windows_length - windows_length % 2 + 1
-        windows = scipy.hamming(windows_length)
+        windows = np.hamming(windows_length)
         fwindows[fwindows_mpts + np.arange(- windows_length // 2, windows_length // 2)] = windows
     else:
         fwindows = np.ones(n_freqbins + 1)
         fwindows_mpts = len(fwindows) // 2
 
-    time = np.arange(len(signal)) * 1.0 / sampling_rate
-
-    # This is discrete frequency (should we return?)
-    if n_freqbins % 2 == 0:
-        frequency = np.hstack((np.arange(n_freqbins / 2),
-                               np.arange(-n_freqbins / 2, 0)))
-    else:
-        frequency = np.hstack((np.arange((n_freqbins - 1) / 2),
-                               np.arange(-(n_freqbins - 1) / 2, 0)))
-    tfr = np.zeros((n_freqbins, time.shape[0]), dtype=complex)  # the time-frequency matrix
+    times = np.arange(0, N, hop)
+    time = times / sampling_rate
+    tfr = _timefrequency_output(out, (n_freqbins, len(times)))
 
     tausec = round(n_freqbins / 2.0)
     winlength = tausec - 1
-    # taulens: len of tau for each step
-    taulens = np.min(np.c_[np.arange(signal.shape[0]),
-                           signal.shape[0] - np.arange(signal.shape[0]) - 1,
-                           winlength * np.ones(time.shape)], axis=1)
-    conj_signal = np.conj(signal)
-    # iterate and compute the wv for each indices
-    for idx in range(time.shape[0]):
-        tau = np.arange(-taulens[idx], taulens[idx] + 1).astype(int)
-        # this step is required to use the efficient DFT
-        indices = np.remainder(n_freqbins + tau, n_freqbins).astype(int)
-        tfr[indices, idx] = fwindows[fwindows_mpts + tau] * signal[idx + tau] * conj_signal[idx - tau]
-        if (idx < signal.shape[0] - tausec) and (idx >= tausec + 1):
-            tfr[tausec, idx] = fwindows[fwindows_mpts + tausec] * signal[idx + tausec] * \
-                np.conj(signal[idx - tausec]) + \
-                fwindows[fwindows_mpts - tausec] * signal[idx - tausec] * conj_signal[idx + tausec]
-            tfr[tausec, idx] *= 0.5
-
-    # Now tfr contains the product of the signal segments and its conjugate.
-    # To find wd we need to apply fft one more time.
-    tfr = np.fft.fft(tfr, axis=0)
-    tfr = np.real(tfr)
+    tau = np.arange(-winlength, winlength + 1)
+    # this step is required to use the efficient DFT
+    indices = np.remainder(n_freqbins + tau, n_freqbins)
+
+    for chunk in _timefrequency_chunks(len(times), chunksize):
+        t = times[chunk]
+        lag_matrix = np.zeros((n_freqbins, len(t)), dtype=complex)
+        lag_matrix[indices] = _wvd_lagproducts(signal, t, tau, weights=fwindows[fwindows_mpts + tau])
+
+        # Lag of half the number of bins (averaged over the positive and the negative lag)
+        half = (t < N - tausec) & (t >= tausec + 1)
+        if np.any(half):
+            t_half = t[half]
+            lag_matrix[tausec, half] = fwindows[fwindows_mpts + tausec] * signal[t_half + tausec] * \
+                np.conj(signal[t_half - tausec]) + \
+                fwindows[fwindows_mpts - tausec] * signal[t_half - tausec] * np.conj(signal[t_half + tausec])
+            lag_matrix[tausec, half] *= 0.5
+
+        # Now the lag matrix contains the product of the signal segments and its conjugate.
+        # To find wd we need to apply fft one more time.
+        tfr[:, chunk] = np.real(np.fft.fft(lag_matrix, axis=0))
 
     # continuous time frequency
     frequency = 0.5 * np.arange(n_freqbins, dtype=float) / n_freqbins * sampling_rate
@@ -292,25 +361,37 @@ def wvd(signal, sampling_rate=1000, n_freqbins=None, analytical_signal=True, met
 # =============================================================================
 
 
-def smooth_pseudo_wvd(signal, sampling_rate=1000, freq_length=None, time_length=None, segment_step=1, nfreqbin=None, window_method="hamming"):
+def smooth_pseudo_wvd(signal, sampling_rate=1000, freq_length=None, time_length=None, segment_step=1,
+                      nfreqbin=None, window_method="hamming", chunksize=None, out=None):
     """Smoothed Pseudo Wigner Ville Distribution
 
+    For each lag, the lag products of the signal are smoothed over time by a convolution with the time
+    window (normalised by the part of the window that overlaps the signal), and the resulting lag
+    matrix is weighted by the frequency window and transformed with a single FFT.
+
     Parameters
     ----------
     signal : Union[list, np.array, pd.Series]
         The signal (i.e., a time series) in the form of a vector of values.
     sampling_rate : int
         The sampling frequency of the signal (in Hz, i.e., samples/second).
-    freq_length : np.ndarray
-        Lenght of frequency smoothing window.
-    time_length: np.array
-        Lenght of time smoothing window
+    freq_length : int
+        Length of frequency smoothing window (must be odd). Defaults to a quarter of the signal length.
+    time_length: int
+        Length of time smoothing window (must be odd). Defaults to a tenth of the signal length.
     segment_step : int
-        The step between samples in `time_array`. Default to 1.
+        The step (in samples) between the time points at which the distribution is computed.
+        Default to 1.
     nfreqbin : int
-        Number of Frequency bins.
+        Number of Frequency bins. Defaults to 300.
     window_method : str
-        Method used to create smoothing windows. Can be "hanning"/ "hamming" or "gaussian".
+        Method used to create smoothing windows. Can be "hamming" or "gaussian".
+    chunksize : int
+        If not None, the time points are processed in chunks of this size, which bounds the memory
+        used by the lag matrix.
+    out : np.ndarray
+        Preallocated array (e.g., a ``np.memmap``) of shape (nfreqbin, n_times) in which the
+        distribution is written. If None (default), a new array is created.
 
     Returns
     -------
@@ -330,24 +411,20 @@ def smooth_pseudo_wvd(signal, sampling_rate=1000, freq_length=None, time_length=
 
     # Define parameters
     N = len(signal)
-    # sample_spacing = 1 / sampling_rate
     if nfreqbin is None:
         nfreqbin = 300
 
     # Zero-padded signal to length 2N
+    signal = signal_detrend(signal)
     signal_padded = np.append(signal, np.zeros_like(signal))
 
     # DFT
     signal_fft = np.fft.fft(signal_padded)
-    signal_fft[1: N-1] = signal_fft[1: N-1] * 2
-    signal_fft[N:] = 0
-
-    # Inverse FFT
-    signal_ifft = np.fft.ifft(signal_fft)
-    signal_ifft[N:] = 0
+    signal_fft[1:N] = signal_fft[1:N] * 2
+    signal_fft[N + 1:] = 0
 
-    # Make analytic signal
-    signal = scipy.signal.hilbert(signal_detrend(signal_ifft))
+    # Make analytic signal (inverse FFT)
+    signal = np.fft.ifft(signal_fft)[0:N]
 
     # Create smoothing windows in time and frequency
     if freq_length is None:
@@ -355,101 +432,143 @@ def smooth_pseudo_wvd(signal, sampling_rate=1000, freq_length=None, time_length=
         # Plus one if window length is not odd
         if freq_length % 2 == 0:
             freq_length += 1
-    elif len(freq_length) % 2 == 0:
-        raise ValueError("The length of frequency smoothing window must be odd.")
+    elif freq_length % 2 == 0:
+        raise ValueError("NeuroKit error: smooth_pseudo_wvd(): the length of frequency smoothing window must be odd.")
 
     if time_length is None:
         time_length = np.floor(N / 10.0)
         # Plus one if window length is not odd
         if time_length % 2 == 0:
             time_length += 1
-    elif len(time_length) % 2 == 0:
-        raise ValueError("The length of time smoothing window must be odd.")
+    elif time_length % 2 == 0:
+        raise ValueError("NeuroKit error: smooth_pseudo_wvd(): the length of time smoothing window must be odd.")
+    freq_length = int(freq_length)
+    time_length = int(time_length)
 
     if window_method == "hamming":
-        freq_window = scipy.signal.hamming(int(freq_length))  # normalize by max
-        time_window = scipy.signal.hamming(int(time_length))  # normalize by max
+        freq_window = scipy.signal.windows.hamming(freq_length)  # normalize by max
+        time_window = scipy.signal.windows.hamming(time_length)  # normalize by max
     elif window_method == "gaussian":
         std_freq = freq_length / (6 * np.sqrt(2 * np.log(2)))
-        freq_window = scipy.signal.gaussian(freq_length, std_freq)
+        freq_window = scipy.signal.windows.gaussian(freq_length, std_freq)
         freq_window /= max(freq_window)
         std_time = time_length / (6 * np.sqrt(2 * np.log(2)))
-        time_window = scipy.signal.gaussian(time_length, std_time)
+        time_window = scipy.signal.windows.gaussian(time_length, std_time)
         time_window /= max(time_window)
-    # to add warning if method is not one of the supported methods
+    else:
+        raise ValueError(
+            "NeuroKit error: smooth_pseudo_wvd(): 'window_method' should be one of 'hamming' or 'gaussian'."
+        )
 
     # Mid-point index of windows
     midpt_freq = (len(freq_window) - 1) // 2
-    midpt_time = (len(time_window) - 1) // 2
 
     # Create arrays
-    time_array = np.arange(start=0, stop=N, step=segment_step, dtype=int) / sampling_rate
-    # frequency_array = np.fft.fftfreq(nfreqbin, sample_spacing)[0:nfreqbin / 2]
-    frequency_array = 0.5 * np.arange(nfreqbin, dtype=float) / N
-    pwvd = np.zeros((nfreqbin, len(time_array)), dtype=complex)
-
-    # Calculate pwvd
-    for i, t in enumerate(time_array):
-        # time shift
-        tau_max = np.min([t + midpt_time - 1,
-                          N - t + midpt_time,
-                          np.round(N / 2.0) - 1,
-                          midpt_freq])
-        # time-lag list
-        tau = np.arange(start=-np.min([midpt_time, N - t]),
-                        stop=np.min([midpt_time, t - 1]) + 1,
-                        dtype='int')
-        time_pts = (midpt_time + tau).astype(int)
-        g2 = time_window[time_pts]
-        g2 = g2 / np.sum(g2)
-        signal_pts = (t - tau - 1).astype(int)
+    times = np.arange(start=0, stop=N, step=segment_step, dtype=int)
+    time_array = times / sampling_rate
+    frequency_array = 0.5 * np.arange(nfreqbin, dtype=float) / nfreqbin * sampling_rate
+    pwvd = _timefrequency_output(out, (nfreqbin, len(times)))
+
+    # Lags (the lag of half the number of bins, if any, is averaged over its positive and negative side)
+    tau_max = int(min(np.round(nfreqbin / 2.0) - 1, midpt_freq))
+    tau = np.arange(tau_max + 1)
+    tau_half = nfreqbin // 2 if (nfreqbin % 2 == 0 and nfreqbin // 2 <= midpt_freq) else None
+    if tau_half is not None:
+        tau = np.append(tau, tau_half)
+
+    for chunk in _timefrequency_chunks(len(times), chunksize):
+        t = times[chunk]
+        rmm = _spwvd_smoothed_lagproducts(signal, t, tau, time_window)
+
+        lag_matrix = np.zeros((nfreqbin, len(t)), dtype=complex)
         # zero frequency
-        pwvd[0, i] = np.sum(g2 * signal[signal_pts] * np.conjugate(signal[signal_pts]))
-        # other frequencies
-        for m in range(int(tau_max)):
-            tau = np.arange(start=-np.min([midpt_time, N - t - m]),
-                            stop=np.min([midpt_time, t - m - 1]) + 1,
-                            dtype='int')
-            time_pts = (midpt_time + tau).astype(int)
-            g2 = time_window[time_pts]
-            g2 = g2 / np.sum(g2)
-            signal_pt1 = (t + m - tau - 1).astype(int)
-            signal_pt2 = (t - m - tau - 1).astype(int)
-            # compute positive half
-            rmm = np.sum(g2 * signal[signal_pt1] * np.conjugate(signal[signal_pt2]))
-            pwvd[m + 1, i] = freq_window[midpt_freq + m + 1] * rmm
-            # compute negative half
-            rmm = np.sum(g2 * signal[signal_pt2] * np.conjugate(signal[signal_pt1]))
-            pwvd[nfreqbin - m - 1, i] = freq_window[midpt_freq - m + 1] * rmm
-
-        m = np.round(N / 2.0)
-
-        if t <= N - m and t >= m + 1 and m <= midpt_freq:
-            tau = np.arange(start=-np.min([midpt_time, N - t - m]),
-                            stop=np.min([midpt_time, t - 1 - m]) + 1,
-                            dtype='int')
-            time_pts = (midpt_time + tau + 1).astype(int)
-            g2 = time_window[time_pts]
-            g2 = g2 / np.sum(g2)
-            signal_pt1 = (t + m - tau).astype(int)
-            signal_pt2 = (t - m - tau).astype(int)
-            x = np.sum(g2 * signal[signal_pt1] * np.conjugate(signal[signal_pt2]))
-            x *= freq_window[midpt_freq + m + 1]
-            y = np.sum(g2 * signal[signal_pt2] * np.conjugate(signal[signal_pt1]))
-            y *= freq_window[midpt_freq - m + 1]
-            pwvd[m, i] = 0.5 * (x + y)
-
-    pwvd = np.real(np.fft.fft(pwvd, axis=0))
-
-    # Visualization
+        lag_matrix[0] = rmm[0]
+        # positive and negative lags
+        positive = tau[1:tau_max + 1]
+        lag_matrix[positive] = freq_window[midpt_freq + positive, np.newaxis] * rmm[1:tau_max + 1]
+        lag_matrix[nfreqbin - positive] = freq_window[midpt_freq - positive, np.newaxis] * np.conj(
+            rmm[1:tau_max + 1]
+        )
+        if tau_half is not None:
+            half = (t <= N - 1 - tau_half) & (t >= tau_half)
+            lag_matrix[tau_half, half] = 0.5 * (
+                freq_window[midpt_freq + tau_half] * rmm[-1, half]
+                + freq_window[midpt_freq - tau_half] * np.conj(rmm[-1, half])
+            )
+
+        pwvd[:, chunk] = np.real(np.fft.fft(lag_matrix, axis=0))
 
     return frequency_array, time_array, pwvd
 
 
+# =============================================================================
+# Internals
+# =============================================================================
+def _wvd_lagproducts(signal, t, tau, weights=None):
+    """Lag products ``signal[t + tau] * conj(signal[t - tau])`` as a (lags x times) matrix.
+
+    Products for which one of the two samples falls outside of the signal are set to 0.
+    """
+    N = len(signal)
+    plus = t + tau[:, np.newaxis]
+    minus = t - tau[:, np.newaxis]
+    valid = (plus >= 0) & (plus < N) & (minus >= 0) & (minus < N)
+
+    products = signal[np.clip(plus, 0, N - 1)]
+    if weights is not None:
+        products = weights[:, np.newaxis] * products
+    products = products * np.conj(signal[np.clip(minus, 0, N - 1)])
+    products[~valid] = 0
+    return products
+
+
+def _spwvd_smoothed_lagproducts(signal, t, tau, time_window):
+    """Lag products smoothed over time by the (normalised) time window, at the time points t."""
+    N = len(signal)
+    midpt_time = (len(time_window) - 1) // 2
+
+    # Lag products of all the samples covered by the time window around the time points
+    start = max(t[0] - midpt_time, 0)
+    end = min(t[-1] + midpt_time, N - 1)
+    products = _wvd_lagproducts(signal, np.arange(start, end + 1), tau)
+
+    # Convolve with the time window, and pick the time points
+    smoothed = scipy.signal.fftconvolve(products, time_window[np.newaxis, :], mode="full", axes=1)
+    smoothed = smoothed[:, t - start + midpt_time]
+
+    # Normalise by the sum of the window over the samples at which the products are defined, i.e.,
+    # the shifts p (|p| <= midpt_time) for which 0 <= t - p - tau and t - p + tau <= N - 1
+    cumsum = np.concatenate([[0], np.cumsum(time_window)])
+    lower = np.clip(t + tau[:, np.newaxis] - N + 1, -midpt_time, midpt_time + 1)
+    upper = np.clip(t - tau[:, np.newaxis], -midpt_time - 1, midpt_time)
+    valid = upper >= lower
+    norm = cumsum[np.where(valid, upper, lower - 1) + midpt_time + 1] - cumsum[lower + midpt_time]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        smoothed = np.where(valid, smoothed / norm, 0)
+    return smoothed
+
+
+def _timefrequency_output(out, shape):
+    if out is None:
+        return np.zeros(shape)
+    if out.shape != shape:
+        raise ValueError(
+            "NeuroKit error: signal_timefrequency(): 'out' should be of shape " + str(shape) + "."
+        )
+    return out
+
+
+def _timefrequency_chunks(n, chunksize=None):
+    if chunksize is None:
+        chunksize = max(n, 1)
+    return [slice(i, min(i + chunksize, n)) for i in range(0, n, chunksize)]
+
+
 # =============================================================================
 # Plot function
 # =============================================================================
-def plot_timefrequency(z, time, f, signal=None, method="stft"):
+def plot_timefrequency(z, time, f, signal=None, method="stft", sampling_rate=1000):
     """Visualize a time-frequency matrix.
     """
 
@@ -468,12 +587,14 @@ def plot_timefrequency(z, time, f, signal=None, method="stft"):
     elif method == "wvd":
         figure_title = "Wigner Ville Distrubution Spectrogram"
         fig = plt.figure()
-        plt.plot(time, signal)
+        plt.plot(np.arange(len(signal)) / sampling_rate, signal)
         plt.xlabel('Time (sec)')
         plt.ylabel('Signal')
 
     elif method == "pwvd":
         figure_title = "Pseudo Wigner Ville Distribution Spectrogram"
+    elif method == "spwvd":
+        figure_title = "Smoothed Pseudo Wigner Ville Distribution Spectrogram"
 
     fig, ax = plt.subplots()
     spec = ax.pcolormesh(time, f, z, cmap=plt.get_cmap("magma"))
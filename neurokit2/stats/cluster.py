@@ -290,7 +290,7 @@ def _cluster_kmedoids(data, n_clusters=2, max_iterations=1000, random_state=None
 # Modified K-means
 # =============================================================================
 def _cluster_kmod(data, n_clusters=4, max_iterations=1000, threshold=1e-6, random_state=None,
-                  optimize=False, **kwargs):
+                  optimize=False, gev_threshold=None, init_clusters=None, **kwargs):
     """The modified K-means clustering algorithm,
 
     adapted from Marijn van Vliet and Frederic von Wegner.
@@ -315,6 +315,13 @@ def _cluster_kmod(data, n_clusters=4, max_iterations=1000, threshold=1e-6, rando
     optimized : bool
         To use a new optimized method in https://www.biorxiv.org/content/10.1101/289850v1.full.pdf.
         For the Kmeans modified method. Default to False.
+    gev_threshold : float
+        If not None, the algorithm is abandoned (and ``info["abandoned"]`` set to True) as soon as the
+        variance explained by the maps (i.e., the GEV of the data) is not expected to reach this value,
+        extrapolating its (geometrically decreasing) gains over the iterations.
+    init_clusters : np.ndarray
+        Initial maps (n_clusters x n_features), for instance from a previous solution (warm start).
+        If None (default), random timepoints are used.
     **kwargs
         Other arguments to be passed into ``sklearn`` functions.
 
@@ -336,54 +343,36 @@ def _cluster_kmod(data, n_clusters=4, max_iterations=1000, threshold=1e-6, rando
     # Select random timepoints for our initial topographic maps
     if not isinstance(random_state, np.random.RandomState):
         random_state = np.random.RandomState(random_state)
-    init_times = random_state.choice(n_samples, size=n_clusters, replace=False)
+    if init_clusters is None:
+        init_times = random_state.choice(n_samples, size=n_clusters, replace=False)
 
-    # Initialize random cluster centroids
-    clusters = data[init_times, :]
+        # Initialize random cluster centroids
+        clusters = data[init_times, :]
+    else:
+        clusters = np.array(init_clusters, dtype=float)
 
     # Normalize row-wise (across EEG channels)
     clusters /= np.linalg.norm(clusters, axis=1, keepdims=True)  # Normalize the maps
 
+    # Step 3: Assign each sample to the best matching microstate
+    activation = clusters.dot(data.T)
+    segmentation = np.argmax(np.abs(activation), axis=0)
 
     # Initialize iteration
     prev_residual = 0
+    explained_variance = []
+    abandoned = False
     for i in range(max_iterations):
 
-        # Step 3: Assign each sample to the best matching microstate
-        activation = clusters.dot(data.T)
-        segmentation = np.argmax(np.abs(activation), axis=0)
-
         # Step 4: Recompute the topographic maps of the microstates, based on the
         # samples that were assigned to each state.
-        for state in np.arange(n_clusters):
-
-            # Get data fro specific state
-            idx = (segmentation == state)
-            data_state = data[idx, :]
-
-            # Sanity check
-            if np.sum(idx) == 0:
-                clusters[state] = 0
-                continue
-
-            # Retrieve map values
-
-            if optimize:
-                # Method 2 - optimized segmentation
-                state_vals = data_state.T.dot(activation[state, idx])
-            else:
-                # Method 1 - eighen value
-                # step 4a
-                Sk = np.dot(data_state.T, data_state)
-                # step 4b
-                eigen_vals, eigen_vectors = scipy.linalg.eigh(Sk)
-                state_vals = eigen_vectors[:, np.argmax(np.abs(eigen_vals))]
+        clusters = _cluster_kmod_maps(data, segmentation, activation, n_clusters, optimize=optimize)
 
-            state_vals /= np.linalg.norm(state_vals)  # Normalize Map
-            clusters[state, :] = state_vals  # Store map
+        # Activation of the new maps (used for the residual and the next assignment)
+        activation = clusters.dot(data.T)
 
         # Estimate residual noise (step 5)
-        act_sum_sq = np.sum(np.sum(clusters[segmentation, :] * data, axis=1) ** 2)
+        act_sum_sq = np.sum(activation[segmentation, np.arange(n_samples)] ** 2)
         residual = np.abs(data_sum_sq - act_sum_sq)
         residual = residual / float(n_samples * (n_channels - 1))
 
@@ -391,8 +380,16 @@ def _cluster_kmod(data, n_clusters=4, max_iterations=1000, threshold=1e-6, rando
         if np.abs(prev_residual - residual) < (threshold * residual):
             break
 
+        # Should we abandon? (if the explained variance will not reach the threshold)
+        if gev_threshold is not None:
+            explained_variance.append(act_sum_sq / data_sum_sq)
+            if _cluster_kmod_hopeless(explained_variance, gev_threshold):
+                abandoned = True
+                break
+
         # Next iteration
         prev_residual = residual.copy()
+        segmentation = np.argmax(np.abs(activation), axis=0)
 
     if i == max_iterations:
         warnings.warn("Modified K-means algorithm failed to converge after " + str(i) + "",
@@ -416,11 +413,58 @@ def _cluster_kmod(data, n_clusters=4, max_iterations=1000, threshold=1e-6, rando
             "clustering_function": clustering_function,
             "random_state": random_state,
             "clusters_normalized": clusters,
-            "residual": residual}
+            "residual": residual,
+            "explained_variance": act_sum_sq / data_sum_sq,
+            "abandoned": abandoned}
 
     return prediction, clusters_unnormalized, info
 
 
+def _cluster_kmod_maps(data, segmentation, activation, n_clusters, optimize=False):
+    """Normalized maps of the microstates, given the samples assigned to each state."""
+    n_samples, n_channels = data.shape
+    counts = np.bincount(segmentation, minlength=n_clusters)
+
+    if optimize:
+        # Method 2 - optimized segmentation: sum of the samples weighted by their activation,
+        # accumulated for all states at once
+        weights = np.zeros((n_clusters, n_samples))
+        weights[segmentation, np.arange(n_samples)] = activation[segmentation, np.arange(n_samples)]
+        clusters = weights.dot(data)
+    else:
+        # Method 1 - eighen value: (step 4a) the scatter matrix of the samples of each state (taken
+        # from the samples sorted by state), and (step 4b) its leading eigenvector
+        order = np.argsort(segmentation, kind="stable")
+        bounds = np.concatenate([[0], np.cumsum(counts)])
+        sorted_data = data[order]
+        clusters = np.zeros((n_clusters, n_channels))
+        for state in np.flatnonzero(counts):
+            data_state = sorted_data[bounds[state]:bounds[state + 1]]
+            Sk = np.dot(data_state.T, data_state)
+            eigen_vals, eigen_vectors = scipy.linalg.eigh(Sk)
+            clusters[state] = eigen_vectors[:, np.argmax(np.abs(eigen_vals))]
+
+    # Normalize Map (states without samples are set to 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        clusters = clusters / np.linalg.norm(clusters, axis=1, keepdims=True)
+    clusters[counts == 0] = 0
+    return clusters
+
+
+def _cluster_kmod_hopeless(gev, gev_threshold, min_iterations=5):
+    """Whether a sequence of explained variances is not expected to reach a threshold.
+
+    The remaining gains are extrapolated from the ratio of the last two gains (assuming they
+    decrease geometrically, as is typical of k-means near convergence).
+    """
+    if len(gev) < min_iterations or gev[-1] >= gev_threshold:
+        return False
+    gain, previous_gain = gev[-1] - gev[-2], gev[-2] - gev[-3]
+    if previous_gain <= 0 or gain < 0 or gain >= previous_gain:
+        return False
+    ratio = gain / previous_gain
+    return gev[-1] + gain * ratio / (1 - ratio) < gev_threshold
+
 
 # =============================================================================
 # PCA
@@ -167,15 +167,15 @@ def _cluster_quality_dispersion(data, clustering, n_clusters=4):
     Can be used to compare and find the optimal number of clusters.
     """
 
-    dispersion_state = []
+    # Half the sumsquares of the pair-wise distances between members of the same cluster, divided
+    # by their number, is the sumsquares of their distances to the centroid (which avoids computing
+    # all the pair-wise distances)
+    clustering = np.asarray(clustering)
+    dispersion_state = np.full(n_clusters, np.nan)
     for state in range(n_clusters):
-        idx = (clustering == state)
-        data_state = data[idx, :]
-        state_size = len(data_state)  # number of samples in this cluster
-        # pair-wise distance between members of the same cluster
-        distance = scipy.spatial.distance.cdist(data_state, data_state)
-        # sumsquares of distances
-        dispersion_state.append(0.5 * np.sum(distance**2) / state_size)
+        data_state = data[clustering == state, :]
+        if len(data_state) > 0:  # number of samples in this cluster
+            dispersion_state[state] = np.sum((data_state - np.mean(data_state, axis=0)) ** 2)
 
     dispersion = np.sum(dispersion_state)
     return dispersion
@@ -10,9 +10,10 @@ def fit_error(y, y_predicted, n_parameters=2):
     Parameters
     ----------
     y : Union[list, np.array, pd.Series]
-        The response variable (the y axis).
+        The response variable (the y axis). Can be a 2D array, in which case the indices are computed
+        along the last axis (i.e., for each row).
     y_predicted : Union[list, np.array, pd.Series]
-        The fitted data generated by a model.
+        The fitted data generated by a model (of the same shape as ``y``).
     n_parameters : int
         Number of model parameters (for the degrees of freedom used in R2).
 
@@ -63,10 +64,13 @@ def fit_error(y, y_predicted, n_parameters=2):
 
     # Adjusted r-squared
     # For optimization use 1 - adjR2 since we want to minimize the function
-    SST = np.std(y) * n
+    SST = np.std(y, axis=-1) * n
 
     # Get R2
-    if SST == 0:
+    if np.ndim(SST) > 0:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            R2 = np.where(SST == 0, 1, SSE / SST)
+    elif SST == 0:
         R2 = 1
     else:
         R2 = SSE / SST
@@ -103,10 +107,10 @@ def fit_r2(y, y_predicted, adjusted=True, n_parameters=2):
 def _fit_error_prepare(y, y_predicted, n_parameters=2):
 
     # n, i.e., how many observations (signal length)
-    n = len(y)
+    n = np.shape(y)[-1]
 
     # Sanitize
-    if n != len(y_predicted):
+    if np.shape(y) != np.shape(y_predicted):
         raise TypeError("NeuroKit error: fit_error(): 'y' and 'y_predicted' are not of the same length.")
 
     # Residual, i.e. the difference between data and model
@@ -116,5 +120,5 @@ def _fit_error_prepare(y, y_predicted, n_parameters=2):
     df = n - n_parameters
 
     # Calculate sum of squared errors
-    SSE = np.sum(residual ** 2)
+    SSE = np.sum(residual ** 2, axis=-1)
     return SSE, n, df
@@ -1,9 +1,8 @@
 # -*- coding: utf-8 -*-
 import numpy as np
-import scipy.linalg
 
 
-def fit_loess(y, X=None, alpha=0.75, order=2):
+def fit_loess(y, X=None, alpha=0.75, order=2, delta=0):
     """Local Polynomial Regression (LOESS)
 
     Performs a LOWESS (LOcally WEighted Scatter-plot Smoother) regression.
@@ -20,6 +19,12 @@ def fit_loess(y, X=None, alpha=0.75, order=2):
         of the samples to include in local regression.
     order : int
         Degree of the polynomial to fit. Can be 1 or 2 (default).
+    delta : Union[float, str]
+        Distance (in the units of X) within which the local regression is linearly interpolated
+        rather than computed. The regression is then only computed on a grid of points spaced by
+        ``delta`` (and on the last point), which is much faster for long signals. If 0 (default),
+        it is computed at every point. Can be 'auto', in which case ``delta`` is set to 1% of the
+        width of the local regression window, which is a good approximation of the full fit.
 
     Returns
     -------
@@ -39,7 +44,8 @@ def fit_loess(y, X=None, alpha=0.75, order=2):
     >>> distorted = nk.signal_distort(signal, noise_amplitude=[0.3, 0.2, 0.1], noise_frequency=[5, 10, 50])
     >>>
     >>> pd.DataFrame({ "Raw": distorted, "Loess_1": nk.fit_loess(distorted, order=1),
-    ...               "Loess_2": nk.fit_loess(distorted, order=2)}).plot() #doctest: +SKIP
+    ...               "Loess_2": nk.fit_loess(distorted, order=2),
+    ...               "Loess_fast": nk.fit_loess(distorted, delta="auto")}).plot() #doctest: +SKIP
 
     References
     ----------
@@ -53,36 +59,83 @@ def fit_loess(y, X=None, alpha=0.75, order=2):
     assert 0 < alpha <= 1, "Alpha has to be between 0 and 1"
     assert len(X) == len(y), "Length of X and y are different"
 
-    X_domain = X
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    # Work on sorted X, so that the neighbours of each point form a contiguous window
+    ordering = np.argsort(X, kind="stable")
+    X_sorted = X[ordering]
+    y_sorted = y[ordering]
 
     n = len(X)
     span = int(np.ceil(alpha * n))
 
-    y_predicted = np.zeros(len(X_domain))
-    x_space = np.zeros_like(X_domain)
-
-    for i, val in enumerate(X_domain):
-        distance = abs(X - val)
-        sorted_dist = np.sort(distance)
-        ind = np.argsort(distance)
-
-        Nx = X[ind[:span]]
-        Ny = y[ind[:span]]
-
-        delx0 = sorted_dist[span - 1]
-
-        u = distance[ind[:span]] / delx0
-        w = (1 - u ** 3) ** 3
+    # Points at which the local regression is computed
+    if isinstance(delta, str):
+        if delta != "auto":
+            raise ValueError("NeuroKit error: fit_loess(): 'delta' should be a number or 'auto'.")
+        delta = 0.01 * alpha * (X_sorted[-1] - X_sorted[0])
+    if delta > 0:
+        grid = np.arange(X_sorted[0], X_sorted[-1], delta)
+        points = np.unique(np.append(np.searchsorted(X_sorted, grid), n - 1))
+    else:
+        points = np.arange(n)
+
+    y_predicted = _fit_loess(y_sorted, X_sorted, X_sorted[points], span=span, order=order)
+    if len(points) < n:
+        y_predicted = np.interp(X_sorted, X_sorted[points], y_predicted)
+
+    # Restore the original order
+    out = np.zeros(n)
+    out[ordering] = y_predicted
+    return out
+
+
+# =============================================================================
+# Internals
+# =============================================================================
+def _fit_loess(y, X, x_new, span, order=2, max_size=10 ** 6):
+    """Local regressions of y (with X sorted) evaluated at x_new.
+
+    The ``span`` nearest neighbours of each point form the window [start, start + span) of X, where
+    ``start`` is the number of window shifts that bring a closer point in than the one dropped (i.e.,
+    such that ``X[start + span] - x < x - X[start]``). The windows are processed in blocks of at most
+    ``max_size`` values, and the weighted least-squares problems of each block are solved at once from
+    the tricube-weighted moments of the (scaled) distances to each point.
 
-        W = np.diag(w)
-        A = np.vander(Nx, N=1 + order)
-
-        V = np.matmul(np.matmul(A.T, W), A)
-        Y = np.matmul(np.matmul(A.T, W), Ny)
-        Q, R = scipy.linalg.qr(V)
-        p = scipy.linalg.solve_triangular(R, np.matmul(Q.T, Y))
-
-        y_predicted[i] = np.polyval(p, val)
-        x_space[i] = val
+    """
+    n = len(X)
+    shifts = X[0 : n - span] + X[span:n]
+    starts = np.clip(np.searchsorted(shifts, 2 * x_new, side="left"), 0, n - span)
+
+    y_predicted = np.zeros(len(x_new))
+    blocksize = max(1, max_size // span)
+    for i in range(0, len(x_new), blocksize):
+        block = slice(i, i + blocksize)
+        x = x_new[block, np.newaxis]
+        window = starts[block, np.newaxis] + np.arange(span)
+
+        # Tricube weights of the distances, scaled by the largest distance of each window
+        distance = X[window] - x
+        distance /= np.max(np.abs(distance), axis=1, keepdims=True)
+        weights = (1 - np.abs(distance) ** 3) ** 3
+        y_window = y[window]
+
+        # Normal equations of the polynomial centred on each point (whose intercept is the prediction)
+        moments = np.zeros((len(x), 2 * order + 1))
+        moments_y = np.zeros((len(x), order + 1))
+        power = weights
+        for k in range(2 * order + 1):
+            moments[:, k] = np.sum(power, axis=1)
+            if k <= order:
+                moments_y[:, k] = np.einsum("ij,ij->i", power, y_window)
+            power = power * distance
+        V = moments[:, np.add.outer(np.arange(order + 1), np.arange(order + 1))]
+
+        try:
+            coefs = np.linalg.solve(V, moments_y[..., np.newaxis])[..., 0]
+        except np.linalg.LinAlgError:
+            coefs = np.array([np.linalg.lstsq(V[j], moments_y[j], rcond=None)[0] for j in range(len(x))])
+        y_predicted[block] = coefs[:, 0]
 
     return y_predicted
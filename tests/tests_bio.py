@@ -1,4 +1,6 @@
 import numpy as np
+import pandas as pd
+import pytest
 
 import neurokit2 as nk
 
@@ -30,6 +32,28 @@ def test_bio_process():
     assert len(bio_info["EMG_Offsets"] == len(bio_info["EMG_Onsets"]))
 
 
+def test_bio_process_batch():
+
+    sampling_rate = 250
+
+    records = []
+    for i in range(3):
+        ecg = nk.ecg_simulate(duration=30, sampling_rate=sampling_rate, random_state=i)
+        rsp = nk.rsp_simulate(duration=30, sampling_rate=sampling_rate, random_state=i)
+        records.append(pd.DataFrame({"ECG": ecg, "RSP": rsp, "Photosensor": np.arange(len(ecg))}))
+    records.insert(1, {"ECG": [0, 0, 0]})  # Invalid recording
+
+    bio_df, bio_info = nk.bio_process(records[0], sampling_rate=sampling_rate)
+    for n_jobs in [1, 2]:
+        with pytest.warns(nk.misc.NeuroKitWarning, match="1 out of 4"):
+            results, errors = nk.bio_process_batch(iter(records), sampling_rate=sampling_rate, n_jobs=n_jobs)
+        assert len(results) == 4
+        assert results[1] is None
+        assert list(errors.keys()) == [1]
+        pd.testing.assert_frame_equal(results[0][0], bio_df)
+        assert np.array_equal(results[0][1]["ECG_R_Peaks"], bio_info["ECG_R_Peaks"])
+
+
 def test_bio_analyze():
 
     # Example with event-related analysis
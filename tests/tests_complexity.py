@@ -1,6 +1,7 @@
 import nolds
 import numpy as np
 import pandas as pd
+import scipy.stats
 from pyentrp import entropy as pyentrp
 
 import neurokit2 as nk
@@ -22,6 +23,9 @@ def test_complexity_sanity():
 
     # Entropy
     assert np.allclose(nk.entropy_fuzzy(signal), nk.entropy_sample(signal, fuzzy=True), atol=0.000001)
+    assert np.allclose(
+        nk.entropy_multiscale(signal, refined=True), nk.entropy_multiscale(signal, refined=True, n_jobs=2)
+    )
 
     # Fractal
     assert np.allclose(nk.fractal_dfa(signal, windows=np.array([4, 8, 12, 20])), 2.1009048365682133, atol=0.000001)
@@ -90,6 +94,101 @@ def test_complexity_vs_R():
 
 
 
+# =============================================================================
+# Symbolic sequences
+# =============================================================================
+def test_complexity_symbolic():
+
+    from neurokit2.complexity.utils_symbolic import _SymbolicCounter, _symbolic_entropy_block
+
+    sequence = np.repeat(np.random.RandomState(42).randint(0, 4, 500), 3)
+
+    # Shannon entropy of the symbols, of strings and of blocks
+    counts = pd.Series(sequence).value_counts()
+    assert np.allclose(nk.entropy_shannon(sequence), scipy.stats.entropy(counts, base=2))
+    assert np.allclose(nk.entropy_shannon("aabb"), 1)
+    blocks = pd.Series([str(block) for block in zip(sequence[:-1], sequence[1:])]).value_counts()
+    assert np.allclose(_symbolic_entropy_block(sequence, order=2), scipy.stats.entropy(blocks, base=2))
+
+    # Chunked sequences give the same entropies
+    counter = _SymbolicCounter(order=3)
+    for chunk in np.array_split(sequence, 7):
+        counter.update(chunk)
+    for order in [1, 2, 3]:
+        assert np.allclose(counter.entropy_block(order), _symbolic_entropy_block(sequence, order=order))
+
+    # Entropy rate is lower than the entropy of the symbols (as states last 3 samples)
+    out = nk.microstates_complexity(sequence)
+    assert out["Microstate_Entropy_Rate"][0] < out["Microstate_Entropy_Shannon"][0]
+
+
+def test_complexity_transition_matrix():
+
+    sequence = np.array([0, 0, 0, 1, 1, 2, 2, 2, 2, 1, 0, 0])
+    observed = nk.transition_matrix(sequence)["Observed"]
+    assert np.allclose(observed.sum(axis=1), 1)
+    assert np.allclose(observed.values[0], [0.75, 0.25, 0])
+
+    # Rows of states without outgoing transitions are uniform
+    assert np.allclose(nk.transition_matrix(np.array([0, 1, 1]))["Observed"].values, [[0, 1], [0, 1]])
+    assert np.allclose(nk.transition_matrix(np.array([0, 0, 1]))["Observed"].values[1], [0.5, 0.5])
+
+    # Batch of sequences of different lengths
+    sequences = [sequence, np.array([2, 0, 1, 2, 0]), np.random.RandomState(42).randint(0, 3, 100)]
+    states, matrices = nk.transition_matrix_batch(sequences)
+    assert matrices.shape == (3, 3, 3)
+    for i, seq in enumerate(sequences):
+        assert np.allclose(matrices[i], nk.transition_matrix(seq)["Observed"].values)
+
+
+def test_complexity_delay_metric():
+
+    from neurokit2.complexity.complexity_delay import _embedding_delay_metric
+
+    signal = nk.signal_simulate(duration=2, frequency=[5, 12]) + np.random.RandomState(42).normal(0, 0.1, 2000)
+    tau_sequence = np.arange(1, 30)
+
+    # Mutual information and displacement of all delays at once
+    mi = _embedding_delay_metric(signal, tau_sequence, metric="Mutual Information")
+    displacement = _embedding_delay_metric(signal, tau_sequence, metric="Displacement")
+    for i, tau in enumerate(tau_sequence):
+        embedded = nk.complexity_embedding(signal, delay=tau, dimension=2)
+        assert np.allclose(mi[i], nk.mutual_information(embedded[:, 0], embedded[:, 1], method="shannon"))
+        assert np.allclose(displacement[i], np.mean(np.abs(embedded[:, 1] - embedded[:, 0])))
+
+
+
+def test_fractal_dfa_fluctuations():
+
+    from neurokit2.complexity.fractal_dfa import _fractal_dfa_fluctuations, _fractal_dfa_getwindow
+
+    rng = np.random.RandomState(42)
+    signal = np.cumsum(np.cumsum(rng.normal(size=3000)))  # Large and smooth profile
+    windows = np.array([4, 7, 16, 50, 128, 299])
+    q = np.array([[-3.0], [-1.0], [2.0], [5.0]])
+
+    for overlap in [True, False]:
+        starts, lengths, counts = _fractal_dfa_getwindow(len(signal), windows, overlap=overlap)
+        assert np.array_equal(np.repeat(windows, counts), lengths)
+
+        fluctuations = _fractal_dfa_fluctuations(signal, windows, overlap=overlap)
+        mfdfa = _fractal_dfa_fluctuations(signal, windows, overlap=overlap, multifractal=True, q=q)
+        for i, window in enumerate(windows):
+            # Segments and polynomial trends of each segment
+            if overlap:
+                segments = np.array([signal[j : j + window] for j in np.arange(0, len(signal) - window, window // 2)])
+            else:
+                segments = signal[: len(signal) - (len(signal) % window)].reshape(-1, window)
+            assert np.array_equal(np.array([signal[j : j + window] for j in starts[lengths == window]]), segments)
+
+            x = np.arange(window)
+            coefs = np.polyfit(x, segments.T, 1).T
+            trends = np.array([np.polyval(coefs[j], x) for j in np.arange(len(segments))])
+            var = np.var(segments - trends, axis=1)
+
+            assert np.allclose(fluctuations[i], np.sqrt(np.mean(var)))
+            assert np.allclose(mfdfa[i], np.mean(np.float_power(np.mean(np.float_power(var, q / 2), axis=1) / 2, 1 / q.T)))
+
 # =============================================================================
 # Comparison against Python implementations
 # =============================================================================
@@ -1,3 +1,4 @@
+import json
 import os
 
 import numpy as np
@@ -35,3 +36,69 @@ def test_data():
     assert len(data.columns) == len(data2.columns)
     assert data2.size == data.size
     assert all(elem in np.array(data.columns.values, dtype=str) for elem in np.array(data2.columns.values, dtype=str))
+
+
+def test_read_bitalino(tmp_path):
+
+    header = {"00:00:00:00:00:00": {"sampling rate": 100, "channels": [1, 2], "sensor": ["ECG", "EDA"]}}
+    rng = np.random.RandomState(0)
+    values = rng.randint(0, 1024, size=(1000, 2))
+    filename = str(tmp_path / "opensignals.txt")
+    with open(filename, "w") as f:
+        f.write("# OpenSignals Text File Format\n")
+        f.write("# " + json.dumps(header) + "\n")
+        f.write("# EndOfHeader\n")
+        for i, row in enumerate(values):
+            f.write("\t".join(str(x) for x in [i % 16, 0, 0, 0, 0, row[0], row[1]]) + "\n")
+
+    df, sampling_rate = nk.read_bitalino(filename)
+    assert sampling_rate == 100
+    assert df.columns.tolist() == ["ECG", "EDA"]
+
+    # Lazy reading, from a memory-mapped sidecar cache
+    recording = nk.read_bitalino(filename, lazy=True)
+    assert isinstance(recording, nk.Recording)
+    assert isinstance(recording["ECG"], np.memmap)
+    assert os.path.exists(filename + ".cache")
+    assert np.allclose(recording["EDA"], df["EDA"])
+    assert recording.duration == 10
+
+    # Cached eager reading
+    cached, _ = nk.read_bitalino(filename, cache=True)
+    assert np.allclose(cached.values, df.values)
+
+    # Selection
+    selection = recording.select("ECG", start=2, end=4.5)
+    assert selection.channels == ["ECG"]
+    assert np.allclose(selection["ECG"], df["ECG"][200:450])
+
+
+def test_recording(tmp_path):
+
+    rng = np.random.RandomState(0)
+    ecg = rng.normal(size=1000)
+    eda = rng.normal(size=250)
+    eda[100:110] = np.nan
+    recording = nk.Recording({"ECG": ecg, "EDA": eda}, {"ECG": 100, "EDA": 25})
+
+    df, sampling_rate = recording.to_dataframe()
+    assert sampling_rate == 100
+    assert df.shape == (1000, 2)
+    assert not df.isnull().values.any()
+
+    # Chunks at the native sampling rate are the same as the whole data
+    chunks = list(recording.select("ECG").iter_chunks(duration=3))
+    assert [len(chunk) for chunk in chunks] == [300, 300, 300, 100]
+    assert np.allclose(np.concatenate([chunk["ECG"] for chunk in chunks]), ecg)
+    assert chunks[-1].index[0] == 900
+
+    chunks = list(recording.iter_chunks(duration=3, sampling_rate=50))
+    assert [len(chunk) for chunk in chunks] == [150, 150, 150, 50]
+    assert not np.any([chunk.isnull().values.any() for chunk in chunks])
+
+    # Sidecar cache
+    saved = recording.save(str(tmp_path / "recording"))
+    assert isinstance(saved["EDA"], np.memmap)
+    assert saved.sampling_rates == recording.sampling_rates
+    assert np.allclose(saved["ECG"], ecg)
+    assert np.allclose(saved.to_dataframe()[0].values, df.values)
@@ -2,6 +2,7 @@
 import biosppy
 import matplotlib.pyplot as plt
 import numpy as np
+import pandas as pd
 import pytest
 
 import neurokit2 as nk
@@ -158,6 +159,19 @@ def test_ecg_findpeaks():
     info_engzeemod = nk.ecg_findpeaks(nk.ecg_clean(ecg, method="engzeemod2012"), method="engzeemod2012")
     assert info_engzeemod["ECG_R_Peaks"].size == 70
 
+    # Test nabian2018 method
+    info_nabian = nk.ecg_findpeaks(ecg_cleaned, method="nabian2018")
+    assert info_nabian["ECG_R_Peaks"].size == 69
+
+    # Test rodrigues2021 method
+    info_rodrigues = nk.ecg_findpeaks(ecg_cleaned, method="rodrigues2021")
+    assert len(info_rodrigues["ECG_R_Peaks"]) == 71
+
+    # Test benchmark of the methods' speed
+    speed = nk.benchmark_ecg_findpeaks(ecg_cleaned, methods=["nabian2018", "rodrigues2021"], n_runs=1)
+    assert list(speed["N_Peaks"]) == [69, 71]
+    assert np.all(speed["Throughput"] > 0)
+
     # Test kalidas2017 method
     info_kalidas = nk.ecg_findpeaks(nk.ecg_clean(ecg, method="kalidas2017"), method="kalidas2017")
     assert np.allclose(info_kalidas["ECG_R_Peaks"].size, 68, atol=1)
@@ -169,6 +183,26 @@ def test_ecg_findpeaks():
     assert np.allclose(info_martinez["ECG_R_Peaks"].size, 69, atol=1)
 
 
+def test_ecg_stream():
+
+    sampling_rate = 500
+
+    ecg = nk.ecg_simulate(duration=60, sampling_rate=sampling_rate, noise=0.05, random_state=42)
+    peaks = nk.ecg_findpeaks(nk.ecg_clean(ecg, sampling_rate=sampling_rate), sampling_rate=sampling_rate)
+
+    # Feed the signal by chunks of random sizes
+    stream = nk.ECGStream(sampling_rate=sampling_rate)
+    chunks = np.array_split(ecg, np.cumsum(np.random.RandomState(42).randint(1, sampling_rate, 200)))
+    beats = pd.concat([stream.update(chunk) for chunk in chunks] + [stream.flush()], ignore_index=True)
+
+    assert list(beats.columns) == ["ECG_R_Peaks", "ECG_Rate", "ECG_Quality"]
+    assert len(beats) == len(peaks["ECG_R_Peaks"])
+    assert np.all(np.abs(beats["ECG_R_Peaks"].values - peaks["ECG_R_Peaks"]) <= 0.01 * sampling_rate)
+    assert np.all(beats["ECG_Quality"].between(0, 1))
+    assert np.allclose(beats["ECG_Rate"].values[1:], 60 * sampling_rate / np.diff(beats["ECG_R_Peaks"].values))
+    assert np.isnan(beats["ECG_Rate"].values[0])
+
+
 def test_ecg_eventrelated():
 
     ecg, info = nk.ecg_process(nk.ecg_simulate(duration=20))
@@ -182,6 +216,10 @@ def test_ecg_eventrelated():
 
     assert len(ecg_eventrelated["Label"]) == 3
 
+    # Same features from the stacked epochs, the dict of DataFrames and the DataFrame of epochs
+    pd.testing.assert_frame_equal(ecg_eventrelated, nk.ecg_eventrelated(epochs.to_dict()))
+    pd.testing.assert_frame_equal(ecg_eventrelated, nk.ecg_eventrelated(nk.epochs_to_df(epochs)))
+
     # Test warning on missing columns
     with pytest.warns(nk.misc.NeuroKitWarning, match=r".*does not have an `ECG_Phase_Artrial`.*"):
         first_epoch_key = list(epochs.keys())[0]
@@ -85,3 +85,13 @@ Difference:
     # helper_plot(attribute, ecg_characteristics, test_data)
     assert diff.std() < 0.1 * test_data["sampling_rate"], report
     assert diff.mean() < 0.1 * test_data["sampling_rate"], report
+
+
+def test_ecg_delineate_cwt_transform(test_data):
+    import pywt
+
+    from neurokit2.ecg.ecg_delineate import _ecg_delineator_cwt_transform
+
+    ecg = test_data["ecg"][:8000]
+    cwtmatr, __ = pywt.cwt(ecg, np.array([1, 2, 4, 8, 16]), "gaus1", sampling_period=1.0 / test_data["sampling_rate"])
+    assert np.allclose(_ecg_delineator_cwt_transform(ecg), cwtmatr)
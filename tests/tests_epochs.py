@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+
+import neurokit2 as nk
+
+
+def test_epochs_create():
+
+    signal = nk.signal_simulate(duration=10, sampling_rate=100, frequency=[1, 5])
+    data = pd.DataFrame({"Signal": signal, "Signal2": -signal, "Int": np.arange(len(signal))})
+
+    epochs = nk.epochs_create(
+        data, events=[5, 400, 990], sampling_rate=100, epochs_start=-0.2, epochs_end=0.5, event_conditions=["a", "b", "a"]
+    )
+    assert isinstance(epochs, dict)
+    assert list(epochs.keys()) == ["1", "2", "3"]
+
+    # Epochs on the edges are padded with NaNs
+    epoch = epochs["1"]
+    assert list(epoch.columns) == ["Signal", "Signal2", "Int", "Index", "Label", "Condition"]
+    assert epoch["Index"].tolist() == list(range(-15, 55))
+    assert np.all(np.isnan(epoch["Signal"].values[:15]))
+    assert np.array_equal(epoch["Signal"].values[15:], signal[0:55])
+    assert np.isnan(epochs["3"]["Signal"].values[-1])
+
+    # Array views
+    assert np.shares_memory(epochs.get_array("2"), epochs._values)
+    assert np.array_equal(epochs.get_array("2"), data[["Signal", "Signal2"]].values[380:450])
+
+    # The fast paths give the same output as the DataFrames
+    epochs_dict = epochs.to_dict()
+    pd.testing.assert_frame_equal(nk.epochs_to_df(epochs), nk.epochs_to_df(epochs_dict))
+    assert np.array_equal(nk.epochs_to_array(epochs), nk.epochs_to_array(epochs_dict), equal_nan=True)
+    assert nk.epochs_to_array(epochs).shape == (70, 2, 3)
+
+    # Baseline correction
+    epochs = nk.epochs_create(signal, events=[100, 500], sampling_rate=100, epochs_start=-0.2, baseline_correction=True)
+    assert np.allclose(nk.epochs_to_array(epochs), nk.epochs_to_array(epochs.to_dict()))
+    assert np.allclose(epochs["1"]["Signal"].loc[:0].mean(), 0)
+
+
+def test_epochs_inplace():
+
+    signal = nk.signal_simulate(duration=10, sampling_rate=100)
+    epochs = nk.epochs_create(signal, events=[100, 400, 700], sampling_rate=100, epochs_end=1)
+
+    # In-place modifications persist, as with a dict of DataFrames
+    epochs["1"]["New"] = 1
+    epochs["2"].loc[:, "Signal"] = 0
+    for key, epoch in epochs.items():
+        epoch["B"] = 2
+    assert "New" in epochs["1"].columns
+    assert np.all(epochs["2"]["Signal"] == 0)
+    assert all(np.all(epochs[key]["B"] == 2) for key in epochs)
+    assert np.all(epochs.get_array("2") == 0)
+    assert np.all(epochs.to_array()[1] == 0)
@@ -29,3 +29,47 @@ def test_microstates_peaks():
     peaks_frederic = locmax(gfp)
 
     assert all(elem in peaks_frederic for elem in peaks_nk)  # only works when distance_between = 0.01
+
+
+# =============================================================================
+# Segmentation
+# =============================================================================
+
+
+def test_microstates_segment_kmod():
+
+    rng = np.random.RandomState(42)
+    maps = rng.normal(size=(4, 16))
+    states = np.repeat(rng.randint(0, 4, 50), 40)
+    eeg = maps[states].T * rng.uniform(0.5, 2, states.size) + rng.normal(scale=0.2, size=(16, states.size))
+
+    kwargs = {"n_microstates": 4, "method": "kmod", "sampling_rate": 250, "random_state": 42, "n_runs": 5}
+    out = nk.microstates_segment(eeg, **kwargs)
+    assert out["Microstates"].shape == (4, 16)
+    assert out["GEV"] > 0.5
+
+    # Parallel runs give the same result
+    out_parallel = nk.microstates_segment(eeg, n_jobs=2, **kwargs)
+    assert np.allclose(out["Microstates"], out_parallel["Microstates"])
+    assert np.array_equal(out["Sequence"], out_parallel["Sequence"])
+
+    # Abandoning hopeless runs still returns a valid segmentation
+    out_abandon = nk.microstates_segment(eeg, abandon=True, **kwargs)
+    assert out_abandon["GEV"] > 0.5
+
+
+def test_microstates_findnumber():
+
+    rng = np.random.RandomState(42)
+    maps = rng.normal(size=(4, 16))
+    states = np.repeat(rng.randint(0, 4, 50), 40)
+    eeg = maps[states].T * rng.uniform(0.5, 2, states.size) + rng.normal(scale=0.2, size=(16, states.size))
+
+    kwargs = {"n_max": 5, "method": "kmod", "sampling_rate": 250, "random_state": 42, "n_runs": 3}
+    results = nk.microstates_findnumber(eeg, **kwargs)
+    assert results.shape == (4, 2)
+    assert np.allclose(results, nk.microstates_findnumber(eeg, n_jobs=2, **kwargs), equal_nan=True)
+
+    # Warm starts only add a run, so that they explain at least as much variance
+    results_warm = nk.microstates_findnumber(eeg, warm_start=True, **kwargs)
+    assert np.all(results_warm["Score_GEV"] >= results["Score_GEV"] - 1e-10)
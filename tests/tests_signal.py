@@ -5,6 +5,7 @@ import numpy as np
 import pandas as pd
 import pytest
 import scipy.signal
+import scipy.sparse
 
 import neurokit2 as nk
 
@@ -106,6 +107,27 @@ def test_signal_detrend():
     rez_nk = nk.signal_detrend(signal, method="tarvainen2002", regularization=500)
     assert np.allclose(np.mean(rez_nk - signal), -2.88438737697, atol=0.000001)
 
+    # Tarvainen - banded solver against the dense matrix inversion
+    short = signal[::10]
+    N = len(short)
+    B = np.dot(np.ones((N - 2, 1)), np.array([[1, -2, 1]]))
+    D_2 = scipy.sparse.dia_matrix((B.T, [0, 1, 2]), shape=(N - 2, N))
+    inv = np.linalg.inv(np.eye(N) + 10 ** 2 * D_2.T @ D_2)
+    rez_dense = np.squeeze(np.asarray((np.eye(N) - inv) @ short))
+    rez_nk = nk.signal_detrend(short, method="tarvainen2002", regularization=10)
+    assert np.allclose(rez_nk, rez_dense)
+
+    # Tarvainen - chunked
+    rez_chunked = nk.signal_detrend(signal, method="tarvainen2002", regularization=10, chunksize=300)
+    rez_nk = nk.signal_detrend(signal, method="tarvainen2002", regularization=10)
+    assert np.allclose(rez_chunked, rez_nk)
+
+    # LOESS - exact fit at every point and fast (interpolated) fit
+    rez_exact = nk.signal_detrend(signal, method="loess", delta=0)
+    assert np.allclose(rez_exact, signal - nk.fit_loess(signal, alpha=0.75))
+    rez_fast = nk.signal_detrend(signal, method="loess")
+    assert np.max(np.abs(rez_fast - rez_exact)) < 0.01
+
 
 def test_signal_filter():
 
@@ -296,6 +318,21 @@ def test_signal_timefrequency():
     indices_freq20 = np.logical_and(frequency > 18, frequency < 22)
     assert np.sum(pwvd[indices_freq5]) < np.sum(pwvd[indices_freq20])
 
+    # smoothed pwvd (with decimated time)
+    frequency, time, spwvd = nk.signal_timefrequency(signal, method="spwvd", max_frequency=50, hop=10, show=False)
+    assert len(frequency) == spwvd.shape[0]
+    assert len(time) == spwvd.shape[1] == len(signal) // 10
+    indices_freq5 = np.logical_and(frequency > 3, frequency < 7)
+    indices_freq20 = np.logical_and(frequency > 18, frequency < 22)
+    assert np.sum(spwvd[indices_freq5]) < np.sum(spwvd[indices_freq20])
+
+    # decimated time and chunks give the same distribution
+    _, time_hop, wvd_hop = nk.signal_timefrequency(signal, method="wvd", max_frequency=50, hop=10, chunksize=300,
+                                                   show=False)
+    assert np.allclose(time_hop, time)
+    assert np.allclose(wvd_hop, wvd[:, ::10])
+
+
 def test_signal_psd(recwarn):
     warnings.simplefilter("always")
 
@@ -308,6 +345,26 @@ def test_signal_psd(recwarn):
     assert recwarn.pop(nk.misc.NeuroKitWarning)
 
 
+def test_signal_psd_burg():
+
+    rng = np.random.RandomState(42)
+    signal = nk.signal_simulate(duration=4, frequency=5, sampling_rate=250)
+    signal += 0.3 * nk.signal_simulate(duration=4, frequency=20, sampling_rate=250) + rng.normal(0, 0.1, 1000)
+    psd = nk.signal_psd(signal, sampling_rate=250, method="burg", min_frequency=1, max_frequency=50, order_criteria=None)
+    assert np.isclose(psd["Frequency"][psd["Power"].idxmax()], 5, atol=0.5)
+
+    # Several signals are fitted at once, and give the same spectra as when fitted one by one
+    signals = pd.DataFrame({"A": signal, "B": np.cumsum(rng.normal(0, 1, 1000)), "C": rng.normal(0, 1, 1000)})
+    psds = nk.signal_psd(signals, sampling_rate=250, method="burg", min_frequency=1)
+    assert list(psds.columns) == ["Frequency", "A", "B", "C"]
+    for channel in ["A", "B", "C"]:
+        single = nk.signal_psd(signals[channel], sampling_rate=250, method="burg", min_frequency=1)
+        assert np.allclose(psds[channel].values, single["Power"].values)
+
+    with pytest.raises(ValueError, match="NeuroKit error: signal_psd"):
+        nk.signal_psd(signals, method="welch")
+
+
 def test_signal_distort():
     signal = nk.signal_simulate(duration=10, frequency=0.5, sampling_rate=10)
 
@@ -326,3 +383,83 @@ def test_signal_distort():
         signal = nk.signal_simulate(duration=1, frequency=1, sampling_rate=10)
         nk.signal_distort(signal, noise_amplitude=1, noise_frequency=0.1, silent=False)
 
+
+def test_signal_changepoints():
+
+    rng = np.random.RandomState(0)
+    signal = np.concatenate([rng.normal(0, 1, 700), rng.normal(5, 1, 800), rng.normal(0, 3, 900)])
+
+    pelt = nk.signal_changepoints(signal, change="meanvar")
+    assert np.min(np.abs(pelt - 700)) <= 5
+    assert np.min(np.abs(pelt - 1500)) <= 5
+
+    binseg = nk.signal_changepoints(signal, change="meanvar", method="binseg")
+    assert np.min(np.abs(binseg - 700)) <= 5
+    assert np.min(np.abs(binseg - 1500)) <= 5
+
+    # Custom cost function (squared deviations from the segment mean)
+    def cost_mean(x):
+        cumsum = np.concatenate([[0], np.cumsum(x)])
+        cumsum_sq = np.concatenate([[0], np.cumsum(x ** 2)])
+
+        def cost(start, end):
+            n = end - start
+            return (cumsum_sq[end] - cumsum_sq[start]) - (cumsum[end] - cumsum[start]) ** 2 / n
+
+        return cost
+
+    custom = nk.signal_changepoints(signal[0:1500], change=cost_mean, penalty=100)
+    assert np.min(np.abs(custom - 700)) <= 5
+
+    with pytest.raises(ValueError, match="NeuroKit error: signal_changepoints"):
+        nk.signal_changepoints(signal, method="foo")
+
+
+def test_signal_decompose_ssa():
+    rng = np.random.RandomState(0)
+    signal = nk.signal_simulate(duration=10, sampling_rate=100, frequency=[1, 3]) + rng.normal(0, 0.1, 1000)
+
+    # The components sum to the signal
+    components = nk.signal_decompose(signal, method="ssa", n_components=20)
+    assert components.shape == (20, 1000)
+    assert np.allclose(components.sum(axis=0), signal)
+
+    # The leading components are the same with a truncated decomposition
+    full = nk.signal_decompose(signal, method="ssa", n_components=100)
+    leading = nk.signal_decompose(signal, method="ssa", n_components=4, window=100)
+    assert np.allclose(full[:4], leading)
+
+    with pytest.raises(ValueError):
+        nk.signal_decompose(signal, method="ssa", n_components=4, window=4)
+
+
+def test_signal_recompose():
+    from neurokit2.signal.signal_recompose import _signal_recompose_get_wcorr, _signal_recompose_meanfreq
+
+    rng = np.random.RandomState(0)
+    signal = nk.signal_simulate(duration=10, sampling_rate=100, frequency=[1, 3]) + rng.normal(0, 0.1, 1000)
+    components = nk.signal_decompose(signal, method="ssa", n_components=20)
+
+    # The w-correlation matrix is symmetric, with a unit diagonal
+    wcorr = _signal_recompose_get_wcorr(components)
+    assert wcorr.shape == (20, 20)
+    assert np.allclose(wcorr, wcorr.T)
+    assert np.allclose(np.diag(wcorr), 1)
+    assert np.all(wcorr <= 1 + 1e-10)
+
+    recomposed = nk.signal_recompose(components, threshold=0.5)
+    assert recomposed.shape[1] == 1000
+    assert np.allclose(recomposed.sum(axis=0), signal)
+
+    # Leading components of a decomposition with a longer window
+    full = nk.signal_decompose(signal, method="ssa", n_components=100)
+    leading = nk.signal_decompose(signal, method="ssa", n_components=4, window=100)
+    wcorr = _signal_recompose_get_wcorr(leading, window=100)
+    assert np.allclose(wcorr, _signal_recompose_get_wcorr(full)[:4, :4])
+    with pytest.raises(ValueError):
+        _signal_recompose_get_wcorr(leading, window=2)
+
+    # Mean frequency of pure sinusoids
+    sines = np.array([nk.signal_simulate(duration=10, sampling_rate=100, frequency=f) for f in [2, 5]])
+    freqs = _signal_recompose_meanfreq(sines, sampling_rate=100)
+    assert np.allclose(freqs, [2, 5])
@@ -4,7 +4,7 @@ import numpy as np
 import numpy.random
 import pytest
 
-from neurokit2.signal.signal_fixpeaks import _correct_artifacts, _find_artifacts, signal_fixpeaks
+from neurokit2.signal.signal_fixpeaks import _correct_artifacts, _find_artifacts, _update_indices, signal_fixpeaks
 
 
 def compute_rmssd(peaks):
@@ -147,6 +147,14 @@ def test_extra_correction(peaks_extra, artifacts_extra):
     assert np.unique(peaks_corrected).size == (peaks_extra.size - len(artifacts_extra["extra"]))
 
 
+def test_update_indices():
+
+    # Indices are shifted by the number of deleted (or inserted) beats that precede them
+    assert _update_indices([3, 5], [1, 4, 6, 9], -1) == [1, 3, 4, 7]
+    assert _update_indices([3, 4, 6], [2, 5, 8], 1) == [2, 7, 11]
+    assert _update_indices([3], [], 1) == []
+
+
 def idfn(val):
     if isinstance(val, bool):
         return f"iterative_{val}"
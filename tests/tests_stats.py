@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+import pytest
 
 import neurokit2 as nk
 
@@ -28,3 +29,29 @@ def test_fit_loess():
     signal = np.cos(np.linspace(start=0, stop=10, num=1000))
     fit = nk.fit_loess(signal, alpha=0.75)
     assert np.allclose(np.mean(signal - fit), -0.0201905899, atol=0.0001)
+
+    # Unsorted X gives the same fit as sorted X
+    order = np.random.RandomState(3).permutation(1000)
+    X = np.linspace(0, 100, 1000)
+    fit_unsorted = nk.fit_loess(signal[order], X=X[order], alpha=0.75)
+    assert np.allclose(fit_unsorted, fit[order])
+
+    # Fit computed on a grid and interpolated
+    fit_fast = nk.fit_loess(signal, alpha=0.75, delta="auto")
+    assert np.max(np.abs(fit_fast - fit)) < 0.01
+
+    with pytest.raises(ValueError, match="NeuroKit error: fit_loess"):
+        nk.fit_loess(signal, alpha=0.75, delta="atuo")
+
+
+def test_fit_error():
+
+    rng = np.random.RandomState(0)
+    y = rng.normal(size=(4, 50))
+    y_predicted = y + rng.normal(scale=0.1, size=(4, 50))
+    y[2] = y_predicted[2] = 1  # Constant signal
+
+    # Errors of several signals at once (along the last axis)
+    r2 = nk.fit_r2(y, y_predicted, adjusted=False, n_parameters=3)
+    assert np.array_equal(r2, [nk.fit_r2(y[i], y_predicted[i], adjusted=False, n_parameters=3) for i in range(4)])
+    assert np.allclose(nk.fit_rmse(y, y_predicted), [nk.fit_rmse(y[i], y_predicted[i]) for i in range(4)])